@@ -0,0 +1,290 @@
+"""
+Persistent index of the contents of the files of one or more folders, so that
+the duplicates of a file can be found without reading the folders again.
+
+The index is an SQLite database that keeps, for every regular file, its size,
+modification time and inode, together with a sample hash and a full hash of
+its contents. Duplicates are found in stages, each one reading more of the
+files but only for the candidates left by the previous one:
+1. the files with the same size are selected
+2. of them, the ones with the same sample hash (of SAMPLE_SIZE bytes at the
+   head, the middle and the tail of the file)
+3. of them, the ones with the same full hash (BLAKE2b of the whole file)
+
+The hashes are computed lazily and kept until the size, modification time or
+inode of the file change. Files of up to 3 * SAMPLE_SIZE bytes are read
+completely for their sample hash, which is then also their full hash.
+"""
+import hashlib
+import logging
+import os
+import sqlite3
+import stat
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, Optional
+
+CHUNK_SIZE = 1024 * 1024
+SAMPLE_SIZE = 64 * 1024
+
+# bumped whenever the meaning of the columns changes, to rebuild old indexes
+_SCHEMA_VERSION = 2
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    folder TEXT NOT NULL,
+    name TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    sample_hash TEXT,
+    full_hash TEXT,
+    PRIMARY KEY (folder, name)
+);
+CREATE INDEX IF NOT EXISTS files_by_size ON files (folder, size);
+"""
+
+
+def sample_hash(file_path: Path | str) -> str:
+    """Returns the BLAKE2b hash of SAMPLE_SIZE bytes at the head, the middle
+    and the tail of the given file, or of the whole file if it is not larger
+    than the three samples, in which case it equals its full_hash.
+
+    Args:
+        file_path (Path | str): the path of the file
+
+    Returns:
+        str: the sample hash of the file
+    """
+    with open(file_path, "rb") as f:  # pylint: disable=invalid-name
+        size = os.fstat(f.fileno()).st_size
+        if size <= 3 * SAMPLE_SIZE:
+            return hashlib.blake2b(f.read()).hexdigest()
+        sample = hashlib.blake2b()
+        for offset in (0, (size - SAMPLE_SIZE) // 2, size - SAMPLE_SIZE):
+            f.seek(offset)
+            sample.update(f.read(SAMPLE_SIZE))
+    return sample.hexdigest()
+
+
+def full_hash(file_path: Path | str) -> str:
+    """Returns the BLAKE2b hash of the given file, reading it in chunks so
+    that large files are never loaded in memory.
+
+    Args:
+        file_path (Path | str): the path of the file
+
+    Returns:
+        str: the hash of the whole file
+    """
+    digest = hashlib.blake2b()
+    with open(file_path, "rb") as f:  # pylint: disable=invalid-name
+        while chunk := f.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _file_stat(file_path: Path) -> Optional[os.stat_result]:
+    """Returns the stat of a regular file, or None for directories, symbolic
+    links and files that no longer exist."""
+    try:
+        file_stat = file_path.lstat()
+    except FileNotFoundError:
+        return None
+    return file_stat if stat.S_ISREG(file_stat.st_mode) else None
+
+
+class ContentIndex:
+    """An SQLite backed index of the contents of the files of some folders.
+
+    Args:
+        db_path (Path | str): the SQLite database file, which is created if it
+            doesn't exist.
+        workers (int, optional): the number of processes used to hash files.
+            Defaults to None, meaning one per CPU.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(
+        self, db_path: Path | str, *, workers: Optional[int] = None
+    ) -> None:
+        self.db_path = Path(db_path)
+        self.workers = workers
+        self.connection = sqlite3.connect(self.db_path)
+        (version,) = self.connection.execute("PRAGMA user_version").fetchone()
+        if version != _SCHEMA_VERSION:
+            self.connection.execute("DROP TABLE IF EXISTS files")
+            self.connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        self.connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Commits the pending changes and closes the database."""
+        self.connection.commit()
+        self.connection.close()
+
+    def __enter__(self) -> "ContentIndex":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    @staticmethod
+    def _folder_key(folder: Path) -> str:
+        return str(Path(folder).resolve())
+
+    def update(self, folder: Path, filenames: Iterable[str]) -> None:
+        """Brings the index of the given folder up to date with the given files
+        of the folder: new files are added, files whose size, modification
+        time or inode changed lose their hashes, and files that are no longer
+        there (or are not regular files) are removed.
+
+        Args:
+            folder (Path): the folder that contains the files
+            filenames (Iterable[str]): the names of the files of the folder
+        """
+        key = self._folder_key(folder)
+        indexed = {
+            name: (size, mtime_ns, inode)
+            for name, size, mtime_ns, inode in self.connection.execute(
+                "SELECT name, size, mtime_ns, inode FROM files "
+                "WHERE folder = ?",
+                (key,),
+            )
+        }
+        changed = []
+        for filename in filenames:
+            file_stat = _file_stat(Path(folder) / filename)
+            if file_stat is None:
+                continue
+            metadata = (
+                file_stat.st_size,
+                file_stat.st_mtime_ns,
+                file_stat.st_ino,
+            )
+            if indexed.pop(filename, None) != metadata:
+                changed.append((key, filename, *metadata))
+
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO files "
+                "(folder, name, size, mtime_ns, inode) VALUES (?, ?, ?, ?, ?)",
+                changed,
+            )
+            self.connection.executemany(
+                "DELETE FROM files WHERE folder = ? AND name = ?",
+                [(key, name) for name in indexed],
+            )
+        self.logger.info(
+            "index of %s updated: %d new or changed files, %d removed",
+            folder,
+            len(changed),
+            len(indexed),
+        )
+
+    def _hash_in_parallel(self, hash_fn, paths: list[Path]) -> list[str]:
+        if len(paths) == 1:
+            return [hash_fn(paths[0])]
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            return list(pool.map(hash_fn, paths, chunksize=16))
+
+    def hash_samples(self, folder: Path, sizes: Iterable[int]) -> None:
+        """Computes (in parallel) the missing sample hashes of the files of the
+        folder with any of the given sizes.
+
+        Args:
+            folder (Path): the folder that contains the files
+            sizes (Iterable[int]): the sizes of the files to hash
+        """
+        key = self._folder_key(folder)
+        sizes = list(set(sizes))
+        names = []
+        # chunked to stay below the limit of parameters of an SQLite query
+        for start in range(0, len(sizes), 500):
+            batch = sizes[start : start + 500]
+            names.extend(
+                name
+                for (name,) in self.connection.execute(
+                    "SELECT name FROM files WHERE folder = ? AND "
+                    "sample_hash IS NULL AND size IN "
+                    f"({', '.join('?' * len(batch))})",
+                    (key, *batch),
+                )
+            )
+        if not names:
+            return
+
+        self.logger.info(
+            "hashing samples of %d files of %s", len(names), folder
+        )
+        hashes = self._hash_in_parallel(
+            sample_hash, [Path(folder) / name for name in names]
+        )
+        with self.connection:
+            self.connection.executemany(
+                "UPDATE files SET sample_hash = ?, "
+                "full_hash = CASE WHEN size <= ? THEN ? END "
+                "WHERE folder = ? AND name = ?",
+                [
+                    (sample, 3 * SAMPLE_SIZE, sample, key, name)
+                    for name, sample in zip(names, hashes)
+                ],
+            )
+
+    def _hash_full(self, folder: Path, names: list[str]) -> None:
+        """Computes (in parallel) the full hashes of the given files."""
+        self.logger.info("hashing %d files of %s", len(names), folder)
+        hashes = self._hash_in_parallel(
+            full_hash, [Path(folder) / name for name in names]
+        )
+        key = self._folder_key(folder)
+        with self.connection:
+            self.connection.executemany(
+                "UPDATE files SET full_hash = ? WHERE folder = ? AND name = ?",
+                [(full, key, name) for name, full in zip(names, hashes)],
+            )
+
+    def duplicates_of(self, file_path: Path, folder: Path) -> list[Path]:
+        """Returns the files of the folder with the same size, sample hash and
+        full hash as the given file. Each stage only hashes the files (and the
+        given file) if the previous one found candidates.
+
+        Args:
+            file_path (Path): the file whose duplicates are wanted
+            folder (Path): the (indexed) folder where duplicates are searched
+
+        Returns:
+            list[Path]: the paths of the files with the same contents.
+        """
+        key = self._folder_key(folder)
+        size = file_path.stat().st_size
+        self.hash_samples(folder, [size])
+        by_sample = self.connection.execute(
+            "SELECT name, sample_hash, full_hash FROM files "
+            "WHERE folder = ? AND size = ?",
+            (key, size),
+        ).fetchall()
+        if not by_sample:
+            return []
+
+        file_sample = sample_hash(file_path)
+        candidates = [row for row in by_sample if row[1] == file_sample]
+        if not candidates:
+            return []
+
+        if size <= 3 * SAMPLE_SIZE:
+            file_full = file_sample
+        else:
+            file_full = full_hash(file_path)
+            missing = [name for name, _, full in candidates if full is None]
+            if missing:
+                self._hash_full(folder, missing)
+                candidates = self.connection.execute(
+                    "SELECT name, sample_hash, full_hash FROM files "
+                    "WHERE folder = ? AND size = ? AND sample_hash = ?",
+                    (key, size, file_sample),
+                ).fetchall()
+        return [
+            Path(folder) / name
+            for name, _, full in candidates
+            if full == file_full
+        ]
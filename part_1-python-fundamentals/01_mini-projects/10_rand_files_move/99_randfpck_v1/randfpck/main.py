@@ -6,12 +6,18 @@ directory (used) so that they're no longer considered in future picks.
 import argparse
 import filecmp
 import glob
-import hashlib
 import logging
 import shutil
 from pathlib import Path
 from random import choice
-from typing import Optional, Sequence
+from typing import Iterator, Optional, Sequence
+
+from randfpck.content_index import (
+    SAMPLE_SIZE,
+    ContentIndex,
+    full_hash,
+    sample_hash,
+)
 
 
 def setup_logger() -> logging.Logger:
@@ -64,7 +70,8 @@ def setup_arg_parser() -> argparse.ArgumentParser:
     + a required argument for the destination folder (`-d`/`--dst`)
     + a required argument for the globbing patterns (`-g`/`--glob`)
     + a required argument for the total number of files (`-n`/`--num-files`)
-
+    + an optional argument for the content index file (`-i`/`--index`)
+    + an optional flag to compare duplicates byte by byte (`--byte-compare`)
 
     Returns:
         argparse.ArgumentParser: a completely configured parser ready to use by
@@ -118,6 +125,27 @@ def setup_arg_parser() -> argparse.ArgumentParser:
         help="Number of files to be picked up",
     )
 
+    parser.add_argument(
+        "-i",
+        "--index",
+        dest="index_file",
+        metavar="{index file}",
+        required=False,
+        help=(
+            "SQLite file where the contents of the destination and used "
+            "folders are indexed between runs"
+        ),
+    )
+
+    parser.add_argument(
+        "--byte-compare",
+        action="store_true",
+        help=(
+            "Compare the files with the same hash byte by byte before "
+            "discarding them as duplicates"
+        ),
+    )
+
     return parser
 
 
@@ -150,6 +178,13 @@ class UserOptions:
                 "used folder was not specified: used=%s", self.used_folder
             )
         self.num_files = cli_args.num_files
+        # the index is optional in the arguments built by hand (e.g. in tests)
+        index_file = getattr(cli_args, "index_file", None)
+        if index_file is not None:
+            self.index_file = Path(index_file)
+        else:
+            self.index_file = self.used_folder / ".randfpck_index.sqlite3"
+        self.byte_compare = getattr(cli_args, "byte_compare", False)
 
     def validate(self):
         """Checks that the corresponding folders exist and that
@@ -268,20 +303,6 @@ class FolderFiles:
 
     logger = logging.getLogger(__name__)
 
-    @staticmethod
-    def get_file_md5(file) -> str:
-        """Returns the MD5 hash for a given file
-
-        Args:
-            file: file descriptor or path
-
-        Returns:
-            the MD5 hash of the file as a string
-        """
-        with open(file, "rb") as f:  # pylint: disable=invalid-name
-            file_md5 = hashlib.md5(f.read()).hexdigest()
-        return file_md5
-
     def __init__(
         self,
         folder: Path | str,
@@ -407,49 +428,85 @@ class ActivityTracker:
         return src_folder_exhausted or requested_files_picked
 
 
-def is_duplicate(file_path: Path, folder: FolderFiles) -> bool:
+def _duplicates_by_hash(file_path: Path, folder: FolderFiles) -> Iterator[Path]:
+    """Yields the files of the given FolderFiles object with the same size,
+    sample hash and full hash as the given file, computing each hash of the
+    given file only once and only if the previous stage found candidates.
+    """
+    file_size = file_path.stat().st_size
+    if file_size not in folder.file_sizes:
+        return
+    logger.warning(
+        "found a hit for file %s (size %d) in folder %s: will compare samples",
+        file_path,
+        file_size,
+        folder.folder,
+    )
+    file_sample = sample_hash(file_path)
+    file_full = None
+    for f in folder.file_sizes[file_size]:
+        f_path = file_path_for_filename(folder.folder, f)
+        if sample_hash(f_path) != file_sample:
+            continue
+        # small files are read completely for their sample hash
+        if file_size <= 3 * SAMPLE_SIZE:
+            yield f_path
+            continue
+        logger.warning(
+            "found a hit for file %s (sample %s) in folder %s: will hash it",
+            file_path,
+            file_sample,
+            folder.folder,
+        )
+        if file_full is None:
+            file_full = full_hash(file_path)
+        if full_hash(f_path) == file_full:
+            yield f_path
+
+
+def is_duplicate(
+    file_path: Path,
+    folder: FolderFiles,
+    index: Optional[ContentIndex] = None,
+    *,
+    byte_compare: bool = False,
+) -> bool:
     """Checks whether the file identified by the given file path is a duplicate
     of an existing file of the given FolderFiles object.
     The strategy for checking the duplicates is multi-layered, where the more
     lightweight approach is executed first to be able to fail as early as
-    possible: first, the size of the files are considered, then the MD5 hash of
-    the file and finally a binary comparison is executed.
+    possible: first, the size of the files are considered, then the hash of a
+    few samples of the files and finally the BLAKE2b hash of the whole files.
+    A binary comparison is only executed when byte_compare is True.
+    When a ContentIndex is given, the sizes and hashes of the files of the
+    folder are looked up in the index instead of being computed again.
 
     Args:
         file_path (Path): the path to the file to whose potential duplicates are
             to be found.
         folder (FolderFiles): the container of files that will be matched
             against the given file.
+        index (ContentIndex, optional): an index of the folder, up to date with
+            its files. Defaults to None, meaning no index is used.
+        byte_compare (bool, optional): whether files with the same hash must
+            also be compared byte by byte. Defaults to False.
 
     Returns:
         bool: True if a duplicate is found, False otherwise.
     """
-    file_size = file_path.stat().st_size
-    if file_size in folder.file_sizes:
-        logger.warning(
-            "found a hit for file %s (size %d) in folder %s: will compute MD5",
-            file_path,
-            file_size,
-            folder.folder,
-        )
-        file_md5 = FolderFiles.get_file_md5(file_path)
-        for f in folder.file_sizes[file_size]:
-            f_path = file_path_for_filename(folder.folder, f)
-            f_md5 = FolderFiles.get_file_md5(f_path)
-            if file_md5 == f_md5:
-                logger.warning(
-                    (
-                        "found a hit for file %s (hash %s) in folder %s: "
-                        "will compare files"
-                    ),
-                    file_path,
-                    file_md5,
-                    folder.folder,
-                )  # pylint: disable=line-too-long
-                is_identical = filecmp.cmp(file_path, f_path, shallow=False)
-                if is_identical:
-                    logger.warning("%s and %s are identical", file_path, f_path)
-                    return True
+    if index is not None:
+        duplicates = index.duplicates_of(file_path, folder.folder)
+    else:
+        duplicates = _duplicates_by_hash(file_path, folder)
+
+    for f_path in duplicates:
+        if byte_compare and not filecmp.cmp(file_path, f_path, shallow=False):
+            logger.warning(
+                "%s and %s have the same hash but differ", file_path, f_path
+            )
+            continue
+        logger.warning("%s and %s are identical", file_path, f_path)
+        return True
 
     logger.debug(
         "No duplicates found for file %s on %s", file_path, folder.folder
@@ -544,12 +601,24 @@ if __name__ == "__main__":
     )
     logger.debug("src files scanned: %s", src_folder)
 
-    dst_folder = FolderFiles(user_options.dst_folder, build_metadata=True)
+    dst_folder = FolderFiles(user_options.dst_folder)
     logger.debug("dst files scanned: %s", dst_folder)
 
-    used_folder = FolderFiles(user_options.used_folder, build_metadata=True)
+    used_folder = FolderFiles(user_options.used_folder)
     logger.debug("used files scanned: %s", used_folder)
 
+    # the sizes and hashes of the dst and used files are kept in the index, so
+    # only the files added or changed since the last run are hashed, and the
+    # samples of all of them at once, in parallel, before the files are picked
+    content_index = ContentIndex(user_options.index_file)
+    src_sizes = {
+        get_file_size(Path(user_options.src_folder) / filename)
+        for filename in src_folder.files
+    }
+    for folder_files in (dst_folder, used_folder):
+        content_index.update(folder_files.folder, folder_files.files)
+        content_index.hash_samples(folder_files.folder, src_sizes - {None})
+
     activity_tracker = ActivityTracker(user_options.num_files, src_folder)
     logger.debug("initializing process: %s", activity_tracker)
 
@@ -563,7 +632,12 @@ if __name__ == "__main__":
             selected_file_path,
             user_options.dst_folder,
         )  # pylint: disable=line-too-long
-        if is_duplicate(selected_file_path, dst_folder):
+        if is_duplicate(
+            selected_file_path,
+            dst_folder,
+            content_index,
+            byte_compare=user_options.byte_compare,
+        ):
             activity_tracker.files_discarded.append(selected_file_path)
             continue
 
@@ -572,7 +646,12 @@ if __name__ == "__main__":
             selected_file_path,
             user_options.used_folder,
         )  # pylint: disable=line-too-long
-        if is_duplicate(selected_file_path, used_folder):
+        if is_duplicate(
+            selected_file_path,
+            used_folder,
+            content_index,
+            byte_compare=user_options.byte_compare,
+        ):
             activity_tracker.files_discarded.append(selected_file_path)
             continue
 
@@ -604,5 +683,6 @@ if __name__ == "__main__":
 
         activity_tracker.files_picked.append(selected_file_path)
 
+    content_index.close()
     print_report(activity_tracker)
     logger.info("Process completed")
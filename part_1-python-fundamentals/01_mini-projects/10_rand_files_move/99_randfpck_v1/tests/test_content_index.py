@@ -0,0 +1,142 @@
+"""ContentIndex class tests"""
+import hashlib
+import os
+import tempfile
+import unittest
+from collections import namedtuple
+from pathlib import Path
+from unittest.mock import patch
+
+from randfpck.content_index import (
+    SAMPLE_SIZE,
+    ContentIndex,
+    full_hash,
+    sample_hash,
+)
+
+
+class TestContentIndex(unittest.TestCase):
+    """Test the ContentIndex class features"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.folder = Path(self.tmp_dir.name) / "folder"
+        self.folder.mkdir()
+        self.db_path = Path(self.tmp_dir.name) / "index.sqlite3"
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write(self, name, content):
+        """Writes a file in the temporary folder and returns its path"""
+        file_path = Path(self.tmp_dir.name) / name
+        file_path.write_bytes(content)
+        return file_path
+
+    def test_hashes(self):
+        """sample_hash hashes the head, middle and tail of large files, and
+        the whole file otherwise, as full_hash does"""
+        content = os.urandom(SAMPLE_SIZE * 5 + 5)
+        file_path = self.write("file.bin", content)
+        middle = (len(content) - SAMPLE_SIZE) // 2
+        samples = (
+            content[:SAMPLE_SIZE]
+            + content[middle : middle + SAMPLE_SIZE]
+            + content[-SAMPLE_SIZE:]
+        )
+        SubTest = namedtuple("SubTest", ["got", "expected"])
+        subtests = {
+            "sample of large file": SubTest(
+                got=sample_hash(file_path),
+                expected=hashlib.blake2b(samples).hexdigest(),
+            ),
+            "full hash": SubTest(
+                got=full_hash(file_path),
+                expected=hashlib.blake2b(content).hexdigest(),
+            ),
+            "sample of small file": SubTest(
+                got=sample_hash(self.write("small.bin", content[:100])),
+                expected=full_hash(self.write("small.bin", content[:100])),
+            ),
+        }
+        for name, data in subtests.items():
+            self.assertEqual(
+                data.got,
+                data.expected,
+                f"{name}: expected {data.expected} but got {data.got}",
+            )
+
+    def test_staged_hashing(self):
+        """Large files are only hashed completely when their samples match"""
+        content = os.urandom(SAMPLE_SIZE * 5)
+        changed_middle = bytearray(content)
+        changed_middle[SAMPLE_SIZE * 2 + 100] ^= 1
+        changed_elsewhere = bytearray(content)
+        changed_elsewhere[SAMPLE_SIZE + 100] ^= 1
+        self.write("folder/middle.bin", bytes(changed_middle))
+        self.write("folder/elsewhere.bin", bytes(changed_elsewhere))
+        self.write("folder/same.bin", content)
+        candidate = self.write("candidate.bin", content)
+
+        with ContentIndex(self.db_path) as index:
+            index.update(self.folder, os.listdir(self.folder))
+            got = index.duplicates_of(candidate, self.folder)
+            expected = [self.folder / "same.bin"]
+            self.assertListEqual(got, expected, f"expected {expected}, {got}")
+            hashed = sorted(
+                name
+                for (name,) in index.connection.execute(
+                    "SELECT name FROM files WHERE full_hash IS NOT NULL"
+                )
+            )
+            # the sample of middle.bin differs, so it's never read completely
+            self.assertListEqual(hashed, ["elsewhere.bin", "same.bin"])
+
+    def test_duplicates_of(self):
+        """duplicates_of only returns the files with the same contents"""
+        self.write("folder/same.txt", b"abc")
+        self.write("folder/other.txt", b"xyz")
+        self.write("folder/longer.txt", b"abcd")
+        candidate = self.write("candidate.txt", b"abc")
+
+        with ContentIndex(self.db_path, workers=2) as index:
+            index.update(self.folder, os.listdir(self.folder))
+            got = index.duplicates_of(candidate, self.folder)
+            expected = [self.folder / "same.txt"]
+            self.assertListEqual(got, expected, f"expected {expected}, {got}")
+
+            unique = self.write("unique.txt", b"abcdef")
+            got = index.duplicates_of(unique, self.folder)
+            self.assertListEqual(got, [], f"expected no duplicates got {got}")
+
+    def test_update_is_incremental(self):
+        """Only new and changed files are hashed again after an update"""
+        self.write("folder/a.txt", b"abc")
+        self.write("folder/b.txt", b"xyz")
+        candidate = self.write("candidate.txt", b"abc")
+
+        with ContentIndex(self.db_path) as index:
+            index.update(self.folder, os.listdir(self.folder))
+            index.hash_samples(self.folder, [3])
+
+        # the contents of b.txt change, and a.txt is removed
+        self.write("folder/b.txt", b"abc")
+        os.utime(self.folder / "b.txt", ns=(0, 10**9))
+        (self.folder / "a.txt").unlink()
+
+        with (
+            ContentIndex(self.db_path) as index,
+            patch(
+                "randfpck.content_index.sample_hash", side_effect=sample_hash
+            ) as mock_sample_hash,
+        ):
+            index.update(self.folder, os.listdir(self.folder))
+            got = index.duplicates_of(candidate, self.folder)
+            expected = [self.folder / "b.txt"]
+            self.assertListEqual(got, expected, f"expected {expected}, {got}")
+            hashed = [call.args[0] for call in mock_sample_hash.call_args_list]
+            self.assertListEqual(hashed, [self.folder / "b.txt", candidate])
+
+
+if __name__ == "__main__":
+    unittest.main()
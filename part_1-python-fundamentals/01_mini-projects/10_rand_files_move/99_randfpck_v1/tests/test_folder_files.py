@@ -2,7 +2,7 @@
 import unittest
 from collections import namedtuple
 from pathlib import Path
-from unittest.mock import mock_open, patch
+from unittest.mock import patch
 
 from randfpck.main import FolderFiles
 
@@ -10,21 +10,6 @@ from randfpck.main import FolderFiles
 class TestFolderFiles(unittest.TestCase):
     """Test the FolderFiles class features"""
 
-    @patch("builtins.open", new_callable=mock_open, read_data=b"Hello, world!")
-    def test_get_file_md5(self, mocked_open):
-        """Checks that the md5 file returns the corresponding hash for a file"""
-        got = FolderFiles.get_file_md5("path/to/file")
-        expected = "6cd3556deb0da54bca060b4c39479839"
-        self.assertEqual(got, expected, f"got {got} but expected {expected}")
-        self.assertEqual(
-            mocked_open.call_count,
-            1,
-            f"expected open() to be called once, but was called {mocked_open.call_count} times",  # pylint: disable=line-too-long
-        )
-        self.assertTupleEqual(
-            mocked_open.call_args.args, ("path/to/file", "rb")
-        )
-
     def test_folder_files_ctor_folder(self):
         """Tests the folder attribute when using the FolderFiles constructor"""
 
@@ -15,7 +15,15 @@ class TestIsDuplicate(unittest.TestCase):
 
         Subtest = namedtuple(
             "Subtest",
-            ["file_size", "file_md5", "file_content", "file_sizes", "expected"],
+            [
+                "file_size",
+                "file_md5",
+                "file_content",
+                "file_sizes",
+                "expected",
+                "byte_compare",
+            ],
+            defaults=[True],
         )
 
         subtests = {
@@ -47,6 +55,21 @@ class TestIsDuplicate(unittest.TestCase):
                 file_sizes={100: ["some-file-md5_5555-content_xyz.txt"]},
                 expected=False,
             ),
+            "same md5 and failed content with byte comparison": Subtest(
+                file_size=100,
+                file_md5="1234",
+                file_content="abc",
+                file_sizes={100: ["some-file-md5_1234-content_xyz.txt"]},
+                expected=False,
+            ),
+            "same md5 and failed content without byte comparison": Subtest(
+                file_size=100,
+                file_md5="1234",
+                file_content="abc",
+                file_sizes={100: ["some-file-md5_1234-content_xyz.txt"]},
+                expected=True,
+                byte_compare=False,
+            ),
             "single file match": Subtest(
                 file_size=100,
                 file_md5="1234",
@@ -78,10 +101,23 @@ class TestIsDuplicate(unittest.TestCase):
                 },
                 expected=False,
             ),
+            "several files match without byte comparison": Subtest(
+                file_size=100,
+                file_md5="1234",
+                file_content="abc",
+                file_sizes={
+                    100: [
+                        "another-file-md5_555-content_xyz.md",
+                        "some-file-md5_1234-content_abc.txt",
+                    ]
+                },
+                expected=True,
+                byte_compare=False,
+            ),
         }
 
-        def get_file_md5_side_fx(mock_file_path):
-            """Mocks the get_file_md5 behavior"""
+        def hash_side_fx(mock_file_path):
+            """Mocks the sample_hash and full_hash behavior"""
             return mock_file_path.md5
 
         def file_path_for_filename_fx(_, file):
@@ -111,10 +147,8 @@ class TestIsDuplicate(unittest.TestCase):
                     "randfpck.main.file_path_for_filename",
                     side_effect=file_path_for_filename_fx,
                 ),
-                patch(
-                    "randfpck.main.FolderFiles.get_file_md5",
-                    side_effect=get_file_md5_side_fx,
-                ),
+                patch("randfpck.main.sample_hash", side_effect=hash_side_fx),
+                patch("randfpck.main.full_hash", side_effect=hash_side_fx),
                 patch("randfpck.main.filecmp.cmp", side_effect=cmp_side_fx),
             ):
                 mock_file_path = MagicMock()
@@ -124,7 +158,11 @@ class TestIsDuplicate(unittest.TestCase):
                 mock_folder_files = MagicMock()
                 mock_folder_files.file_sizes = data.file_sizes
 
-                got = is_duplicate(mock_file_path, mock_folder_files)
+                got = is_duplicate(
+                    mock_file_path,
+                    mock_folder_files,
+                    byte_compare=data.byte_compare,
+                )
                 self.assertEqual(
                     got,
                     data.expected,
@@ -0,0 +1,55 @@
+"""
+Benchmark comparing the tuple based vec2d.math functions against their batched
+NumPy counterparts in vec2d.math.batch for 10^3 to 10^7 vectors.
+
+Usage: python benchmark_math.py [--max-exp 7]
+"""
+import argparse
+import random
+from timeit import default_timer as timer
+
+from vec2d.math import batch
+from vec2d.math.vector2d_math import add, length, scale, subtract
+
+
+def time_it(fn, *args) -> float:
+    """Returns the wall time (in seconds) it takes to run fn(*args)."""
+    start = timer()
+    fn(*args)
+    return timer() - start
+
+
+def tuple_ops(vs, ws):
+    """Runs add, subtract, scale and length one tuple at a time."""
+    sums = [add(v, w) for v, w in zip(vs, ws)]
+    diffs = [subtract(v, w) for v, w in zip(vs, ws)]
+    scaled = [scale(2.5, v) for v in sums]
+    lengths = [length(v) for v in diffs]
+    return scaled, lengths
+
+
+def batch_ops(vs, ws):
+    """Runs add, subtract, scale and length on the whole batch."""
+    scaled = batch.scale(2.5, batch.add(vs, ws))
+    lengths = batch.length(batch.subtract(vs, ws))
+    return scaled, lengths
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--max-exp", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'N':>10} {'tuples (s)':>12} {'batch (s)':>12} {'speedup':>9}")
+    for exp in range(3, args.max_exp + 1):
+        n = 10**exp
+        vs = [(random.uniform(-10, 10), random.uniform(-10, 10)) for _ in range(n)]
+        ws = [(random.uniform(-10, 10), random.uniform(-10, 10)) for _ in range(n)]
+        vs_arr, ws_arr = batch.as_vectors(vs), batch.as_vectors(ws)
+
+        tuple_secs = time_it(tuple_ops, vs, ws)
+        batch_secs = time_it(batch_ops, vs_arr, ws_arr)
+        print(
+            f"{n:>10} {tuple_secs:>12.4f} {batch_secs:>12.4f}"
+            f" {tuple_secs / batch_secs:>8.1f}x"
+        )
@@ -0,0 +1,113 @@
+"""Unit tests comparing vec2d.math.batch against vec2d.math"""
+import unittest
+from math import pi
+
+import numpy as np
+
+from vec2d.math import batch, vector2d_math
+
+VS = [(1, 2), (-3, 0.5), (0, -4), (2.5, 2.5)]
+WS = [(0, 1), (2, -2), (-1.5, 3), (4, 0)]
+
+
+class BatchTest(unittest.TestCase):
+    """
+    vec2d.math.batch test class
+    """
+
+    def assertVectorsAlmostEqual(self, got, expected):
+        """Compares a tuple or a list of tuples element-wise"""
+        self.assertTrue(np.allclose(got, expected), f"{got} != {expected}")
+
+    def test_single_vectors(self):
+        """
+        Validates that single tuples give the same tuples or floats as the
+        vector2d_math functions
+        """
+        v, w = VS[1], WS[1]
+        for name in ("add", "subtract", "displacement"):
+            got = getattr(batch, name)(v, w)
+            self.assertIsInstance(got, tuple)
+            self.assertVectorsAlmostEqual(
+                got, getattr(vector2d_math, name)(v, w)
+            )
+        self.assertVectorsAlmostEqual(
+            batch.add_mult(v, w, v), vector2d_math.add_mult(v, w, v)
+        )
+        self.assertVectorsAlmostEqual(
+            batch.opposite(v), vector2d_math.opposite(v)
+        )
+        self.assertVectorsAlmostEqual(
+            batch.scalar_product(v, 3), vector2d_math.scalar_product(v, 3)
+        )
+        self.assertAlmostEqual(batch.length(v), vector2d_math.length(v))
+        self.assertAlmostEqual(
+            batch.distance(v, w), vector2d_math.distance(v, w)
+        )
+        self.assertVectorsAlmostEqual(
+            batch.to_polar(v, positive_angle=True),
+            vector2d_math.to_polar(v, positive_angle=True),
+        )
+        self.assertVectorsAlmostEqual(
+            batch.to_cartesian((2, pi / 3)),
+            vector2d_math.to_cartesian((2, pi / 3)),
+        )
+
+    def test_lists_of_vectors(self):
+        """
+        Validates that translate, rotate and rescale return a list of tuples
+        for a list of tuples, as vector2d_math does, and arrays for arrays
+        """
+        subtests = {
+            "translate": ((1, -2), VS),
+            "rotate": (pi / 5, VS),
+            "rescale": (1.5, VS),
+        }
+        for name, args in subtests.items():
+            expected = getattr(vector2d_math, name)(*args)
+            got = getattr(batch, name)(*args)
+            self.assertIsInstance(got, list, name)
+            self.assertTrue(all(isinstance(v, tuple) for v in got), name)
+            self.assertVectorsAlmostEqual(got, expected)
+
+            first, vectors = args
+            got = getattr(batch, name)(first, batch.as_vectors(vectors))
+            self.assertIsInstance(got, np.ndarray, name)
+            self.assertVectorsAlmostEqual(got, expected)
+
+            with self.assertRaises(ValueError):
+                getattr(batch, name)(first, [])
+
+        self.assertAlmostEqual(
+            batch.perimeter(VS), vector2d_math.perimeter(VS)
+        )
+
+    def test_batches(self):
+        """
+        Validates that batches give the same results as applying the
+        vector2d_math functions to each pair of vectors
+        """
+        vs, ws = batch.as_vectors(VS), batch.as_vectors(WS)
+        self.assertVectorsAlmostEqual(
+            batch.add(vs, ws),
+            [vector2d_math.add(v, w) for v, w in zip(VS, WS)],
+        )
+        self.assertVectorsAlmostEqual(
+            batch.add(vs, (1, 1)),
+            [vector2d_math.add(v, (1, 1)) for v in VS],
+        )
+        self.assertVectorsAlmostEqual(
+            batch.length(vs), [vector2d_math.length(v) for v in VS]
+        )
+        self.assertVectorsAlmostEqual(
+            batch.scale(np.arange(4), vs),
+            [vector2d_math.scale(s, v) for s, v in zip(range(4), VS)],
+        )
+        self.assertVectorsAlmostEqual(
+            batch.dot(vs, ws),
+            [v[0] * w[0] + v[1] * w[1] for v, w in zip(VS, WS)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""Unit tests for the batched rendering of vec2d.graph"""
+import unittest
+from unittest.mock import patch
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+from matplotlib.collections import (  # noqa: E402
+    LineCollection,
+    PatchCollection,
+    PathCollection,
+)
+
+from vec2d.graph.vector2d_graphics import (  # noqa: E402
+    Arrow,
+    Colors,
+    Points,
+    Polygon,
+    Segment,
+    draw,
+)
+
+
+class DrawTest(unittest.TestCase):
+    """
+    draw test class
+    """
+
+    def setUp(self):
+        plt.figure()
+
+    def tearDown(self):
+        plt.close("all")
+
+    def draw(self, *figures):
+        """Draws the figures without the origin, and returns the artists"""
+        with patch.object(plt, "show"):
+            draw(*figures, origin=False, axes=False, grid=None)
+        return plt.gca().collections
+
+    def test_keeps_the_order_of_the_arguments(self):
+        """
+        Validates that a figure passed after figures of another class is drawn
+        after them, and so over them
+        """
+        artists = self.draw(
+            Points((0, 0), (1, 1)),
+            Polygon((0, 0), (2, 0), (1, 2), color=None, fill=Colors.GREEN),
+            Points((3, 3)),
+            Segment((0, 0), (1, 0)),
+            Arrow((2, 2)),
+        )
+        self.assertEqual(
+            [type(artist) for artist in artists],
+            [
+                PathCollection,
+                PatchCollection,
+                PathCollection,
+                LineCollection,
+                PatchCollection,
+            ],
+        )
+        self.assertTrue(np.allclose(artists[0].get_offsets(), [(0, 0), (1, 1)]))
+        self.assertTrue(np.allclose(artists[2].get_offsets(), [(3, 3)]))
+        self.assertEqual(artists[0].get_zorder(), artists[1].get_zorder())
+
+    def test_batches_consecutive_figures(self):
+        """
+        Validates that consecutive figures of the same class are rendered as a
+        single artist with the color of each of them
+        """
+        artists = self.draw(
+            *(Segment((i, 0), (i, 1)) for i in range(5)),
+            Segment((0, 0), (5, 5), color=Colors.RED),
+            Points((1, 2)),
+            Points((3, 4), color=Colors.RED),
+        )
+        self.assertEqual(len(artists), 2)
+        segments, points = artists
+        self.assertEqual(len(segments.get_segments()), 6)
+        self.assertTrue(
+            np.allclose(segments.get_segments()[5], [(0, 0), (5, 5)])
+        )
+        expected = [Colors.BLUE.value, Colors.RED.value]
+        self.assertTrue(
+            np.allclose(
+                segments.get_colors()[[0, 5]],
+                matplotlib.colors.to_rgba_array(expected),
+            )
+        )
+        self.assertTrue(np.allclose(points.get_offsets(), [(1, 2), (3, 4)]))
+
+    def test_bounds(self):
+        """Validates that the limits of the plot include every figure"""
+        self.draw(Points((-3, 1)), Segment((0, 0), (4, -2)))
+        x_min, x_max = plt.xlim()
+        y_min, y_max = plt.ylim()
+        self.assertTrue(x_min < -3 and x_max > 4 and y_min < -2 and y_max > 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,18 +3,23 @@ A library to draw simple figures such as points, segments, polygons, and arrows
 in the 2D plane using Matplotlib as the backend.
 The library exposes classes for the figures, an enumeration for the common
 colors, and a function draw() to render the figures.
+Consecutive figures of the same class are rendered together as a single
+Matplotlib collection, so drawings with many points or segments render quickly.
 """
 import logging
 from abc import ABC, abstractmethod
 from enum import Enum
-from math import ceil, floor, sqrt
+from itertools import groupby
+from math import ceil, floor
 from typing import Optional, Sequence
 
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.colors import to_rgba, to_rgba_array
 from matplotlib.pyplot import xlim, ylim
+from matplotlib.patches import FancyArrow
 from matplotlib.patches import Polygon as pyplot_poly
-from matplotlib.collections import PatchCollection
+from matplotlib.collections import LineCollection, PatchCollection
 
 logging.basicConfig(
     format="%(asctime)s [%(levelname)8s] (%(name)s) | %(message)s"
@@ -22,7 +27,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
-logger.info("Using vec2d.graph v0.2.0")
+logger.info("Using vec2d.graph v0.3.0")
 
 
 class Colors(Enum):
@@ -64,6 +69,21 @@ class Figure2D(ABC):
         corresponding figure on screen.
         """
 
+    def vectors_array(self) -> np.ndarray:
+        """Returns the vectors (points) that define the figure as a NumPy array
+        of shape (N, 2).
+        """
+        vectors = np.array(list(self.extract_vectors()), dtype=np.float64)
+        return vectors.reshape(-1, 2)
+
+    @classmethod
+    def render_all(cls, figures: Sequence["Figure2D"]) -> None:
+        """Renders all the given figures of this class. Subclasses override it
+        to render them together as a single Matplotlib collection.
+        """
+        for figure in figures:
+            figure.render()
+
     def normalize_color(self, color):
         """Normalize the color with which a Figure2D has been initialized so
         that it matches Matplotlib's native handling of colors. That way, either
@@ -72,6 +92,19 @@ class Figure2D(ABC):
         return color.value if hasattr(color, "value") else color
 
 
+def rgba_colors(colors: Sequence) -> np.ndarray:
+    """Converts the given Matplotlib colors to an (N, 4) array of RGBA colors,
+    converting each distinct color only once, as figures of the same class
+    usually share a few colors.
+    """
+    try:
+        rgba = {color: to_rgba(color) for color in set(colors)}
+    except TypeError:
+        # unhashable colors, such as arrays
+        return to_rgba_array(colors)
+    return np.array([rgba[color] for color in colors]).reshape(-1, 4)
+
+
 class Points(Figure2D):
     """Represents a collection of points on the 2D plane, given their
     (x,y) coordinates. The points will be displayed as dots in the
@@ -88,10 +121,22 @@ class Points(Figure2D):
         for v in self.vectors:
             yield v
 
+    def vectors_array(self) -> np.ndarray:
+        return np.array(self.vectors, dtype=np.float64).reshape(-1, 2)
+
     def render(self) -> None:
-        xs = [v[0] for v in self.vectors]
-        ys = [v[1] for v in self.vectors]
-        plt.scatter(xs, ys, color=self.color)
+        self.render_all([self])
+
+    @classmethod
+    def render_all(cls, figures: Sequence["Points"]) -> None:
+        vectors = [figure.vectors_array() for figure in figures]
+        colors = np.repeat(
+            rgba_colors([figure.color for figure in figures]),
+            [len(v) for v in vectors],
+            axis=0,
+        )
+        vectors = np.concatenate(vectors)
+        plt.scatter(vectors[:, 0], vectors[:, 1], color=colors)
 
 
 class Segment(Figure2D):
@@ -116,9 +161,18 @@ class Segment(Figure2D):
         yield self.end_point
 
     def render(self) -> None:
-        x1, y1 = self.start_point  # pylint: disable=invalid-name
-        x2, y2 = self.end_point  # pylint: disable=invalid-name
-        plt.plot([x1, x2], [y1, y2], color=self.color)
+        self.render_all([self])
+
+    @classmethod
+    def render_all(cls, figures: Sequence["Segment"]) -> None:
+        segments = np.array(
+            [(f.start_point, f.end_point) for f in figures], dtype=np.float64
+        )
+        plt.gca().add_collection(
+            LineCollection(
+                segments, colors=rgba_colors([f.color for f in figures])
+            )
+        )
 
 
 class Polygon(Figure2D):
@@ -147,17 +201,29 @@ class Polygon(Figure2D):
             yield v
 
     def render(self) -> None:
-        if self.color:
-            for i in range(0, len(self.vertices)):
-                x1, y1 = self.vertices[i]
-                x2, y2 = self.vertices[(i + 1) % len(self.vertices)]
-                plt.plot([x1, x2], [y1, y2], color=self.color)
-
-        if self.fill:
-            patches = []
-            poly = pyplot_poly(self.vertices, closed=True)
-            patches.append(poly)
-            patch_collection = PatchCollection(patches, color=self.fill)
+        self.render_all([self])
+
+    @classmethod
+    def render_all(cls, figures: Sequence["Polygon"]) -> None:
+        outlined = [f for f in figures if f.color]
+        if outlined:
+            # each outline is a closed path, so it ends at the first vertex
+            outlines = [
+                np.array(f.vertices + f.vertices[:1], dtype=np.float64)
+                for f in outlined
+            ]
+            plt.gca().add_collection(
+                LineCollection(
+                    outlines, colors=rgba_colors([f.color for f in outlined])
+                )
+            )
+
+        filled = [f for f in figures if f.fill]
+        if filled:
+            patches = [pyplot_poly(f.vertices, closed=True) for f in filled]
+            patch_collection = PatchCollection(
+                patches, color=rgba_colors([f.fill for f in filled])
+            )
             plt.gca().add_collection(patch_collection)
 
 
@@ -184,21 +250,32 @@ class Arrow(Figure2D):
         yield self.tail
 
     def render(self) -> None:
-        tip, tail = self.tip, self.tail
+        self.render_all([self])
+
+    @classmethod
+    def render_all(cls, figures: Sequence["Arrow"]) -> None:
         tip_length = (xlim()[1] - xlim()[0]) / 20.0
-        length = sqrt((tip[1] - tail[1]) ** 2 + (tip[0] - tail[0]) ** 2)
-        new_length = length - tip_length
-        new_y = (tip[1] - tail[1]) * (new_length / length)
-        new_x = (tip[0] - tail[0]) * (new_length / length)
-        plt.gca().arrow(
-            tail[0],
-            tail[1],
-            new_x,
-            new_y,
-            head_width=tip_length / 1.5,
-            head_length=tip_length,
-            fc=self.color,
-            ec=self.color,
+        tips = np.array([f.tip for f in figures], dtype=np.float64)
+        tails = np.array([f.tail for f in figures], dtype=np.float64)
+        # the segment of each arrow is shortened so that its head ends at the
+        # tip
+        lengths = np.hypot(*(tips - tails).T)
+        deltas = (tips - tails) * ((lengths - tip_length) / lengths)[:, None]
+        patches = [
+            FancyArrow(
+                x,
+                y,
+                dx,
+                dy,
+                width=0.001,
+                head_width=tip_length / 1.5,
+                head_length=tip_length,
+            )
+            for (x, y), (dx, dy) in zip(tails.tolist(), deltas.tolist())
+        ]
+        colors = rgba_colors([f.color for f in figures])
+        plt.gca().add_collection(
+            PatchCollection(patches, facecolors=colors, edgecolors=colors)
         )
 
 
@@ -236,14 +313,9 @@ def draw(
         save_as (str, optional): path of the file to be created with the plot,
             or None if no file is to be created.
     """
-    all_vectors = [vec for obj in objects for vec in obj.extract_vectors()]
-    xs, ys = zip(*all_vectors)  # pylint: disable=invalid-name
-    max_x, max_y, min_x, min_y = (
-        max(0, *xs),
-        max(0, *ys),
-        min(0, *xs),
-        min(0, *ys),
-    )
+    all_vectors = np.concatenate([obj.vectors_array() for obj in objects])
+    max_x, max_y = np.maximum(all_vectors.max(axis=0), 0).tolist()
+    min_x, min_y = np.minimum(all_vectors.min(axis=0), 0).tolist()
 
     if grid:
         x_padding = max(ceil(0.05 * (max_x - min_x)), grid[0])
@@ -282,10 +354,14 @@ def draw(
         coords_width = xlim()[1] - xlim()[0]
         plt.gcf().set_size_inches(width, width * coords_height / coords_width)
 
-    for obj in objects:
-        obj.render()
+    # each run of consecutive figures of the same class is rendered together,
+    # so the figures are still stacked in the order of the arguments
+    for figure_class, figures in groupby(objects, key=type):
+        figure_class.render_all(list(figures))
 
     if save_as:
-        plt.savefig(save_as)
+        # unlike plt.savefig, this doesn't draw the whole figure again after
+        # saving it
+        plt.gcf().savefig(save_as)
 
     plt.show()
@@ -1,6 +1,7 @@
 """
 __init__.py for the vector2d.math module which provides the math capabilities.
 """
+from vec2d.math import vector2d_batch as batch
 from vec2d.math.vector2d_math import (
     add,
     add_mult,
@@ -21,6 +22,7 @@ from vec2d.math.vector2d_math import (
 )
 
 __all__ = [
+    "batch",
     "add",
     "add_mult",
     "length",
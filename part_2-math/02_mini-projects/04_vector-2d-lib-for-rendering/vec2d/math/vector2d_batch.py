@@ -0,0 +1,348 @@
+"""
+A NumPy backed companion to vector2d_math that performs the same operations on
+whole batches of 2D vectors at once.
+
+A batch of vectors is an array-like of shape (N, 2). Every function also
+accepts a single 2D vector (a tuple such as (1, 2)), in which case the result
+is returned as a tuple (or a float) just like the corresponding function in
+vector2d_math, so that existing tuple callers keep working unchanged.
+"""
+from math import pi
+
+import numpy as np
+
+# Type aliases
+Vector2D = tuple[int | float, int | float]
+Vectors2D = np.ndarray | list[Vector2D] | Vector2D
+
+
+def as_vectors(vectors: Vectors2D) -> np.ndarray:
+    """Returns the given vectors as a float64 NumPy array of shape (N, 2). A
+    single 2D vector is returned as an array of shape (2,). No copy is made if
+    the given vectors are already a float64 array.
+
+    Args:
+        vectors (Vectors2D): a single 2D vector, a list of 2D vectors, or an
+            array of shape (N, 2).
+
+    Returns:
+        np.ndarray: the vectors as a float64 array.
+    """
+    arr = np.asarray(vectors, dtype=np.float64)
+    if arr.shape[-1:] != (2,) or arr.ndim > 2:
+        raise ValueError(
+            f"expected a 2D vector or an array of shape (N, 2), got {arr.shape}"
+        )
+    return arr
+
+
+def to_tuples(vectors: np.ndarray) -> list[tuple[float, float]]:
+    """Converts a batch of vectors back into the list of tuples representation
+    used by vector2d_math.
+
+    Args:
+        vectors (np.ndarray): an array of shape (N, 2).
+
+    Returns:
+        list[tuple[float, float]]: the list of 2D vectors as tuples.
+    """
+    return list(map(tuple, as_vectors(vectors).reshape(-1, 2).tolist()))
+
+
+def _is_single(*vectors: Vectors2D) -> bool:
+    """Returns True when all the given arguments are single 2D vectors."""
+    return all(np.ndim(v) == 1 for v in vectors)
+
+
+def _result(arr: np.ndarray, single: bool) -> np.ndarray | tuple | float:
+    """Returns the result of an operation on single vectors as a float or a
+    tuple (as vector2d_math does), and batch results as arrays."""
+    if not single:
+        return arr
+    return float(arr) if arr.ndim == 0 else tuple(arr.tolist())
+
+
+def _batch_result(
+    arr: np.ndarray, vectors: Vectors2D
+) -> np.ndarray | list[Vector2D]:
+    """Returns the result of an operation on a batch as an array if the batch
+    was given as an array, and as a list of tuples (as vector2d_math does)
+    otherwise."""
+    return arr if isinstance(vectors, np.ndarray) else to_tuples(arr)
+
+
+def add(v1: Vectors2D, v2: Vectors2D) -> np.ndarray | Vector2D:
+    """Performs the element-wise addition of two batches of vectors. A single
+    vector is broadcast against the whole batch.
+
+    Args:
+        v1 (Vectors2D): the first batch of 2D vectors to be added
+        v2 (Vectors2D): the second batch of 2D vectors to be added
+
+    Returns:
+        np.ndarray | Vector2D: the vector sums
+    """
+    result = as_vectors(v1) + as_vectors(v2)
+    return _result(result, _is_single(v1, v2))
+
+
+def add_mult(*v: Vectors2D) -> np.ndarray | Vector2D:
+    """Variadic version of the add function for batches of 2D vectors
+
+    Args:
+        *v (Vectors2D): a variable number of batches of 2D vectors
+
+    Returns:
+        np.ndarray | Vector2D: the vector sums
+    """
+    if len(v) < 2:
+        raise ValueError("at least two vectors were expected")
+    result = sum(as_vectors(vectors) for vectors in v)
+    return _result(result, _is_single(*v))
+
+
+def subtract(v: Vectors2D, w: Vectors2D) -> np.ndarray | Vector2D:
+    """Calculates the vectors that result from subtracting w from v, that is,
+    the displacement vectors.
+
+    Args:
+        v (Vectors2D): the first batch of 2D vectors
+        w (Vectors2D): the second batch of 2D vectors
+
+    Returns:
+        np.ndarray | Vector2D: the displacement vectors
+    """
+    result = as_vectors(v) - as_vectors(w)
+    return _result(result, _is_single(v, w))
+
+
+def displacement(tip: Vectors2D, tail: Vectors2D) -> np.ndarray | Vector2D:
+    """Calculates the displacement vectors that go from tail to tip.
+
+    Args:
+        tip (Vectors2D): the tips of the displacement vectors
+        tail (Vectors2D): the tails of the displacement vectors
+
+    Returns:
+        np.ndarray | Vector2D: the displacement vectors
+    """
+    return subtract(tip, tail)
+
+
+def opposite(v: Vectors2D) -> np.ndarray | Vector2D:
+    """Calculates the opposite of the given vectors
+
+    Args:
+        v (Vectors2D): the batch of 2D vectors
+
+    Returns:
+        np.ndarray | Vector2D: the opposite vectors
+    """
+    return _result(-as_vectors(v), _is_single(v))
+
+
+def scale(s: int | float | np.ndarray, v: Vectors2D) -> np.ndarray | Vector2D:
+    """Scales the given vectors by s, which can be a single scalar or an array
+    of shape (N,) holding one scalar per vector.
+
+    Args:
+        s (int | float | np.ndarray): the scalar or scalars
+        v (Vectors2D): the batch of 2D vectors to scale
+
+    Returns:
+        np.ndarray | Vector2D: the scaled vectors
+    """
+    arr = as_vectors(v)
+    s = np.asarray(s, dtype=np.float64)
+    result = arr * (s[..., np.newaxis] if s.ndim > 0 else s)
+    return _result(result, _is_single(v) and s.ndim == 0)
+
+
+def scalar_product(
+    v: Vectors2D, s: int | float | np.ndarray
+) -> np.ndarray | Vector2D:
+    """Calculates the scalar multiplication. Alias of scale with the arguments
+    in the same order as vector2d_math.scalar_product.
+
+    Args:
+        v (Vectors2D): the batch of 2D vectors
+        s (int | float | np.ndarray): the scalar or scalars
+
+    Returns:
+        np.ndarray | Vector2D: the scaled vectors
+    """
+    return scale(s, v)
+
+
+def length(v: Vectors2D) -> np.ndarray | float:
+    """Calculates the length of each of the given vectors
+
+    Args:
+        v (Vectors2D): the batch of 2D vectors
+
+    Returns:
+        np.ndarray | float: an array of shape (N,) with the lengths
+    """
+    arr = as_vectors(v)
+    return _result(np.hypot(arr[..., 0], arr[..., 1]), arr.ndim == 1)
+
+
+def dot(v: Vectors2D, w: Vectors2D) -> np.ndarray | float:
+    """Calculates the dot product of each pair of vectors
+
+    Args:
+        v (Vectors2D): the first batch of 2D vectors
+        w (Vectors2D): the second batch of 2D vectors
+
+    Returns:
+        np.ndarray | float: an array of shape (N,) with the dot products
+    """
+    a, b = as_vectors(v), as_vectors(w)
+    return _result(
+        a[..., 0] * b[..., 0] + a[..., 1] * b[..., 1], _is_single(v, w)
+    )
+
+
+def cross(v: Vectors2D, w: Vectors2D) -> np.ndarray | float:
+    """Calculates the 2D cross product of each pair of vectors, that is, the z
+    component of the 3D cross product of (v, 0) and (w, 0). Its sign tells
+    whether w lies counterclockwise (positive) or clockwise (negative) from v.
+
+    Args:
+        v (Vectors2D): the first batch of 2D vectors
+        w (Vectors2D): the second batch of 2D vectors
+
+    Returns:
+        np.ndarray | float: an array of shape (N,) with the cross products
+    """
+    a, b = as_vectors(v), as_vectors(w)
+    return _result(
+        a[..., 0] * b[..., 1] - a[..., 1] * b[..., 0], _is_single(v, w)
+    )
+
+
+def distance(tip: Vectors2D, tail: Vectors2D) -> np.ndarray | float:
+    """Calculates the distances between each pair of tips and tails.
+
+    Args:
+        tip (Vectors2D): the tips of the displacement vectors
+        tail (Vectors2D): the tails of the displacement vectors
+
+    Returns:
+        np.ndarray | float: an array of shape (N,) with the distances
+    """
+    return length(as_vectors(tip) - as_vectors(tail))
+
+
+def translate(
+    translation_vector: Vector2D, vectors: Vectors2D
+) -> np.ndarray | list[Vector2D]:
+    """Translates every vector of the batch by the given translation vector.
+
+    Args:
+        translation_vector (Vector2D): the translation vector
+        vectors (Vectors2D): the batch of vectors to be translated
+
+    Returns:
+        np.ndarray | list[Vector2D]: the translated vectors, as a list of tuples
+            unless the batch was given as an array
+    """
+    if len(vectors) == 0:
+        raise ValueError("expected a non-empty list of vectors")
+    return _batch_result(
+        as_vectors(vectors) + as_vectors(translation_vector), vectors
+    )
+
+
+def rotate(angle: float, vectors: Vectors2D) -> np.ndarray | list[Vector2D]:
+    """Rotates every vector of the batch by the given angle (in radians)
+    counterclockwise about the origin, using a single rotation matrix instead
+    of converting each vector to polar coordinates and back.
+
+    Args:
+        angle (float): the angle (in radians) of the rotation
+        vectors (Vectors2D): the batch of vectors to be rotated
+
+    Returns:
+        np.ndarray | list[Vector2D]: the rotated vectors, as a list of tuples
+            unless the batch was given as an array
+    """
+    if len(vectors) == 0:
+        raise ValueError("expected a non-empty list of vectors")
+    c, s = np.cos(angle), np.sin(angle)
+    return _batch_result(
+        as_vectors(vectors) @ np.array([[c, s], [-s, c]]), vectors
+    )
+
+
+def rescale(
+    factor: float, vectors: Vectors2D
+) -> np.ndarray | list[Vector2D]:
+    """Scales every vector of the batch by the given factor.
+
+    Args:
+        factor (float): the factor to be used when scaling
+        vectors (Vectors2D): the batch of vectors to be scaled
+
+    Returns:
+        np.ndarray | list[Vector2D]: the scaled vectors, as a list of tuples
+            unless the batch was given as an array
+    """
+    if len(vectors) == 0:
+        raise ValueError("expected a non-empty list of vectors")
+    return _batch_result(as_vectors(vectors) * factor, vectors)
+
+
+def perimeter(vectors: Vectors2D) -> float:
+    """Computes the perimeter of the shape defined by the given vectors.
+
+    Args:
+        vectors (Vectors2D): the vectors/points that define the 2D shape
+
+    Returns:
+        float: the perimeter of the 2D shape
+    """
+    arr = as_vectors(vectors)
+    return float(length(np.roll(arr, -1, axis=0) - arr).sum())
+
+
+def to_cartesian(polar_vectors: Vectors2D) -> np.ndarray | Vector2D:
+    """Returns the Cartesian coordinates (x, y) of the given vectors expressed
+    in polar coordinates (r, θ).
+
+    Args:
+        polar_vectors (Vectors2D): the vectors in polar coordinates
+
+    Returns:
+        np.ndarray | Vector2D: the Cartesian coordinates of the vectors
+    """
+    arr = as_vectors(polar_vectors)
+    r, theta = arr[..., 0], arr[..., 1]
+    return _result(
+        np.stack((r * np.cos(theta), r * np.sin(theta)), axis=-1),
+        arr.ndim == 1,
+    )
+
+
+def to_polar(
+    cartesian_vectors: Vectors2D, positive_angle=False
+) -> np.ndarray | Vector2D:
+    """Returns the polar coordinates (r, θ) of the given vectors expressed in
+    Cartesian coordinates (x, y).
+
+    Args:
+        cartesian_vectors (Vectors2D): the vectors in Cartesian coordinates
+        positive_angle (bool, Optional): forces the angles to have a positive
+            value. Otherwise, angles greater than pi will have negative values.
+
+    Returns:
+        np.ndarray | Vector2D: the polar coordinates of the vectors
+    """
+    arr = as_vectors(cartesian_vectors)
+    angle = np.arctan2(arr[..., 1], arr[..., 0])
+    if positive_angle:
+        angle = np.where(angle < 0, angle + 2 * pi, angle)
+    return _result(
+        np.stack((np.hypot(arr[..., 0], arr[..., 1]), angle), axis=-1),
+        arr.ndim == 1,
+    )
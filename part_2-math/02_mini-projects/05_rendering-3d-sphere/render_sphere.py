@@ -1,4 +1,4 @@
-from rendering import render, unit
+from rendering import render, render_fast, unit
 from vec2d.graph import Colors
 from vec3d.math import add
 
@@ -31,3 +31,6 @@ if __name__ == "__main__":
     render(sphere_approx(3), lines=Colors.BLACK)
     render(sphere_approx(3), lines=None)
 
+    # High-resolution spheres (32768 faces) need the vectorized renderer
+    render_fast(sphere_approx(6), lines=None)
+
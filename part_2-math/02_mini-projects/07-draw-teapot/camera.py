@@ -1,23 +1,36 @@
 """
 Camera supporting library
 """
-import os
-from math import ceil
+from pathlib import Path
 
-from PIL import Image
-from pygame.image import save
 from pygame.time import Clock
 
+from capture import ComicStripSink, FrameRecorder, PNGSink, VideoSink
+
 
 class Camera:
-    """Camera class"""
+    """
+    Camera class
+
+    The shots are captured into the ring buffer of a FrameRecorder, and saved
+    as PNG files (if save_frames), streamed to a video file with the given fps
+    (if video is the name of an .mp4 or .gif file) and assembled into a comic
+    strip with comic_strip columns (if given) in a background thread, so the
+    render loop doesn't wait for them to be encoded.
+    """
 
     def __init__(
-        self, name, shots=None, save_dir="screenshots", comic_strip=None
+        self,
+        name,
+        shots=None,
+        save_dir="screenshots",
+        comic_strip=None,
+        video=None,
+        fps=60,
+        save_frames=True,
     ):
-        self.dir = os.path.join(os.getcwd(), save_dir)
-        if not os.path.exists(self.dir):
-            os.makedirs(self.dir)
+        self.dir = Path.cwd() / save_dir
+        self.dir.mkdir(parents=True, exist_ok=True)
 
         self.clock = Clock()
         self.name = name
@@ -34,6 +47,10 @@ class Camera:
         self.total_ticks = 0
         self.made_comic_strip = False
         self.comic_strip = comic_strip
+        self.video = video
+        self.fps = fps
+        self.save_frames = save_frames
+        self.recorder = None
         self.window = None
 
     def set_window(self, window):
@@ -55,26 +72,31 @@ class Camera:
         else:
             return range(len(self.shots))
 
-    def make_comic_strip(self):
-        image_files = [
-            self.dir / f"{self.name}{idx}.png" for idx in self.indexes()
-        ]
-        images = map(Image.open, image_files)
-        # for some reason pylint complains that images is not subscriptable
-        width, height = images[0].size  # pylint: disable=unsubscriptable-object
-
-        total_width = width * self.comic_strip
-        max_height = height * int(ceil(len(images) / float(self.comic_strip)))
-
-        new_im = Image.new("RGB", (total_width, max_height))
+    def start_recording(self):
+        size = self.window.get_size()
+        sinks = []
+        if self.save_frames:
+            sinks.append(PNGSink(self.dir, self.name))
+        if self.video:
+            sinks.append(VideoSink(self.dir / self.video, size, self.fps))
+        if self.comic_strip:
+            sinks.append(
+                ComicStripSink(
+                    self.dir / f"{self.name}_comic_strip.png", self.comic_strip
+                )
+            )
+        self.recorder = FrameRecorder(size, sinks)
 
-        for i, im in enumerate(images):
-            x_offset = (i % self.comic_strip) * width
-            y_offset = (i / self.comic_strip) * height
-            print(f"offsets: ({x_offset}, {y_offset})")
-            new_im.paste(im, (x_offset, y_offset))
+    def finish_recording(self):
+        """Waits until all the shots are saved"""
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
 
-        new_im.save(self.dir / f"{self.name}_comic_strip.png")
+    def make_comic_strip(self):
+        # the comic strip is assembled by the recorder once all the shots have
+        # been taken
+        self.finish_recording()
         self.made_comic_strip = True
 
     def should_shoot(self):
@@ -94,8 +116,9 @@ class Camera:
             idx = self.shots.index(self.remaining_shots[0])
             self.remaining_shots.pop(0)
 
-        image_name = self.dir / f"{self.name}{idx}.png"
-        save(self.window, image_name)
+        if self.recorder is None:
+            self.start_recording()
+        self.recorder.capture(self.window, idx)
 
     def tick(self):
         res = self.clock.tick()
@@ -108,6 +131,8 @@ class Camera:
             and not self.remaining_shots
         ):
             self.make_comic_strip()
+        elif not self.remaining_shots:
+            self.finish_recording()
         return res
 
     def get_fps(self):
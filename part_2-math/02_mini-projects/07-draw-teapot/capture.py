@@ -0,0 +1,220 @@
+"""
+Frame capture supporting library
+
+The FrameRecorder copies the frames of the window into a ring buffer of
+preallocated arrays, which is the only work done in the render loop, and a
+background thread hands them to the sinks that encode them:
++ PNGSink saves each frame as a PNG file, compressing them in a thread pool.
++ VideoSink streams the frames to an ffmpeg process that encodes them into an
+  MP4 video or an animated GIF.
++ ComicStripSink assembles the frames into a comic strip in memory.
+"""
+import queue
+import shutil
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from math import ceil
+from pathlib import Path
+
+import numpy as np
+import pygame
+from PIL import Image
+
+
+def read_frame(window, out):
+    """
+    Copies the pixels of the window into the (height, width, 3) uint8 array
+    out. OpenGL windows are read with glReadPixels, so the rows are stored
+    bottom-up, and other surfaces (e.g. headless ones) are stored top-down.
+
+    Returns:
+        bool: True if the rows are stored bottom-up.
+    """
+    if window.get_flags() & pygame.OPENGL:
+        # pylint: disable=import-outside-toplevel
+        from OpenGL.GL import (
+            GL_PACK_ALIGNMENT,
+            GL_RGB,
+            GL_UNSIGNED_BYTE,
+            glPixelStorei,
+            glReadPixels,
+        )
+
+        height, width = out.shape[:2]
+        glPixelStorei(GL_PACK_ALIGNMENT, 1)
+        pixels = glReadPixels(0, 0, width, height, GL_RGB, GL_UNSIGNED_BYTE)
+        out[...] = np.frombuffer(pixels, dtype=np.uint8).reshape(out.shape)
+        return True
+    out[...] = pygame.surfarray.pixels3d(window).swapaxes(0, 1)
+    return False
+
+
+class PNGSink:
+    """Saves each frame as {directory}/{name}{index}.png"""
+
+    def __init__(self, directory, name, workers=4):
+        self.directory = Path(directory)
+        self.name = name
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+        self.pending = []
+
+    def write(self, index, frame):
+        # the frame is copied into the image, so its slot can be reused while
+        # the PNG is compressed (zlib releases the GIL, so it runs in parallel)
+        image = Image.fromarray(frame, "RGB")
+        path = self.directory / f"{self.name}{index}.png"
+        self.pending.append(self.pool.submit(image.save, path))
+
+    def close(self):
+        self.pool.shutdown(wait=True)
+        for future in self.pending:
+            future.result()
+
+
+class VideoSink:
+    """
+    Streams the frames to an ffmpeg process, which encodes them in the format
+    given by the extension of the path (e.g. .mp4 or .gif).
+
+    Args:
+        path (str | Path): The video file.
+        size (tuple[int, int]): The (width, height) of the frames.
+        fps (float): The frame rate of the video.
+    """
+
+    def __init__(self, path, size, fps=60):
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg is None:
+            raise RuntimeError("Recording videos requires ffmpeg in the PATH")
+        width, height = size
+        # most players only support MP4 videos in the yuv420p pixel format
+        is_mp4 = Path(path).suffix == ".mp4"
+        output_format = ["-pix_fmt", "yuv420p"] if is_mp4 else []
+        self.process = subprocess.Popen(
+            [
+                ffmpeg,
+                "-loglevel",
+                "error",
+                "-y",
+                "-f",
+                "rawvideo",
+                "-pix_fmt",
+                "rgb24",
+                "-s",
+                f"{width}x{height}",
+                "-r",
+                str(fps),
+                "-i",
+                "-",
+                *output_format,
+                str(path),
+            ],
+            stdin=subprocess.PIPE,
+        )
+
+    def write(self, _, frame):
+        self.process.stdin.write(np.ascontiguousarray(frame).tobytes())
+
+    def close(self):
+        self.process.stdin.close()
+        if self.process.wait() != 0:
+            raise RuntimeError(
+                f"ffmpeg failed with exit code {self.process.returncode}"
+            )
+
+
+class ComicStripSink:
+    """
+    Assembles the frames into a comic strip with the given number of columns,
+    which is saved to path when the sink is closed.
+    """
+
+    def __init__(self, path, columns):
+        self.path = path
+        self.columns = columns
+        self.frames = {}
+
+    def write(self, index, frame):
+        self.frames[index] = frame.copy()
+
+    def close(self):
+        if not self.frames:
+            return
+        frames = [self.frames[index] for index in sorted(self.frames)]
+        height, width = frames[0].shape[:2]
+        rows = int(ceil(len(frames) / self.columns))
+        strip = np.zeros((rows * height, self.columns * width, 3), np.uint8)
+        for i, frame in enumerate(frames):
+            y, x = (i // self.columns) * height, (i % self.columns) * width
+            strip[y : y + height, x : x + width] = frame
+        Image.fromarray(strip, "RGB").save(self.path)
+
+
+class FrameRecorder:
+    """
+    Records frames of the given (width, height) size into a ring buffer with
+    room for capacity frames, which a background thread passes to the sinks.
+
+    When the sinks fall behind and the ring buffer is full, capture waits for
+    a free slot, unless drop_frames is True, in which case the frame is
+    skipped and counted in dropped_frames.
+    """
+
+    def __init__(self, size, sinks, capacity=120, drop_frames=False):
+        width, height = size
+        self.size = size
+        self.sinks = list(sinks)
+        self.frames = np.empty((capacity, height, width, 3), dtype=np.uint8)
+        self.drop_frames = drop_frames
+        self.dropped_frames = 0
+        self.free_slots = queue.Queue()
+        for slot in range(capacity):
+            self.free_slots.put(slot)
+        self.pending = queue.Queue()
+        self.error = None
+        self.thread = threading.Thread(target=self._encode, daemon=True)
+        self.thread.start()
+
+    def _slot(self):
+        try:
+            return self.free_slots.get(block=not self.drop_frames)
+        except queue.Empty:
+            self.dropped_frames += 1
+            return None
+
+    def capture(self, window, index):
+        """Copies the current contents of the window as the frame index."""
+        slot = self._slot()
+        if slot is not None:
+            flipped = read_frame(window, self.frames[slot])
+            self.pending.put((index, slot, flipped))
+
+    def add(self, index, frame):
+        """Adds a (height, width, 3) uint8 array as the frame index."""
+        slot = self._slot()
+        if slot is not None:
+            self.frames[slot] = frame
+            self.pending.put((index, slot, False))
+
+    def _encode(self):
+        while (item := self.pending.get()) is not None:
+            index, slot, flipped = item
+            frame = self.frames[slot]
+            try:
+                if self.error is None:
+                    for sink in self.sinks:
+                        sink.write(index, frame[::-1] if flipped else frame)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                self.error = err
+            finally:
+                self.free_slots.put(slot)
+
+    def close(self):
+        """Waits until all the frames are encoded and closes the sinks."""
+        self.pending.put(None)
+        self.thread.join()
+        for sink in self.sinks:
+            sink.close()
+        if self.error is not None:
+            raise self.error
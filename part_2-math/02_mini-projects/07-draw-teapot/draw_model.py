@@ -93,6 +93,8 @@ def draw_model(
     while cam.is_shooting():
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
+                # save the shots still being encoded and finalize the video
+                cam.finish_recording()
                 pygame.display.quit()
                 pygame.quit()
                 sys.exit(0)
@@ -7,10 +7,20 @@ from mat.matrices import (
     multiply_matrix_vector,
     std_basis,
 )
+from mat.matrix import (
+    Matrix,
+    fuse,
+    multiply_matrix_vectors,
+    transformation_matrix,
+)
 
 __all__ = [
     "infer_matrix",
     "matrix_multiply",
     "multiply_matrix_vector",
     "std_basis",
+    "Matrix",
+    "fuse",
+    "multiply_matrix_vectors",
+    "transformation_matrix",
 ]
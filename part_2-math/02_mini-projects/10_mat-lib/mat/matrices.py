@@ -1,8 +1,14 @@
 """
 Matrix library
 """
+from weakref import WeakKeyDictionary
+
 from vec3d.math import dot, linear_combination
 
+# Matrices already inferred with cache=True for a given transformation, keyed
+# by the transformation function and then by the number of dimensions
+_inferred_matrices = WeakKeyDictionary()
+
 
 def multiply_matrix_vector(matrix, vector):
     """Returns the vector that results from multiplying the matrix by the vector
@@ -45,7 +51,7 @@ def std_basis(n):
     return [tuple(1 if pos == i else 0 for pos in range(n)) for i in range(n)]
 
 
-def infer_matrix(n, transformation):
+def infer_matrix(n, transformation, cache=False):
     """Returns the matrix that represents a linear transformation or linear map.
 
     Args:
@@ -54,10 +60,26 @@ def infer_matrix(n, transformation):
         transformation (Callable[Tuple[float], Tuple[float]]): a function that
             takes a vector of n dimensions and returns another vector (might) be
             of a different dimension.
+        cache (bool, optional): when True, the result is cached per
+            transformation function, so inferring the matrix of the same
+            transformation again does not re-evaluate it. Only use it for
+            transformations whose behavior never changes between calls.
+            Defaults to False.
 
     Returns:
         (tuple[Tuple[float]]): the matrix that represents the transformation.
     """
-    vectors = std_basis(n)
-    m = tuple(transformation(vectors[i]) for i in range(n))
-    return tuple(zip(*m))
+    cached = {}
+    if cache:
+        try:
+            cached = _inferred_matrices.setdefault(transformation, {})
+        except TypeError:
+            # transformations that can't be weak-referenced or hashed aren't
+            # cached
+            pass
+
+    if n not in cached:
+        vectors = std_basis(n)
+        m = tuple(transformation(vectors[i]) for i in range(n))
+        cached[n] = tuple(zip(*m))
+    return cached[n]
@@ -0,0 +1,175 @@
+"""
+Vectorized matrix engine backed by contiguous float64 NumPy storage.
+
+The functions in mat.matrices work on tuples of tuples, one vector at a time.
+The Matrix class defined here holds the same matrices in a NumPy array so that
+a transformation can be applied to a whole mesh (an array of shape (N, 3), or
+(F, 3, 3) for F triangular faces) in a single call, and so that a pipeline of
+transformations can be fused into one matrix before it touches any vertex.
+"""
+from typing import Callable, Iterable, Sequence
+
+import numpy as np
+
+from mat.matrices import infer_matrix
+
+
+class Matrix:
+    """An immutable matrix stored as a C-contiguous float64 NumPy array.
+
+    Matrices can be multiplied with `@`: `a @ b` returns the product matrix,
+    and `a @ vertices` (an array whose last dimension matches the number of
+    columns of a) returns the transformed vertices.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(
+        self, rows: "Matrix | np.ndarray | Sequence[Sequence[float]]"
+    ):
+        data = rows._data if isinstance(rows, Matrix) else rows
+        data = np.array(data, dtype=np.float64, order="C")
+        if data.ndim != 2:
+            raise ValueError(f"expected a 2D matrix, got shape {data.shape}")
+        data.flags.writeable = False
+        self._data = data
+
+    @classmethod
+    def identity(cls, n: int) -> "Matrix":
+        """Returns the n x n identity matrix."""
+        return cls(np.eye(n))
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """The (rows, columns) shape of the matrix."""
+        return self._data.shape
+
+    @property
+    def array(self) -> np.ndarray:
+        """A read-only view of the underlying float64 array."""
+        return self._data
+
+    def to_tuples(self) -> tuple[tuple[float, ...], ...]:
+        """Returns the matrix as a tuple of tuples, as used by mat.matrices."""
+        return tuple(map(tuple, self._data.tolist()))
+
+    def apply(self, vectors: np.ndarray | Sequence) -> np.ndarray:
+        """Multiplies the matrix by every vector in the given batch.
+
+        Args:
+            vectors (np.ndarray | Sequence): an array-like whose last dimension
+                has as many components as columns has the matrix, e.g. an
+                (N, 3) array of vertices or an (F, 3, 3) array of triangles.
+
+        Returns:
+            (np.ndarray): the transformed vectors, with the same leading
+                dimensions as the input.
+        """
+        vectors = np.asarray(vectors, dtype=np.float64)
+        if vectors.shape[-1] != self.shape[1]:
+            raise ValueError(
+                f"cannot multiply a {self.shape} matrix by vectors of "
+                f"dimension {vectors.shape[-1]}"
+            )
+        return vectors @ self._data.T
+
+    def __matmul__(self, other):
+        if isinstance(other, Matrix):
+            return Matrix(self._data @ other._data)
+        return self.apply(other)
+
+    def __rmatmul__(self, other):
+        return Matrix(np.asarray(other, dtype=np.float64) @ self._data)
+
+    def __eq__(self, other):
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return np.array_equal(self._data, other._data)
+
+    def __hash__(self):
+        return hash((self.shape, self._data.tobytes()))
+
+    def __array__(self, dtype=None, copy=None):
+        # lets np.asarray and NumPy functions use the matrix as a 2D array
+        if dtype is None and not copy:
+            return self._data
+        return np.array(self._data, dtype=dtype, copy=True)
+
+    def __getitem__(self, index):
+        return self.to_tuples()[index]
+
+    def __iter__(self):
+        return iter(self.to_tuples())
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __repr__(self):
+        return f"Matrix({self.to_tuples()})"
+
+
+# Type aliases
+MatrixLike = Matrix | np.ndarray | Sequence[Sequence[float]]
+
+
+def fuse(*matrices: MatrixLike) -> Matrix:
+    """Collapses a pipeline of transformation matrices into a single matrix.
+    As with `compose`, the matrices are applied in reversed order: the last
+    matrix is the first one being applied to the vectors, so that
+    `fuse(scale, rotate) @ v` is `scale @ (rotate @ v)`.
+
+    Args:
+        matrices (MatrixLike): a positive number of matrices to fuse.
+
+    Returns:
+        (Matrix): the single matrix equivalent to the whole pipeline.
+    """
+    if len(matrices) == 0:
+        raise ValueError("at least one matrix was expected")
+    result = Matrix(matrices[-1]).array
+    for m in reversed(matrices[:-1]):
+        result = Matrix(m).array @ result
+    return Matrix(result)
+
+
+def multiply_matrix_vectors(
+    matrix: MatrixLike, vectors: np.ndarray | Iterable
+) -> np.ndarray:
+    """Batched version of multiply_matrix_vector that transforms every vector
+    of a mesh in a single NumPy operation.
+
+    Args:
+        matrix (MatrixLike): the matrix as a Matrix, an array or a tuple of
+            tuples of floats.
+        vectors (np.ndarray | Iterable): an (N, n) array of vectors, or any
+            array-like whose last dimension is n, such as the (F, 3, 3) array
+            of the vertices of F triangles.
+
+    Returns:
+        (np.ndarray): the vectors that result from multiplying the matrix by
+            each of the given vectors.
+    """
+    if not isinstance(matrix, Matrix):
+        matrix = Matrix(matrix)
+    return matrix.apply(vectors)
+
+
+def transformation_matrix(
+    n: int,
+    transformation: Callable[[tuple[float, ...]], tuple[float, ...]],
+    cache: bool = False,
+) -> Matrix:
+    """Returns the Matrix that represents the given linear transformation. It
+    is the array-backed counterpart of `infer_matrix`, and shares its cache.
+
+    Args:
+        n (int): the number of dimensions of the input vectors.
+        transformation (Callable[Tuple[float], Tuple[float]]): a linear
+            transformation.
+        cache (bool, optional): whether to cache the result per
+            transformation function, as in `infer_matrix`. Defaults to False.
+
+    Returns:
+        (Matrix): the matrix that represents the transformation.
+    """
+    return Matrix(infer_matrix(n, transformation, cache))
@@ -0,0 +1,65 @@
+"""Headless frame-time benchmark for draw_model
+
+Measures the CPU work that draw_model performs per frame when animating the
+Utah teapot with a time-based matrix (`get_matrix`), without opening a display
+or issuing any OpenGL call. It compares the immediate-mode path (transforming
+every vertex with `multiply_matrix_vector` and calling `shade()` for every
+face) with the retained `Mesh` path.
+
+Usage: python benchmark_frame.py [--frames 100]
+"""
+import argparse
+from math import cos, sin
+from timeit import default_timer as timer
+
+from mat import Matrix, fuse, multiply_matrix_vector
+
+from rendergl import load_triangles, polygon_map
+from rendergl.draw_model import shade
+from rendergl.mesh import Mesh
+
+
+def get_matrix(t):
+    """Same time-based rotation matrix used in draw_teapot.py"""
+    seconds = t / 1000
+    return (
+        (cos(seconds), 0, -sin(seconds)),
+        (0, 1, 0),
+        (sin(seconds), 0, cos(seconds)),
+    )
+
+
+def immediate_mode_frames(faces, frames, millis_per_frame):
+    """CPU work of the previous glBegin/glVertex3fv implementation"""
+    for _ in range(frames):
+        m = get_matrix(millis_per_frame)
+        faces = polygon_map(lambda v: multiply_matrix_vector(m, v), faces)
+        for face in faces:
+            color = shade(face)
+            for _ in face:
+                (color[0], color[1], color[2])
+
+
+def retained_mode_frames(faces, frames, millis_per_frame):
+    """CPU work of the retained Mesh implementation"""
+    mesh = Mesh(faces)
+    matrix = Matrix.identity(3)
+    for _ in range(frames):
+        matrix = fuse(get_matrix(millis_per_frame), matrix)
+        mesh.transform(matrix)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=100)
+    args = parser.parse_args()
+
+    triangles = load_triangles()
+    for name, run_frames in (
+        ("immediate", immediate_mode_frames),
+        ("retained", retained_mode_frames),
+    ):
+        start = timer()
+        run_frames(triangles, args.frames, 16)
+        elapsed = timer() - start
+        print(f"{name:>10}: {1000 * elapsed / args.frames:8.3f} ms/frame")
@@ -2,8 +2,11 @@
 __init__.py for the rendergl package which provides rendering utilities.
 """
 from rendergl.draw_model import draw_model
-from rendergl.teapot import load_triangles
+from rendergl.mesh import Mesh
+from rendergl.loader import IndexedMesh, load_mesh
+from rendergl.teapot import load_teapot_mesh, load_triangles
 from rendergl.transforms import (
+    Transform,
     compose,
     polygon_map,
     rotate_x_by,
@@ -15,7 +18,12 @@ from rendergl.transforms import (
 
 __all__ = [
     "draw_model",
+    "Mesh",
     "load_triangles",
+    "IndexedMesh",
+    "load_mesh",
+    "load_teapot_mesh",
+    "Transform",
     "compose",
     "polygon_map",
     "rotate_x_by",
@@ -4,29 +4,43 @@ import sys
 
 import pygame
 from matplotlib import colormaps
+from OpenGL.error import GLError
 from OpenGL.GL import (
+    GL_ARRAY_BUFFER,
     GL_BACK,
+    GL_COLOR_ARRAY,
     GL_COLOR_BUFFER_BIT,
     GL_CULL_FACE,
     GL_DEPTH_BUFFER_BIT,
     GL_DEPTH_TEST,
+    GL_DYNAMIC_DRAW,
+    GL_FLOAT,
     GL_LINES,
     GL_TRIANGLES,
+    GL_VERTEX_ARRAY,
     glBegin,
+    glBindBuffer,
+    glBufferData,
     glClear,
     glColor3fv,
+    glColorPointer,
     glCullFace,
+    glDisableClientState,
+    glDrawArrays,
     glEnable,
+    glEnableClientState,
     glEnd,
+    glGenBuffers,
     glRotatef,
     glTranslatef,
     glVertex3fv,
+    glVertexPointer,
 )
 from OpenGL.GLU import gluPerspective
 from pygame.locals import DOUBLEBUF, OPENGL
 from vec3d.math import cross, dot, length, scale, subtract
-from rendergl.transforms import polygon_map
-from mat import multiply_matrix_vector
+from mat import Matrix, fuse
+from rendergl.mesh import Mesh
 
 blues_colormap = colormaps.get_cmap("Blues")
 
@@ -76,6 +90,48 @@ def axes():
     glEnd()
 
 
+def create_buffers():
+    """Returns the ids of two vertex buffer objects (VBOs) for the vertex and
+    color buffers of a mesh, or None when the OpenGL implementation in use does
+    not support VBOs, in which case client-side vertex arrays are used.
+    """
+    if not bool(glGenBuffers):
+        return None
+    try:
+        return tuple(glGenBuffers(2))
+    except GLError:
+        return None
+
+
+def upload_mesh(mesh, buffers):
+    """Copies the vertex and color buffers of the mesh into the given VBOs."""
+    for buffer, data in zip(buffers, (mesh.vertices, mesh.colors)):
+        glBindBuffer(GL_ARRAY_BUFFER, buffer)
+        glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_DYNAMIC_DRAW)
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+
+def draw_mesh(mesh, buffers=None):
+    """Draws the given mesh with a single glDrawArrays call, reading the vertex
+    and color data from the given VBOs, or straight from the mesh buffers
+    (client-side vertex arrays) when no VBOs are given.
+    """
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glEnableClientState(GL_COLOR_ARRAY)
+    if buffers:
+        glBindBuffer(GL_ARRAY_BUFFER, buffers[0])
+        glVertexPointer(3, GL_FLOAT, 0, None)
+        glBindBuffer(GL_ARRAY_BUFFER, buffers[1])
+        glColorPointer(3, GL_FLOAT, 0, None)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+    else:
+        glVertexPointer(3, GL_FLOAT, 0, mesh.vertices)
+        glColorPointer(3, GL_FLOAT, 0, mesh.colors)
+    glDrawArrays(GL_TRIANGLES, 0, mesh.vertex_count)
+    glDisableClientState(GL_COLOR_ARRAY)
+    glDisableClientState(GL_VERTEX_ARRAY)
+
+
 def draw_model(
     faces,
     *,
@@ -117,7 +173,12 @@ def draw_model(
         get_matrix (Callable[t, Tuple[Tuple[float, float, float]]): a function
             that takes in a time value in milliseconds and return a 3x3 matrix
             that represents a transformation matrix. When supplied, that
-            function will be applied in every frame to animate the faces.
+            function will be applied in every frame to animate the faces. A
+            pipeline of matrices can be collapsed into one with `mat.fuse`
+            before returning it, so the vertices are only transformed once.
+
+    The faces are packed once into a retained `Mesh` with precomputed shading,
+    and drawn every frame from vertex arrays (VBOs when available).
     """
 
     # Initialize PyGame engine
@@ -169,6 +230,17 @@ def draw_model(
     # (0, 0, 0) means no readjusting from the default (0, 0, -5)
     translation_vector = (0.0, 0.0, 0.0)
 
+    # Pack the faces, their normals and their shading into vertex and color
+    # buffers once, and hand them over to the GPU if VBOs are supported
+    mesh = Mesh(faces, colormap=colormap, light=light)
+    buffers = create_buffers()
+    if buffers:
+        upload_mesh(mesh, buffers)
+
+    # Accumulated animation matrix, fused every frame so that the mesh is
+    # transformed once from its original faces
+    matrix = Matrix.identity(3)
+
     while True:
         # Process user inputs
         for event in pygame.event.get():
@@ -210,8 +282,10 @@ def draw_model(
         # Have we been passed a time-based transformation matrix?
         # If so, we animate using the matrix
         if get_matrix:
-            m = get_matrix(milliseconds)
-            faces = polygon_map(lambda v : multiply_matrix_vector(m, v), faces)
+            matrix = fuse(get_matrix(milliseconds), matrix)
+            mesh.transform(matrix)
+            if buffers:
+                upload_mesh(mesh, buffers)
 
         # Check if animation is enabled
         if rotation_axis is not (0, 0, 0):
@@ -229,22 +303,8 @@ def draw_model(
         # Draw the axes
         axes()
 
-        # Inform OpenGL that we're about to draw triangles
-        glBegin(GL_TRIANGLES)
-
-        # For each vertex of each face, set the color based on the shading
-        # mechanism we're using.
-        for face in faces:
-            color = shade(face, colormap, light)
-            for vertex in face:
-                glColor3fv((color[0], color[1], color[2]))
-
-                # Tell OpenGL that the current vertex is ready
-                glVertex3fv(vertex)
-
-        # Informs OpenGL that series of vertex specifications that started with
-        # glBegin has ended.
-        glEnd()
+        # Draw all the triangles of the mesh in one call
+        draw_mesh(mesh, buffers)
 
         # Inform PyGame that the next frame is ready, so that it can make it
         # visible
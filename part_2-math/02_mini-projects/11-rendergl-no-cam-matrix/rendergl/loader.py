@@ -0,0 +1,208 @@
+"""Mesh loader
+
+Parses OFF and OBJ files with NumPy into indexed meshes: a (V, 3) float64 array
+of vertices and a (T, 3) int array of triangles holding indices into the
+vertices. An optional affine pre-transformation is applied to all the vertices
+with a single matrix multiplication.
+
+The result is cached on disk as a pair of `.npy` files keyed by a hash of the
+source file and the pre-transformation, so that later runs memory-map the
+arrays instead of parsing the source file again. When the cache can't be
+written (e.g. on a read-only install), the mesh is still loaded.
+"""
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+CACHE_DIR_NAME = ".meshcache"
+
+logger = logging.getLogger(__name__)
+
+
+class IndexedMesh(NamedTuple):
+    """A mesh given by its distinct vertices and the vertex indices of each of
+    its triangles, so that shared vertices are stored (and transformed) once.
+
+    Attributes:
+        vertices (np.ndarray): the (V, 3) array of vertices.
+        faces (np.ndarray): the (T, 3) array of vertex indices of each triangle.
+    """
+
+    vertices: np.ndarray
+    faces: np.ndarray
+
+    def triangles(self):
+        """Returns the (T, 3, 3) array with the vertices of each triangle."""
+        return np.asarray(self.vertices)[self.faces]
+
+
+def triangulate_faces(faces):
+    """Splits polygons into triangles as a fan around their first vertex,
+    following the same vertex order used by `teapot.triangulate`.
+
+    Args:
+        faces (list[Seq[int]] | np.ndarray): the vertex indices of each face.
+            An (F, n) array can be given when all the faces have n vertices.
+
+    Returns:
+        (np.ndarray): a (T, 3) array with the vertex indices of each triangle.
+    """
+    if isinstance(faces, np.ndarray):
+        if faces.shape[1] < 3:
+            raise ValueError("polygons must have at least 3 vertices")
+        fans = [
+            faces[:, [0, i + 1, i]] for i in range(1, faces.shape[1] - 1)
+        ]
+        return np.stack(fans, axis=1).reshape(-1, 3)
+
+    triangles = []
+    for face in faces:
+        if len(face) < 3:
+            raise ValueError("polygons must have at least 3 vertices")
+        for i in range(1, len(face) - 1):
+            triangles.append((face[0], face[i + 1], face[i]))
+    return np.array(triangles, dtype=np.int64).reshape(-1, 3)
+
+
+def parse_off(text):
+    """Parses the contents of an OFF file.
+
+    Returns:
+        (tuple[np.ndarray, np.ndarray]): the (V, 3) vertices and the (T, 3)
+            triangles of the mesh.
+    """
+    lines = [
+        line.split("#", 1)[0] for line in text.splitlines() if line.strip()
+    ]
+    if not lines or not lines[0].strip().startswith("OFF"):
+        raise ValueError("not an OFF file: missing OFF header")
+
+    tokens = " ".join(lines[0].strip()[3:].split() + lines[1:]).split()
+    vertex_count, face_count = int(tokens[0]), int(tokens[1])
+    start = 3
+    end = start + 3 * vertex_count
+    vertices = np.array(tokens[start:end], dtype=np.float64).reshape(-1, 3)
+
+    face_tokens = np.array(tokens[end:], dtype=np.int64)
+    sides = face_tokens[0] if face_tokens.size else 0
+    if face_tokens.size == face_count * (sides + 1) and np.all(
+        face_tokens[:: sides + 1] == sides
+    ):
+        # All faces have the same number of sides: no need for a Python loop
+        faces = face_tokens.reshape(face_count, sides + 1)[:, 1:]
+    else:
+        faces, pos = [], 0
+        for _ in range(face_count):
+            n = face_tokens[pos]
+            faces.append(face_tokens[pos + 1 : pos + 1 + n])
+            pos += n + 1
+
+    return vertices, triangulate_faces(faces)
+
+
+def parse_obj(text):
+    """Parses the vertices (`v`) and faces (`f`) of the contents of an OBJ file.
+    Other statements (normals, texture coordinates, groups...) are ignored.
+
+    Returns:
+        (tuple[np.ndarray, np.ndarray]): the (V, 3) vertices and the (T, 3)
+            triangles of the mesh.
+    """
+    vertices, faces = [], []
+    for line in text.splitlines():
+        if line.startswith("v "):
+            vertices.append(line[2:].split()[:3])
+        elif line.startswith("f "):
+            # Entries look like 'v', 'v/vt', 'v//vn' or 'v/vt/vn', 1-based
+            faces.append(
+                [int(entry.split("/")[0]) for entry in line[2:].split()]
+            )
+
+    vertices = np.array(vertices, dtype=np.float64).reshape(-1, 3)
+    faces = [
+        [i - 1 if i > 0 else len(vertices) + i for i in face] for face in faces
+    ]
+    return vertices, triangulate_faces(faces)
+
+
+PARSERS = {".off": parse_off, ".obj": parse_obj}
+
+
+def apply_transform(vertices, transform):
+    """Applies a 3x3 linear or 4x4 affine (homogeneous) transformation matrix
+    to every vertex in a single matrix multiplication."""
+    transform = np.asarray(transform, dtype=np.float64)
+    if transform.shape == (3, 3):
+        return vertices @ transform.T
+    if transform.shape == (4, 4):
+        return vertices @ transform[:3, :3].T + transform[:3, 3]
+    raise ValueError(f"expected a 3x3 or 4x4 matrix, got {transform.shape}")
+
+
+def load_mesh(path, transform=None, *, cache_dir=None, use_cache=True):
+    """Loads the indexed mesh stored in the given OFF or OBJ file.
+
+    Args:
+        path (str | Path): the path of the OFF or OBJ file.
+        transform (np.ndarray, Optional): a 3x3 linear or 4x4 affine matrix
+            applied to all the vertices once they're loaded.
+        cache_dir (str | Path, Optional): the directory where the parsed mesh
+            is cached. By default, a `.meshcache` directory next to the file.
+        use_cache (bool): whether to read and write the on-disk cache.
+
+    Returns:
+        (IndexedMesh): the (V, 3) vertices and the (T, 3) vertex indices of
+            each triangle. When read from the cache, both arrays are read-only
+            memory-mapped arrays.
+    """
+    path = Path(path)
+    parser = PARSERS.get(path.suffix.lower())
+    if parser is None:
+        raise ValueError(f"unsupported mesh format: {path.suffix}")
+
+    source = path.read_bytes()
+    if use_cache:
+        digest = hashlib.sha256(source)
+        if transform is not None:
+            digest.update(np.asarray(transform, dtype=np.float64).tobytes())
+        cache_dir = Path(cache_dir or path.parent / CACHE_DIR_NAME)
+        prefix = cache_dir / f"{path.stem}-{digest.hexdigest()[:16]}"
+        vertices_file = prefix.with_name(prefix.name + ".vertices.npy")
+        faces_file = prefix.with_name(prefix.name + ".faces.npy")
+        if vertices_file.exists() and faces_file.exists():
+            return IndexedMesh(
+                np.load(vertices_file, mmap_mode="r"),
+                np.load(faces_file, mmap_mode="r"),
+            )
+
+    vertices, faces = parser(source.decode("utf-8"))
+    if transform is not None:
+        vertices = apply_transform(vertices, transform)
+
+    if use_cache:
+        try:
+            _write_cache(
+                cache_dir, (vertices_file, vertices), (faces_file, faces)
+            )
+        except OSError as err:
+            logger.warning("could not cache mesh %s: %s", path, err)
+
+    return IndexedMesh(vertices, faces)
+
+
+def _write_cache(cache_dir, *entries):
+    """Saves each (file, array) entry in the cache directory."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for file, arr in entries:
+        # write to a temp file first so readers never see partial files
+        tmp_file = file.with_name(f"{file.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_file, "wb") as f:
+                np.save(f, arr)
+            os.replace(tmp_file, file)
+        finally:
+            tmp_file.unlink(missing_ok=True)
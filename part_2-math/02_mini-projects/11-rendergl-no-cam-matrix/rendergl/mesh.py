@@ -0,0 +1,89 @@
+"""Retained-mode mesh
+
+Packs the faces of a 3D shape into float32 vertex and color buffers that can be
+handed to OpenGL as vertex arrays. Normals and shading are computed once for
+the whole mesh with NumPy, and then only for the faces whose transformation
+changes, instead of calling `shade()` for every face in every frame.
+
+This module does not depend on OpenGL or PyGame, so it can be used headless.
+"""
+import numpy as np
+from matplotlib import colormaps
+
+from mat import multiply_matrix_vectors
+
+blues_colormap = colormaps.get_cmap("Blues")
+
+
+def normals(triangles):
+    """Computes the unit normal vectors of an (F, 3, 3) array of triangles. The
+    vertices of each triangle must be arranged so that
+    (face[1] - face[0]) x (face[2] - face[0]) points away from the shape.
+    """
+    n = np.cross(
+        triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0]
+    )
+    return n / np.linalg.norm(n, axis=1, keepdims=True)
+
+
+def shades(triangles, colormap=blues_colormap, light=(1, 2, 3)):
+    """Vectorized version of `shade()` that returns an (F, 3) array with the RGB
+    color of each of the given triangles.
+    """
+    light = np.asarray(light, dtype=np.float64)
+    intensity = 1 - normals(triangles) @ (light / np.linalg.norm(light))
+    return colormap(intensity)[:, :3]
+
+
+class Mesh:
+    """A triangle mesh kept as packed float32 buffers ready to be drawn with
+    glDrawArrays(GL_TRIANGLES, 0, mesh.vertex_count).
+
+    Attributes:
+        faces (np.ndarray): the (F, 3, 3) float64 array of the untransformed
+            triangles.
+        vertices (np.ndarray): the (F * 3, 3) float32 vertex buffer, with the
+            transformation applied.
+        colors (np.ndarray): the (F * 3, 3) float32 color buffer, in which the
+            three vertices of each face share the color of the face.
+    """
+
+    def __init__(self, faces, *, colormap=blues_colormap, light=(1, 2, 3)):
+        self.faces = np.asarray(faces, dtype=np.float64).reshape(-1, 3, 3)
+        self.colormap = colormap
+        self.light = light
+        self.vertices = np.ascontiguousarray(
+            self.faces.reshape(-1, 3), dtype=np.float32
+        )
+        self.colors = np.empty_like(self.vertices)
+        self._face_colors = self.colors.reshape(-1, 3, 3)
+        self._face_colors[:] = shades(self.faces, colormap, light)[:, None, :]
+
+    @property
+    def face_count(self):
+        """The number of triangles of the mesh."""
+        return self.faces.shape[0]
+
+    @property
+    def vertex_count(self):
+        """The number of vertices in the vertex buffer (3 per face)."""
+        return self.vertices.shape[0]
+
+    def transform(self, matrix, faces=None):
+        """Applies the given 3x3 matrix to the original faces and refreshes the
+        vertex and color buffers in place.
+
+        Args:
+            matrix (mat.Matrix | Seq[Seq[float]]): the 3x3 transformation
+                matrix, e.g. a pipeline of matrices fused with `mat.fuse`.
+            faces (np.ndarray, Optional): the indices (or a boolean mask) of
+                the faces whose transformation changed. When given, only those
+                faces are transformed and re-shaded. By default, all of them.
+        """
+        if faces is None:
+            faces = slice(None)
+        transformed = multiply_matrix_vectors(matrix, self.faces[faces])
+        self.vertices.reshape(-1, 3, 3)[faces] = transformed
+        self._face_colors[faces] = shades(
+            transformed, self.colormap, self.light
+        )[:, None, :]
@@ -1,42 +1,38 @@
 """Support functions for converting the `teapot.off` specification in a list of
 faces that can be sent to draw_model.
+
+The file is only read when one of the load functions is called, and the parsed
+and pre-transformed mesh is cached on disk by `rendergl.loader`.
 """
 from math import pi
+from pathlib import Path
 
-from rendergl.transforms import rotate_x_by, scale_by, translate_by
+from rendergl.loader import load_mesh
+from rendergl.transforms import compose, rotate_x_by, scale_by, translate_by
 
+TEAPOT_OFF = Path(__file__).parent / "teapot.off"
 
-with open("./rendergl/teapot.off", "r", encoding="utf-8") as f:
-    lines = f.readlines()
 
-vertex_count, face_count, edge_count = map(int, lines[1].split())
+def pre_transform_matrix():
+    """Returns the 4x4 affine matrix that places the teapot at the center of the
+    scene: translate by (-0.5, 0, -0.6), then rotate -pi/2 about the x- axis,
+    and then scale by 2."""
+    return compose(
+        scale_by(2), rotate_x_by(-pi / 2), translate_by((-0.5, 0, -0.6))
+    ).matrix
 
 
-def triple(xs):
-    xs = list(xs)
-    return (xs[0], xs[1], xs[2])
+def load_teapot_mesh():
+    """Returns the IndexedMesh of the teapot: a (480, 3) array of vertices and
+    a (880, 3) array with the vertex indices of each triangle. It can be
+    transformed with `polygon_map` without duplicating shared vertices."""
+    return load_mesh(TEAPOT_OFF, pre_transform_matrix())
 
 
 def load_vertices():
-    """Returns a list of 440 vectors, which are the vertices of the 3D model"""
-    vertices = []
-    for i in range(2, 2 + vertex_count):
-        v = triple(map(float, lines[i].split()))
-        vertices.append(
-            scale_by(2)(rotate_x_by(-pi / 2)(translate_by((-0.5, 0, -0.6))(v)))
-        )
-    return vertices
-
-
-def load_polygons():
-    """Return a list of 448 lists, each one containing the vectors that are the
-    vertices of the 3D shape polygons."""
-    polys = []
-    vertices = load_vertices()
-    for i in range(2 + vertex_count, 2 + vertex_count + face_count):
-        poly = list(map(vertices.__getitem__, map(int, lines[i].split()[1:])))
-        polys.append(poly)
-    return polys
+    """Returns a list of 480 vectors, which are the vertices of the 3D model"""
+    vertices, _ = load_teapot_mesh()
+    return list(map(tuple, vertices.tolist()))
 
 
 def triangulate(poly):
@@ -58,12 +54,7 @@ def load_triangles() -> list[list[tuple[float, float, float]]]:
         (list[list[tuple[float, float, float]]]): the faces of the Utah Teapot
             3D shape as a list of list of 3D vectors/vertices.
     """
-    triangles = []
-    polys = load_polygons()
-    for poly in polys:
-        for triangle in triangulate(poly):
-            assert len(triangle) == 3
-            for v in triangle:
-                assert len(v) == 3
-            triangles.append(triangle)
-    return triangles
+    return [
+        tuple(map(tuple, triangle))
+        for triangle in load_teapot_mesh().triangles().tolist()
+    ]
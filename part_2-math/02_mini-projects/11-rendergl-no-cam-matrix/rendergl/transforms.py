@@ -1,31 +1,134 @@
 """
 Vector transformations
+
+The scale_by, translate_by and rotate_*_by functions return Transform objects:
+callables that transform a single vector like the closures they replace, but
+that are backed by a 4x4 affine matrix, so that composing them produces a
+single matrix instead of a stack of closures.
 """
 from typing import Callable, Tuple
 
+import numpy as np
 from vec2d.math import to_cartesian, to_polar
-from vec3d.math import add, scale
+
+from rendergl.loader import IndexedMesh
+
+
+class Transform:
+    """An affine transformation of the 3D space represented by a 4x4 matrix in
+    homogeneous coordinates.
+
+    Calling a Transform with a 3D vector returns the transformed vector as a
+    tuple, so it can be used anywhere a transformation function is expected.
+    Transforms compose with `@` (or `compose`) into a new Transform, applying
+    the right-hand one first.
+    """
+
+    __slots__ = ("matrix",)
+
+    def __init__(self, matrix):
+        matrix = np.array(matrix, dtype=np.float64)
+        if matrix.shape == (3, 3):
+            affine = np.identity(4)
+            affine[:3, :3] = matrix
+            matrix = affine
+        if matrix.shape != (4, 4):
+            raise ValueError(f"expected a 3x3 or 4x4 matrix, got {matrix.shape}")
+        self.matrix = matrix
+
+    def apply(self, vertices):
+        """Transforms an array-like of vertices whose last dimension is 3, such
+        as an (N, 3) array of vertices, in a single matrix multiplication."""
+        vertices = np.asarray(vertices, dtype=np.float64)
+        if vertices.shape[-1:] != (3,):
+            raise ValueError(
+                f"expected 3D vertices, got an array of shape {vertices.shape}"
+            )
+        return vertices @ self.matrix[:3, :3].T + self.matrix[:3, 3]
+
+    def __call__(self, v):
+        return tuple(self.apply(v).tolist())
+
+    def __matmul__(self, other):
+        if not isinstance(other, Transform):
+            return NotImplemented
+        return Transform(self.matrix @ other.matrix)
+
+    def __repr__(self):
+        return f"Transform({self.matrix.tolist()})"
+
+
+class _Scaling(Transform):
+    """A uniform scaling Transform that, like a plain scaling function, also
+    scales vectors that are not 3D (which have no affine matrix)."""
+
+    __slots__ = ("scalar",)
+
+    def __init__(self, scalar):
+        super().__init__(np.diag([scalar, scalar, scalar, 1.0]))
+        self.scalar = scalar
+
+    def apply(self, vertices):
+        vertices = np.asarray(vertices, dtype=np.float64)
+        if vertices.shape[-1:] == (3,):
+            return super().apply(vertices)
+        return vertices * self.scalar
+
+
+def _map_unique_vertices(transformation, polygons):
+    """Applies the transformation once per distinct vertex of the polygons and
+    rebuilds the polygons with the transformed vertices. The vertices can be
+    any sequence of coordinates (tuples, lists or NumPy rows)."""
+    index = {}
+    unique = []
+    faces = []
+    for polygon in polygons:
+        face = []
+        for vertex in polygon:
+            key = tuple(vertex)
+            if key not in index:
+                index[key] = len(unique)
+                unique.append(vertex)
+            face.append(index[key])
+        faces.append(face)
+    if isinstance(transformation, Transform):
+        transformed = list(map(tuple, transformation.apply(unique).tolist()))
+    else:
+        transformed = [transformation(vertex) for vertex in unique]
+    return [[transformed[i] for i in face] for face in faces]
 
 
 def polygon_map(transformation, polygons):
     """Generic function that applies the given transformation to all the
     vertices found in the given polygons.
 
+    Vertices shared by several polygons are transformed only once. When given
+    an IndexedMesh (as returned by `rendergl.loader.load_mesh`) only its vertex
+    array is transformed, and the faces are reused as they are.
+
     Args:
         transformation (Callable[tuple[float, float, float],
             Tuple[flloat, float, float]]): a function that takes a vector and
-            returns a transformed vector.
-        polygons (list[list[tuple(float, float, float)]]): a list of polygons.
-            Each polygon is a triangle with three vertices, so polygons is
-            effectively a list of lists of vertices.
+            returns a transformed vector, such as a Transform.
+        polygons (list[list[tuple(float, float, float)]] | IndexedMesh): a list
+            of polygons. Each polygon is a triangle with three vertices, so
+            polygons is effectively a list of lists of vertices.
 
     Returns:
-        (list[list[tuple(float, float, float)]]): the transformed polygons. That
-            is, a list of list of transformed vertices.
+        (list[list[tuple(float, float, float)]] | IndexedMesh): the transformed
+            polygons. That is, a list of list of transformed vertices, or an
+            IndexedMesh with the transformed vertices if one was given.
     """
-    return [
-        [transformation(vertex) for vertex in triangle] for triangle in polygons
-    ]
+    if isinstance(polygons, IndexedMesh):
+        if isinstance(transformation, Transform):
+            vertices = transformation.apply(polygons.vertices)
+        else:
+            vertices = np.array(
+                [transformation(v) for v in np.asarray(polygons.vertices)],
+                dtype=np.float64,
+            )
+        return IndexedMesh(vertices, polygons.faces)
+    return _map_unique_vertices(transformation, polygons)
 
 
 def scale_by(scalar):
@@ -38,16 +141,13 @@ def scale_by(scalar):
             all the vectors/vertices of the 3D shape.
 
     Returns:
-        (Callable[tuple[float, float, float], tuple[float, float, float]]): a
-            transformation function that when invoked with a vector/vertex will
-            scale it by the configured scalar.
+        (Transform): a transformation that when invoked with a vector/vertex
+            will scale it by the configured scalar. It scales vectors of any
+            dimension, but its compositions with other Transforms only take 3D
+            vectors.
 
     """
-
-    def new_fn(v):
-        return scale(scalar, v)
-
-    return new_fn
+    return _Scaling(scalar)
 
 
 def translate_by(translation):
@@ -60,15 +160,24 @@ def translate_by(translation):
         will be ultimately applied to all the vectors/vertices of the 3D shape.
 
     Returns:
-        (Callable[tuple[float, float, float], tuple[float, float, float]]): a
-            transformation function that when invoked with a vector/vertex will
-            translate it by the configured translation vector.
+        (Transform): a transformation that when invoked with a vector/vertex
+            will translate it by the configured translation vector.
     """
+    matrix = np.identity(4)
+    matrix[:3, 3] = translation
+    return Transform(matrix)
 
-    def new_fn(v):
-        return add(translation, v)
 
-    return new_fn
+def _rotation(angle, first_axis, second_axis):
+    """Returns the Transform that rotates the given angle in the plane of the
+    two given axes, from the first towards the second."""
+    c, s = np.cos(angle), np.sin(angle)
+    matrix = np.identity(4)
+    matrix[first_axis, first_axis] = c
+    matrix[first_axis, second_axis] = -s
+    matrix[second_axis, first_axis] = s
+    matrix[second_axis, second_axis] = c
+    return Transform(matrix)
 
 
 def rotate2d(angle: float, vector: tuple[float, float]) -> tuple[float, float]:
@@ -122,16 +231,12 @@ def rotate_z_by(angle: float):
             the vectors/vertices of the 3D shape.
 
     Returns:
-        (Callable[tuple[float, float, float], tuple[float, float, float]]): a
-            transformation function that when invoked with a vector/vertex will
-            rotate the corresponding vector by the configured angle about the z-
+        (Transform): a transformation that when invoked with a vector/vertex
+            will rotate the corresponding vector by the configured angle about the z-
             axis.
     """
 
-    def new_fn(v):
-        return rotate_z(angle, v)
-
-    return new_fn
+    return _rotation(angle, 0, 1)
 
 
 def rotate_x(angle, vector):
@@ -164,16 +269,12 @@ def rotate_x_by(angle):
             the vectors/vertices of the 3D shape.
 
     Returns:
-        (Callable[tuple[float, float, float], tuple[float, float, float]]): a
-            transformation function that when invoked with a vector/vertex will
-            rotate the corresponding vector by the configured angle about the x-
+        (Transform): a transformation that when invoked with a vector/vertex
+            will rotate the corresponding vector by the configured angle about the x-
             axis.
     """
 
-    def new_fn(v):
-        return rotate_x(angle, v)
-
-    return new_fn
+    return _rotation(angle, 1, 2)
 
 
 def rotate_y(angle, vector):
@@ -206,16 +307,12 @@ def rotate_y_by(angle):
             the vectors/vertices of the 3D shape.
 
     Returns:
-        (Callable[tuple[float, float, float], tuple[float, float, float]]): a
-            transformation function that when invoked with a vector/vertex will
-            rotate the corresponding vector by the configured angle about the y-
+        (Transform): a transformation that when invoked with a vector/vertex
+            will rotate the corresponding vector by the configured angle about the y-
             axis.
     """
 
-    def new_fn(v):
-        return rotate_y(angle, v)
-
-    return new_fn
+    return _rotation(angle, 0, 2)
 
 
 def compose(
@@ -227,12 +324,20 @@ def compose(
     the last being applied, so that `compose(scale, rotate)` first applies the
     rotation and then the scaling.
 
+    When all the given functions are Transforms, the result is a single
+    Transform whose matrix is the product of theirs.
+
     Args:
         args (Callable[[Tuple[float, float, float]], Tuple[float, float, float]]): A variadic number of transformation functions whose composition is to be returned.
 
     Returns:
         (Callable[[Tuple[float, float, float]], Tuple[float, float, float]]): The transformation function that results from applying the transformation functions passed as arguments in reversed order.
     """
+    if args and all(isinstance(fn, Transform) for fn in args):
+        matrix = np.identity(4)
+        for fn in args:
+            matrix = matrix @ fn.matrix
+        return Transform(matrix)
 
     def new_transformation_fn(
         v: Tuple[float, float, float]
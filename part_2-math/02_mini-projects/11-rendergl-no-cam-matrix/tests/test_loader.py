@@ -0,0 +1,54 @@
+"""Unit tests for the mesh loader"""
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+from rendergl.loader import load_mesh
+
+TETRAHEDRON = """OFF
+4 4 0
+0 0 0
+1 0 0
+0 1 0
+0 0 1
+3 0 2 1
+3 0 1 3
+3 0 3 2
+3 1 2 3
+"""
+
+
+class LoadMeshTest(unittest.TestCase):
+    """
+    load_mesh test class
+    """
+
+    def test_cache_not_writable(self):
+        """
+        Validates that the parsed mesh is returned when the cache can't be
+        written, and that no temporary files are left behind
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "tetrahedron.off"
+            path.write_text(TETRAHEDRON)
+            with (
+                patch("rendergl.loader.np.save", side_effect=PermissionError),
+                self.assertLogs("rendergl.loader", level="WARNING"),
+            ):
+                mesh = load_mesh(path)
+            self.assertEqual(mesh.vertices.shape, (4, 3))
+            self.assertEqual(mesh.faces.shape, (4, 3))
+            cache_dir = Path(tmp_dir) / ".meshcache"
+            self.assertListEqual(list(cache_dir.iterdir()), [])
+
+            # the cache is written and read back once it's writable
+            load_mesh(path)
+            cached = load_mesh(path)
+            self.assertIsInstance(cached.vertices, np.memmap)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+"""Unit tests for the retained-mode Mesh"""
+import unittest
+
+import numpy as np
+
+from mat import Matrix, fuse
+from rendergl.mesh import Mesh
+
+TRIANGLES = [
+    ((1, 0, 0), (0, 1, 0), (0, 0, 1)),
+    ((1, 0, 0), (0, 0, -1), (0, 1, 0)),
+]
+
+
+class MeshTest(unittest.TestCase):
+    """
+    Mesh test class
+    """
+
+    def test_transform_with_fused_matrix(self):
+        """
+        Validates that a pipeline fused with mat.fuse (as returned by the
+        get_matrix functions of draw_model) transforms the vertex buffer
+        """
+        scale = ((2, 0, 0), (0, 2, 0), (0, 0, 2))
+        swap_xy = ((0, 1, 0), (1, 0, 0), (0, 0, 1))
+        matrix = fuse(scale, swap_xy)
+        self.assertIsInstance(matrix, Matrix)
+
+        mesh = Mesh(TRIANGLES)
+        mesh.transform(matrix)
+        expected = np.asarray(TRIANGLES, dtype=np.float64)[..., [1, 0, 2]] * 2
+        self.assertTrue(np.allclose(mesh.vertices, expected.reshape(-1, 3)))
+
+    def test_transform_accumulated_matrix(self):
+        """
+        Validates that the matrix accumulated frame by frame with mat.fuse, as
+        draw_model does, matches transforming the faces once per frame
+        """
+        rotation = Matrix(((0, -1, 0), (1, 0, 0), (0, 0, 1)))
+        matrix = Matrix.identity(3)
+        for _ in range(3):
+            matrix = fuse(rotation, matrix)
+
+        mesh = Mesh(TRIANGLES)
+        mesh.transform(matrix, faces=[1])
+        expected = np.asarray(TRIANGLES[1], dtype=np.float64)
+        for _ in range(3):
+            expected = expected @ rotation.array.T
+        self.assertTrue(np.allclose(mesh.vertices[3:], expected))
+        self.assertTrue(
+            np.allclose(mesh.vertices[:3], np.asarray(TRIANGLES[0]))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""Unit tests for the rendergl transformations"""
+import unittest
+
+import numpy as np
+
+from rendergl.transforms import polygon_map, scale_by, translate_by
+
+
+class PolygonMapTest(unittest.TestCase):
+    """
+    polygon_map test class
+    """
+
+    def test_unhashable_vertices(self):
+        """
+        Validates that vertices given as lists or NumPy rows are transformed,
+        both by a Transform and by a plain function
+        """
+        triangles = [[[1, 2, 3], [0, 0, 1], [1, 2, 3]]]
+        expected = [[(2, 4, 6), (0, 0, 2), (2, 4, 6)]]
+
+        def double(v):
+            return tuple(2 * c for c in v)
+
+        for polygons in (triangles, np.array(triangles, dtype=np.float64)):
+            for transformation in (scale_by(2), double):
+                got = polygon_map(transformation, polygons)
+                self.assertEqual(len(got), 1)
+                self.assertTrue(np.allclose(got, expected))
+
+    def test_shared_vertices_transformed_once(self):
+        """
+        Validates that a vertex shared by several polygons is transformed once
+        """
+        calls = []
+
+        def transformation(v):
+            calls.append(v)
+            return v
+
+        triangles = [
+            [(0, 0, 0), (1, 0, 0), (0, 1, 0)],
+            [(0, 0, 0), (0, 1, 0), (0, 0, 1)],
+        ]
+        self.assertEqual(polygon_map(transformation, triangles), triangles)
+        self.assertEqual(len(calls), 4)
+
+
+class TransformTest(unittest.TestCase):
+    """
+    Transform test class
+    """
+
+    def test_scale_by_any_dimension(self):
+        """
+        Validates that scale_by scales vectors of any dimension, as the
+        scaling function it replaces did
+        """
+        self.assertEqual(scale_by(2)((1, 2)), (2, 4))
+        self.assertEqual(scale_by(2)((1, 2, 3)), (2, 4, 6))
+        self.assertEqual(scale_by(0.5)((2, 4, 6, 8)), (1, 2, 3, 4))
+
+    def test_non_3d_vectors(self):
+        """
+        Validates that other Transforms reject vectors that are not 3D
+        """
+        for transformation in (
+            translate_by((1, 0, 0)),
+            scale_by(2) @ translate_by((1, 0, 0)),
+        ):
+            with self.assertRaisesRegex(ValueError, "expected 3D vertices"):
+                transformation((1, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,22 @@
 """A generic class for vectors of any dimension"""
 from abc import abstractmethod
-
-from vec3d.math import add, scale
+from operator import add
 
 from vec import Vector
 
 
 class CoordinateVector(Vector):
     """A generic class that represents a vector with numeric coordinates of any
-    given dimension"""
+    given dimension.
+
+    The coordinates are kept in a tuple in the only slot of the instance, so
+    vectors don't carry a __dict__ (subclasses should also declare
+    `__slots__ = ()` to keep it that way). The number of coordinates is validated
+    when a vector is created from user input, but not for the results of
+    add and scale, which are built from already valid vectors.
+    To work with many vectors at once, use a VectorCollection."""
+
+    __slots__ = ("coordinates",)
 
     @classmethod
     @abstractmethod
@@ -22,12 +30,26 @@ class CoordinateVector(Vector):
         return cls(*tuple(0 for _ in range(cls.dimension())))
 
     def __init__(self, *coordinates):
-        self.coordinates = tuple(coord for coord in coordinates)
+        if len(coordinates) != self.dimension():
+            raise TypeError(
+                f"{self.dimension()} coordinates are required, "
+                f"got {len(coordinates)}"
+            )
+        self.coordinates = coordinates
+
+    @classmethod
+    def _from_coordinates(cls, coordinates: tuple):
+        """Trusted constructor that skips the validation of the coordinates"""
+        vector = cls.__new__(cls)
+        vector.coordinates = coordinates
+        return vector
 
     def scale(self, scalar):
         # self.__class__ lets you return an instance of a concrete class from
         # the abstract superclass implementation
-        return self.__class__(*scale(scalar, self.coordinates))
+        return self.__class__._from_coordinates(
+            tuple(scalar * coord for coord in self.coordinates)
+        )
 
     def add(self, other):
         # self.__class__ lets you return an instance of a concrete class from
@@ -36,7 +58,9 @@ class CoordinateVector(Vector):
             self.coordinates
         ) != len(other.coordinates):
             raise TypeError("Incompatible vectors")
-        return self.__class__(*add(self.coordinates, other.coordinates))
+        return self.__class__._from_coordinates(
+            tuple(map(add, self.coordinates, other.coordinates))
+        )
 
     def __eq__(self, other):
         # For some reason self.__class__ == other.__class__ failed in the tests
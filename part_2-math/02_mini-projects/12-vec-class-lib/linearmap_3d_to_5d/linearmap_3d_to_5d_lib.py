@@ -102,12 +102,16 @@ class LinearMap_3D_to_5D(Vector):  # pylint: disable=C0103:invalid-name
 
 
 class Vector3D(CoordinateVector):
+    __slots__ = ()
+
     @classmethod
     def dimension(cls):
         return 3
 
 
 class Vector5D(CoordinateVector):
+    __slots__ = ()
+
     @classmethod
     def dimension(cls):
         return 5
@@ -4,6 +4,8 @@ from vecmatrix import Matrix
 
 
 class Matrix_5_by_3(Matrix):  # pylint: disable=C0103:invalid-name
+    __slots__ = ()
+
     @classmethod
     def rows(cls):
         return 5
@@ -16,9 +18,6 @@ class Matrix_5_by_3(Matrix):  # pylint: disable=C0103:invalid-name
         """Invoked when Matrix is on the left"""
         if isinstance(scalar_or_vector, Vec3):
             v = scalar_or_vector
-            return tuple(
-                row[0] * v.x + row[1] * v.y + row[2] * v.z
-                for row in self.matrix
-            )
+            return tuple((self.array @ (v.x, v.y, v.z)).tolist())
         else:
             return super().__rmul__(scalar_or_vector)
@@ -0,0 +1,68 @@
+"""Unit tests for the VectorCollection class"""
+import unittest
+
+import numpy as np
+
+from linearmap_3d_to_5d import Vector3D, Vector5D
+from tests.utils.testutils_coordvec import CoordVecTestUtils
+from tests.utils.testutils_linearmap_3d_to_5d_lib import (
+    LinearMap_3D_to_5DTestUtils,
+)
+from veccollection import VectorCollection
+
+
+class VectorCollectionTest(unittest.TestCase):
+    """
+    VectorCollection test class
+    """
+
+    @staticmethod
+    def random_vectors(n=100):
+        return [
+            Vector3D(*CoordVecTestUtils.random_coords(dimension=3))
+            for _ in range(n)
+        ]
+
+    def test_operations_match_vectors(self):
+        """
+        Validates that adding and scaling a collection gives the same vectors
+        as adding and scaling each vector.
+        """
+        us, vs = self.random_vectors(), self.random_vectors()
+        a = CoordVecTestUtils.random_scalar()
+        got = a * VectorCollection.from_vectors(
+            us
+        ) - VectorCollection.from_vectors(vs)
+        self.assertEqual(len(got), len(us))
+        for w, u, v in zip(got, us, vs):
+            self.assertIsInstance(w, Vector3D)
+            self.assertTrue(CoordVecTestUtils.is_approx_equal(w, a * u - v))
+
+    def test_transform(self):
+        """
+        Validates that applying a linear map to the collection is the same as
+        applying it to each vector.
+        """
+        linear_map = LinearMap_3D_to_5DTestUtils.random_vector()
+        us = self.random_vectors()
+        got = VectorCollection.from_vectors(us).transform(linear_map, Vector5D)
+        for w, u in zip(got, us):
+            self.assertTrue(np.allclose(w.coordinates, linear_map(u)))
+
+    def test_validation(self):
+        """
+        Validates that the dimensions are checked when creating collections
+        and vectors, and when combining them.
+        """
+        with self.assertRaises(TypeError):
+            VectorCollection(Vector3D, np.zeros((10, 5)))
+        with self.assertRaises(TypeError):
+            Vector3D(1, 2)
+        collection = VectorCollection(Vector3D, np.zeros((10, 3)))
+        with self.assertRaises(TypeError):
+            collection + collection[:5]
+        self.assertFalse(hasattr(Vector3D(1, 2, 3), "__dict__"))
+
+
+if __name__ == "__main__":
+    unittest.main()
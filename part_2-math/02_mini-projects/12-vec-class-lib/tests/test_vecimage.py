@@ -1,8 +1,11 @@
 """Unit tests for the ImageVector class which inherits from Vecotr"""
 import unittest
 
+import numpy as np
+
 from tests.utils.testutils_vecimg import ImageVectorTestUtils
 from tests.utils.testutils import TestUtils
+from vecimg import ImageVector
 
 
 class ImageVectorTest(unittest.TestCase):
@@ -29,6 +32,60 @@ class ImageVectorTest(unittest.TestCase):
             )
             ImageVectorTestUtils().check_vector_space(a, b, u, v, w)
 
+    def test_image_round_trip(self):
+        """
+        Validates that the pixels survive the conversion to a PIL image and
+        back, and that lazy linear combinations are computed correctly.
+        """
+        u = ImageVectorTestUtils.random_vector()
+        self.assertEqual(ImageVector(u.image()), u)
+
+        v = ImageVectorTestUtils.random_vector()
+        blend = 0.5 * u + 0.5 * v
+        self.assertTrue(
+            np.allclose(blend.array, 0.5 * (u.array + v.array), atol=1e-4)
+        )
+        self.assertEqual(blend.image().size, ImageVector.size)
+
+    def test_value_semantics(self):
+        """
+        Validates that changing the pixels of an image doesn't change the
+        combinations computed from it before the change.
+        """
+        u = ImageVector.zero((2, 2))
+        v = ImageVector([(1, 2, 3)] * 4, size=(2, 2))
+        total = u + v
+        u.put_pixel(0, 0, (100, 100, 100))
+        self.assertEqual(total.get_pixel(0, 0), (1, 2, 3))
+        self.assertEqual(u.get_pixel(0, 0), (100, 100, 100))
+        self.assertEqual((u + v).get_pixel(0, 0), (101, 102, 103))
+
+    def test_array_input_is_not_changed(self):
+        """
+        Validates that changing the pixels of an image created from an array
+        doesn't change the array, with or without reshaping it.
+        """
+        for shape in ((2, 2, 3), (4, 3)):
+            array = np.zeros(shape)
+            u = ImageVector(array, size=(2, 2))
+            u.put_pixel(1, 1, (100, 100, 100))
+            self.assertEqual(u.get_pixel(1, 1), (100, 100, 100))
+            self.assertFalse(array.any())
+
+    def test_custom_size(self):
+        """
+        Validates that images of a size other than ImageVector.size can be
+        created, combined and converted to PIL images.
+        """
+        width, height = 64, 48
+        u = ImageVector([(10, 20, 30)] * (width * height), size=(width, height))
+        zero = ImageVector.zero((width, height))
+        self.assertEqual(u.size, (width, height))
+        self.assertEqual((u + zero).image().size, (width, height))
+        self.assertEqual(u.get_pixel(63, 47), (10, 20, 30))
+        with self.assertRaises(ValueError):
+            u + ImageVector.zero()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,97 @@
+"""Unit tests for the Polynomial class"""
+import unittest
+from random import uniform
+
+import numpy as np
+
+from vecpoly import Polynomial
+
+
+class PolynomialTest(unittest.TestCase):
+    """
+    Polynomial test class
+    """
+
+    def test_evaluation(self):
+        """
+        Validates that the Horner evaluation matches the sum of the monomials
+        both for numbers and for arrays of points.
+        """
+        p = Polynomial(*[uniform(-1, 1) for _ in range(101)])
+        xs = np.linspace(-1.5, 1.5, 1000)
+        expected = sum(c * xs**n for n, c in enumerate(p.coefficients))
+        self.assertTrue(np.allclose(p(xs), expected))
+        self.assertAlmostEqual(
+            p(0.5), sum(c * 0.5**n for n, c in enumerate(p.coefficients))
+        )
+        self.assertEqual(Polynomial(1, 2, 3)(2), 17)
+        self.assertEqual(Polynomial()(2.0), 0)
+
+    def test_evaluate_all(self):
+        """
+        Validates that evaluating a list of polynomials of different degrees
+        at once matches evaluating each of them.
+        """
+        polynomials = [Polynomial(1, 2, 3), Polynomial(-1), Polynomial()]
+        xs = np.linspace(-2, 2, 7)
+        values = Polynomial.evaluate_all(polynomials, xs)
+        self.assertEqual(values.shape, (3, 7))
+        for row, p in zip(values, polynomials):
+            self.assertTrue(np.allclose(row, p(xs)))
+
+    def test_multiply(self):
+        """
+        Validates that the direct and FFT products match np.polymul
+        """
+        for degree in (3, 200):
+            p = Polynomial(*[uniform(-1, 1) for _ in range(degree + 1)])
+            q = Polynomial(*[uniform(-1, 1) for _ in range(degree + 1)])
+            expected = np.polymul(p.array[::-1], q.array[::-1])[::-1]
+            self.assertTrue(np.allclose((p * q).array, expected))
+        product = Polynomial(1, 1) * Polynomial(-1, 1)
+        self.assertEqual(product.coefficients, (-1, 0, 1))
+
+    def test_derivative_and_integral(self):
+        """
+        Validates the derivative and the antiderivative of a polynomial
+        """
+        p = Polynomial(-5, 2, 3)
+        self.assertEqual(p.derivative().coefficients, (2, 6))
+        self.assertEqual(p.integral(1).coefficients, (1, -5, 1, 1))
+        self.assertTrue(np.allclose(p.integral().derivative().array, p.array))
+
+    def test_large_integer_coefficients(self):
+        """
+        Validates that integer coefficients stay exact instead of overflowing
+        """
+        total = Polynomial(2**62, 1) + Polynomial(2**62)
+        self.assertEqual(total.coefficients, (2**63, 1))
+        p = Polynomial(1, 2**70)
+        self.assertEqual(p.coefficients, (1, 2**70))
+        self.assertEqual((p * p).coefficients, (1, 2**71, 2**140))
+        self.assertEqual(p(3), 3 * 2**70 + 1)
+
+    def test_small_integer_arrays(self):
+        """
+        Validates that integer arrays narrower than int64 don't wrap around
+        """
+        p = Polynomial.from_array(np.array([2**30], np.int32))
+        self.assertEqual(p.scale(4).coefficients, (2**32,))
+        self.assertEqual((p + p).coefficients, (2**31,))
+        self.assertEqual((p * p).coefficients, (2**60,))
+        q = Polynomial.from_array(np.array([100, -100], np.int8))
+        self.assertEqual(q.scale(100).coefficients, (10000, -10000))
+        r = Polynomial.from_array(np.array([2**64 - 1], np.uint64))
+        self.assertEqual((r + r).coefficients, (2**65 - 2,))
+
+    def test_from_array_shares_memory(self):
+        """
+        Validates that Polynomial.from_array doesn't copy the coefficients
+        """
+        coefficients = np.arange(5, dtype=np.float64)
+        p = Polynomial.from_array(coefficients)
+        self.assertTrue(np.shares_memory(p.array, coefficients))
+
+
+if __name__ == "__main__":
+    unittest.main()
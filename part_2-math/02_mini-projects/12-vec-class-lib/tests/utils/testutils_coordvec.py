@@ -11,6 +11,8 @@ class CoordVecTestUtils(TestUtils):
     @staticmethod
     def concrete_coordvec_class(dimension: int) -> CoordinateVector:
         class CoordinateVectorConcrete(CoordinateVector):
+            __slots__ = ()
+
             @classmethod
             def dimension(cls):
                 return dimension
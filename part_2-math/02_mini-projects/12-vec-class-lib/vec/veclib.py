@@ -7,6 +7,10 @@ from abc import ABC, abstractmethod
 class Vector(ABC):
     """Abstract class for vectors"""
 
+    # no instance attributes here, so subclasses that declare __slots__ don't
+    # get a per-instance __dict__
+    __slots__ = ()
+
     @classmethod
     @abstractmethod
     def zero(cls):
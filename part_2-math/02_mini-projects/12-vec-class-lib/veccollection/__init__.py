@@ -0,0 +1,9 @@
+"""
+__init__.py for the veccollection module that provides a container to
+operate on many CoordinateVectors at once.
+"""
+from veccollection.veccollectionlib import VectorCollection
+
+__all__ = [
+    "VectorCollection",
+]
@@ -0,0 +1,171 @@
+"""A container to operate on many CoordinateVectors at once"""
+import numpy as np
+
+from coordvec import CoordinateVector
+
+
+class VectorCollection:
+    """
+    A collection of N vectors of the same CoordinateVector class, stored as the
+    rows of an (N, dimension) float64 array, so a 3D vector takes 24 bytes.
+
+    Adding, scaling or applying a linear map to the collection operates on all
+    its vectors in a single NumPy operation, and the operators +, -, * and /
+    work as for individual vectors.
+
+    Args:
+        vector_class (type): the concrete CoordinateVector class of the
+            vectors.
+        array (array-like): the (N, vector_class.dimension()) coordinates of
+            the vectors, which are not copied if they already are a float64
+            array.
+    """
+
+    __slots__ = ("vector_class", "array")
+
+    def __init__(self, vector_class: type, array) -> None:
+        array = np.asarray(array, dtype=np.float64)
+        if array.ndim != 2 or array.shape[1] != vector_class.dimension():
+            raise TypeError(
+                f"An (N, {vector_class.dimension()}) array is required, "
+                f"got {array.shape}"
+            )
+        self.vector_class = vector_class
+        self.array = array
+
+    @classmethod
+    def _from_array(cls, vector_class: type, array: np.ndarray):
+        """Trusted constructor that skips the validation of the array"""
+        collection = cls.__new__(cls)
+        collection.vector_class = vector_class
+        collection.array = array
+        return collection
+
+    @classmethod
+    def from_vectors(cls, vectors, vector_class=None):
+        """
+        Returns the collection with the given CoordinateVectors. The class of
+        the vectors defaults to the class of the first one.
+        """
+        vectors = list(vectors)
+        if vector_class is None:
+            if not vectors:
+                raise ValueError("vector_class is required for no vectors")
+            vector_class = vectors[0].__class__
+        array = np.array(
+            [v.coordinates for v in vectors], dtype=np.float64
+        ).reshape(len(vectors), vector_class.dimension())
+        return cls._from_array(vector_class, array)
+
+    def __len__(self):
+        return len(self.array)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return VectorCollection._from_array(
+                self.vector_class, self.array[index]
+            )
+        return self.vector_class._from_coordinates(
+            tuple(self.array[index].tolist())
+        )
+
+    def __iter__(self):
+        for coordinates in self.array.tolist():
+            yield self.vector_class._from_coordinates(tuple(coordinates))
+
+    def add(self, other):
+        """
+        Adds another collection of the same length, vector by vector, or a
+        single vector to all the vectors of the collection.
+        """
+        if isinstance(other, VectorCollection):
+            if len(other) != len(self):
+                raise TypeError(
+                    f"Can't add collections of {len(self)} and {len(other)} "
+                    "vectors"
+                )
+            other_array = other.array
+        elif isinstance(other, CoordinateVector):
+            other_array = np.asarray(other.coordinates, dtype=np.float64)
+        else:
+            raise TypeError("Incompatible vectors")
+        if other_array.shape[-1] != self.array.shape[1]:
+            raise TypeError("Incompatible vectors")
+        return VectorCollection._from_array(
+            self.vector_class, self.array + other_array
+        )
+
+    def scale(self, scalar):
+        """
+        Scales all the vectors by the same scalar, or each vector by its own
+        scalar if given an array of N scalars.
+        """
+        scalar = np.asarray(scalar, dtype=np.float64)
+        if scalar.ndim == 1:
+            scalar = scalar[:, np.newaxis]
+        return VectorCollection._from_array(
+            self.vector_class, scalar * self.array
+        )
+
+    def transform(self, linear_map, vector_class=None):
+        """
+        Applies the linear map to all the vectors in a single matrix product.
+
+        Args:
+            linear_map: a Matrix, an object with a `matrix` tuple of rows (such
+                as LinearMap_3D_to_5D) or a 2D array-like, whose number of
+                columns is the dimension of the vectors.
+            vector_class (type, Optional): the CoordinateVector class of the
+                results. Defaults to the class of the vectors, which requires
+                the linear map to be square.
+
+        Returns:
+            VectorCollection: the images of the vectors.
+        """
+        matrix = getattr(linear_map, "array", None)
+        if matrix is None:
+            matrix = getattr(linear_map, "matrix", linear_map)
+        matrix = np.asarray(matrix, dtype=np.float64)
+        vector_class = vector_class or self.vector_class
+        if matrix.shape != (vector_class.dimension(), self.array.shape[1]):
+            raise TypeError(
+                f"Can't map {self.array.shape[1]}D vectors to "
+                f"{vector_class.dimension()}D with a {matrix.shape} matrix"
+            )
+        return VectorCollection._from_array(vector_class, self.array @ matrix.T)
+
+    def __add__(self, other):
+        return self.add(other)
+
+    def __sub__(self, other):
+        return self.add(-1 * other)
+
+    def __mul__(self, scalar):
+        return self.scale(scalar)
+
+    def __rmul__(self, scalar):
+        return self.scale(scalar)
+
+    def __neg__(self):
+        return self.scale(-1)
+
+    def __truediv__(self, scalar):
+        return self.scale(1.0 / np.asarray(scalar, dtype=np.float64))
+
+    def __eq__(self, other):
+        if not isinstance(other, VectorCollection):
+            return False
+        return self.vector_class is other.vector_class and np.array_equal(
+            self.array, other.array
+        )
+
+    def __str__(self):
+        """User friendly representation"""
+        return str([tuple(row) for row in self.array.tolist()])
+
+    def __repr__(self):
+        """Dev oriented representation for debugging purposes"""
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.vector_class.__qualname__}, {len(self)} vectors)"
+        )
@@ -1,68 +1,135 @@
 """A class for PIL images as Vectors"""
 
-from PIL import Image
 from pathlib import Path
 from typing import Sequence
 
+import numpy as np
+from PIL import Image
 
 from vec import Vector
 
 
 class ImageVector(Vector):
-    """A class for Images as vectors"""
+    """
+    A class for Images as vectors, backed by an (H, W, 3) float64 array.
+
+    Arithmetic is lazy: `add` and `scale` return ImageVectors that keep the
+    linear combination of the arrays of their operands (e.g. 0.5 * u + 0.5 * v
+    is kept as [(0.5, u), (0.5, v)]), which is only computed when the pixels
+    are needed, in a single output array and without intermediate images.
+    Images keep value semantics: put_pixel copies the array of an image before
+    changing it if a pending combination refers to it.
+    """
 
     size = (300, 300)
 
-    def __init__(self, input):
+    def __init__(self, input, size=None):
         """
         The constructor for the ImageVector class which accepts as input an
-        image file name or a list of pixels
+        image file name, a PIL image, an (H, W, 3) array or a list of pixels.
+
+        Images are resized to the given (width, height) size, which defaults to
+        ImageVector.size. Lists of pixels and (H * W, 3) arrays are arranged in
+        rows of the given size, and (H, W, 3) arrays keep their own size.
+        A float64 array is used without copying it, and is only copied if a
+        pixel of the image is changed.
         """
         if isinstance(input, (Path, str)):
-            img = Image.open(input).resize(ImageVector.size)
+            input = Image.open(input)
+        if isinstance(input, Image.Image):
+            img = input.resize(tuple(size or ImageVector.size))
             if img.mode != "RGB":
                 img = img.convert("RGB")
-            self.pixels = img.getdata()
-        elif isinstance(input, Sequence):
-            self.pixels = input
+            array = np.asarray(img, dtype=np.float64)
+        elif isinstance(input, (np.ndarray, Sequence)):
+            array = np.asarray(input, dtype=np.float64)
+            if array.ndim != 3:
+                width, height = size or ImageVector.size
+                array = array.reshape(height, width, 3)
+        else:
+            raise TypeError(f"Can't create an ImageVector from {type(input)}")
+
+        if array.shape[2:] != (3,):
+            raise ValueError(f"Expected RGB pixels, got shape {array.shape}")
+        self._array = array
+        self._terms = None
+        # the caller still owns an array used as it is
+        self._shared = isinstance(input, np.ndarray) and np.shares_memory(
+            array, input
+        )
+        self.size = (array.shape[1], array.shape[0])
+
+    @classmethod
+    def _combination(cls, terms, size):
+        """Returns a lazy ImageVector for the given (scalar, array) terms"""
+        vector = cls.__new__(cls)
+        vector._array = None
+        vector._terms = terms
+        vector._shared = False
+        vector.size = size
+        return vector
+
+    def _linear_terms(self):
+        if self._terms is not None:
+            return self._terms
+        # the combinations built from these terms refer to the array, so it
+        # must be copied before it's changed
+        self._shared = True
+        return [(1, self._array)]
+
+    @property
+    def array(self):
+        """
+        The (H, W, 3) float64 array with the pixels of the image, which is
+        computed from the pending linear combination the first time it's
+        needed.
+        """
+        if self._array is None:
+            (scalar, array), *terms = self._terms
+            out = np.multiply(array, scalar, dtype=np.float64)
+            scaled = np.empty_like(out) if terms else None
+            for scalar, array in terms:
+                np.multiply(array, scalar, out=scaled)
+                out += scaled
+            self._array, self._terms = out, None
+        return self._array
+
+    @property
+    def pixels(self):
+        """An (H * W, 3) view of the pixels of the image, row by row"""
+        return self.array.reshape(-1, 3)
 
     def image(self):
         """
-        Returns a PIL image constructed from the list of pixels stored in the
-        class
+        Returns a PIL image constructed from the pixels stored in the class,
+        with the color components clipped to [0, 255]
         """
-        img = Image.new("RGB", ImageVector.size)
-        img.putdata([(int(r), int(g), int(b)) for (r, g, b) in self.pixels])
-        return img
+        return Image.fromarray(
+            np.clip(self.array, 0, 255).astype(np.uint8), "RGB"
+        )
 
     def put_pixel(self, x, y, rgb):
-        _, height = ImageVector.size
-        pixel_idx = y * height + x
-        self.pixels[pixel_idx] = rgb
+        if self._shared:
+            self._array, self._shared = self.array.copy(), False
+        self.array[y, x] = rgb
 
     def get_pixel(self, x, y):
-        _, height = ImageVector.size
-        return self.pixels[y * height + x]
+        return tuple(self.array[y, x].tolist())
 
     @classmethod
-    def zero(cls):
-        total_pixels = cls.size[0] * cls.size[1]
-        return ImageVector([(0, 0, 0) for _ in range(total_pixels)])
+    def zero(cls, size=None):
+        width, height = size or cls.size
+        return cls(np.zeros((height, width, 3), dtype=np.float64))
 
     def add(self, other):
-        return ImageVector(
-            [
-                (r1 + r2, g1 + g2, b1 + b2)
-                for ((r1, g1, b1), (r2, g2, b2)) in zip(
-                    self.pixels, other.pixels
-                )
-            ]
-        )
+        if self.size != other.size:
+            raise ValueError(f"Can't add {self.size} and {other.size} images")
+        terms = self._linear_terms() + other._linear_terms()
+        return ImageVector._combination(terms, self.size)
 
     def scale(self, scalar):
-        return ImageVector(
-            [(scalar * r, scalar * g, scalar * b) for r, g, b in self.pixels]
-        )
+        terms = [(scalar * s, array) for s, array in self._linear_terms()]
+        return ImageVector._combination(terms, self.size)
 
     def _repr_png_(self):
         """
@@ -73,10 +140,7 @@ class ImageVector(Vector):
     def __eq__(self, other):
         if self.__class__ != other.__class__:
             return False
-        for (r1, g1, b1), (r2, g2, b2) in zip(self.pixels, other.pixels):
-            if r1 != r2 or g1 != g2 or b1 != b2:
-                return False
-        return True
+        return np.array_equal(self.array, other.array)
 
     def __str__(self):
         """User friendly representation for users of the code"""
@@ -1,23 +1,50 @@
 """A base class representing matrices as vectors"""
 from abc import abstractmethod
 
+import numpy as np
+
 from vec import Vector
 
 
 class Matrix(Vector):
-    """A class that represents a matrix as a Vector"""
+    """
+    A class that represents a matrix as a Vector.
+
+    The entries are kept in a (rows, columns) NumPy array (`array`) in the
+    only slot of the instance. The shape is validated when a matrix is created
+    from user input, but not for the results of add and scale, which are built
+    from already valid matrices.
+    """
+
+    __slots__ = ("array",)
 
     def __init__(self, matrix: tuple[tuple[float]]):
-        if len(matrix) != self.rows() or any(
-            [len(matrix_row) != self.columns() for matrix_row in matrix]
-        ):
+        try:
+            array = np.asarray(matrix)
+        except ValueError:
+            array = None
+        if array is None or array.shape != (self.rows(), self.columns()):
             raise TypeError(
                 (
                     f"A tuple of {self.rows()} rows "
                     f"by {self.columns()} columns is required"
                 )
             )
-        self.matrix = matrix
+        if array.dtype.kind not in "iuf":
+            array = array.astype(np.float64)
+        self.array = array
+
+    @classmethod
+    def _from_array(cls, array: np.ndarray):
+        """Trusted constructor that skips the validation of the array"""
+        matrix = cls.__new__(cls)
+        matrix.array = array
+        return matrix
+
+    @property
+    def matrix(self) -> tuple[tuple[float]]:
+        """The entries of the matrix as a tuple of rows"""
+        return tuple(map(tuple, self.array.tolist()))
 
     @classmethod
     @abstractmethod
@@ -31,37 +58,23 @@ class Matrix(Vector):
 
     @classmethod
     def zero(cls):
-        return cls(
-            tuple(
-                tuple(0 for _ in range(cls.columns()))
-                for _ in range(cls.rows())
-            )
+        return cls._from_array(
+            np.zeros((cls.rows(), cls.columns()), dtype=np.int64)
         )
 
     def add(self, other):
         if not isinstance(other, self.__class__):
             raise TypeError("Incompatible vectors")
 
-        return self.__class__(
-            tuple(
-                tuple(a + b for a, b in zip(row1, row2))
-                for row1, row2 in zip(self.matrix, other.matrix)
-            )
-        )
+        return self.__class__._from_array(self.array + other.array)
 
     def scale(self, scalar):
-        return self.__class__(
-            tuple(tuple(scalar * elem for elem in row) for row in self.matrix)
-        )
+        return self.__class__._from_array(scalar * self.array)
 
     def __eq__(self, other):
         if self.__class__ != other.__class__:
             return False
-        for r1, r2 in zip(self.matrix, other.matrix):
-            for e1, e2 in zip(r1, r2):
-                if e1 != e2:
-                    return False
-        return True
+        return np.array_equal(self.array, other.array)
 
     def __str__(self):
         """User-friendly representation for users of the code"""
@@ -1,8 +1,35 @@
 """A class that represent polynomials as Vectors"""
-from itertools import zip_longest
+import numpy as np
 
 from vec import Vector
 
+# Below this number of coefficients, products are computed with a direct
+# convolution, which is faster than the FFT for small degrees
+FFT_THRESHOLD = 64
+
+_INT64_MAX = np.iinfo(np.int64).max
+
+
+def _magnitude(array):
+    """
+    Largest absolute value of the integer coefficients, as a Python int, or 0
+    if the coefficients aren't integers
+    """
+    if array.size == 0 or array.dtype.kind not in "iuO":
+        return 0
+    return max(int(array.max()), -int(array.min()))
+
+
+def _exact(bound, *arrays):
+    """
+    Returns the integer coefficient arrays unchanged if the results of an
+    operation on them are bounded by a value that fits in an int64, and as
+    object arrays of Python ints otherwise, so that they never wrap around
+    """
+    if any(a.dtype.kind not in "iuO" for a in arrays) or bound <= _INT64_MAX:
+        return arrays
+    return tuple(a.astype(object) for a in arrays)
+
 
 class Polynomial(Vector):
     """
@@ -11,27 +38,115 @@ class Polynomial(Vector):
     x^1, x^2, etc.
 
     For example, 3*x^2 + 2*x - 5 is represented as Polynomial(-5, 2, 3)
+
+    The coefficients are kept in a 1D NumPy array (`array`), so polynomials can
+    also be created from an existing array without copying it with
+    `Polynomial.from_array`.
     """
 
     def __init__(self, *coefficients: float) -> None:
-        self.coefficients = coefficients
+        self.array = Polynomial._as_coefficients(coefficients)
+
+    @staticmethod
+    def _as_coefficients(coefficients):
+        array = np.asarray(coefficients)
+        # every integer type other than int64 is converted, so that the bounds
+        # checked by _exact against the int64 range are valid for the results
+        other_integers = array.dtype.kind in "iu" and array.dtype != np.int64
+        if array.size and (
+            other_integers
+            or array.dtype.kind == "O"
+            and all(isinstance(c, (int, np.integer)) for c in array.flat)
+        ):
+            # integers that don't fit in an int64 are kept as Python ints
+            if _magnitude(array) > _INT64_MAX:
+                array = np.array([int(c) for c in array.flat], dtype=object)
+            else:
+                array = array.astype(np.int64)
+        elif array.size == 0 or array.dtype.kind not in "iuf":
+            array = np.asarray(coefficients, dtype=np.float64)
+        return array.reshape(-1)
+
+    @classmethod
+    def from_array(cls, array):
+        """
+        Returns the polynomial whose coefficients are given by the 1D array,
+        starting from x^0, sharing the array instead of copying it. Integer
+        arrays of a type other than int64 are converted to int64.
+        """
+        polynomial = cls.__new__(cls)
+        polynomial.array = cls._as_coefficients(array)
+        return polynomial
+
+    @property
+    def coefficients(self):
+        """The coefficients of the polynomial as a tuple, starting from x^0"""
+        return tuple(self.array.tolist())
 
     @classmethod
     def zero(cls):
-        Polynomial(0)
+        return cls(0)
 
     def add(self, other):
-        return Polynomial(
-            *[
-                c1 + c2
-                for c1, c2 in zip_longest(
-                    self.coefficients, other.coefficients, fillvalue=0
-                )
-            ]
+        shorter, longer = sorted(
+            _exact(
+                _magnitude(self.array) + _magnitude(other.array),
+                self.array,
+                other.array,
+            ),
+            key=len,
         )
+        result = longer.astype(np.result_type(shorter, longer), copy=True)
+        result[: len(shorter)] += shorter
+        return Polynomial.from_array(result)
 
     def scale(self, scalar):
-        return Polynomial(*[scalar * c for c in self.coefficients])
+        array = self.array
+        if isinstance(scalar, (int, np.integer)):
+            (array,) = _exact(abs(int(scalar)) * _magnitude(array), array)
+        return Polynomial.from_array(scalar * array)
+
+    def multiply(self, other):
+        """
+        Returns the product of the polynomials, computed with a direct
+        convolution of the coefficients for small degrees and integer
+        coefficients (which keeps them exact), and with the FFT otherwise.
+        """
+        a, b = self.array, other.array
+        if a.size == 0 or b.size == 0:
+            return Polynomial.zero()
+        if a.dtype.kind in "iuO" and b.dtype.kind in "iuO":
+            bound = _magnitude(a) * _magnitude(b) * min(a.size, b.size)
+            return Polynomial.from_array(np.convolve(*_exact(bound, a, b)))
+        if min(a.size, b.size) < FFT_THRESHOLD:
+            return Polynomial.from_array(np.convolve(a, b))
+        n = a.size + b.size - 1
+        fft_size = 1 << (n - 1).bit_length()
+        product = np.fft.irfft(
+            np.fft.rfft(a, fft_size) * np.fft.rfft(b, fft_size), fft_size
+        )
+        return Polynomial.from_array(product[:n])
+
+    def __mul__(self, other):
+        if isinstance(other, Polynomial):
+            return self.multiply(other)
+        return self.scale(other)
+
+    def derivative(self):
+        """Returns the derivative of the polynomial"""
+        (array,) = _exact(_magnitude(self.array) * self.array.size, self.array)
+        powers = np.arange(1, array.size)
+        return Polynomial.from_array(array[1:] * powers)
+
+    def integral(self, constant=0):
+        """
+        Returns the antiderivative of the polynomial whose value at x = 0 is the
+        given constant
+        """
+        powers = np.arange(1, self.array.size + 1)
+        return Polynomial.from_array(
+            np.concatenate([[constant], self.array / powers])
+        )
 
     def __str__(self):
         """User-oriented string representation"""
@@ -91,7 +206,45 @@ class Polynomial(Vector):
         return f"$ {' + '.join(monomials)} $"
 
     def __call__(self, x):
-        return sum(
-            coefficient * x**power
-            for power, coefficient in enumerate(self.coefficients)
-        )
+        """
+        Evaluates the polynomial at x using Horner's method. x can be a number
+        or a NumPy array, in which case the polynomial is evaluated at all its
+        points at once.
+        """
+        if self.array.size == 0:
+            return 0 * x
+        if isinstance(x, np.ndarray):
+            coefficients = self.array
+            if coefficients.dtype.kind == "O":
+                coefficients = coefficients.astype(np.result_type(x, 0.0))
+            dtype = np.result_type(x, coefficients)
+            result = np.full(x.shape, coefficients[-1], dtype)
+            for coefficient in coefficients[-2::-1]:
+                result *= x
+                result += coefficient
+            return result
+        result = 0
+        for coefficient in reversed(self.coefficients):
+            result = result * x + coefficient
+        return result
+
+    @staticmethod
+    def evaluate_all(polynomials, x):
+        """
+        Evaluates each of the polynomials at each of the points of x, returning
+        a (len(polynomials), *x.shape) array. The coefficients are stacked in a
+        matrix, so the evaluation is done for all the polynomials at once.
+        """
+        x = np.asarray(x)
+        degree = max((p.array.size for p in polynomials), default=0)
+        matrix = np.zeros((len(polynomials), max(degree, 1)))
+        for row, p in zip(matrix, polynomials):
+            row[: p.array.size] = p.array
+        x_axes = (np.newaxis,) * x.ndim
+        result = np.broadcast_to(
+            matrix[(slice(None), -1) + x_axes], (len(polynomials), *x.shape)
+        ).copy()
+        for column in range(matrix.shape[1] - 2, -1, -1):
+            result *= x
+            result += matrix[(slice(None), column) + x_axes]
+        return result
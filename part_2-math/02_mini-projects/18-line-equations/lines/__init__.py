@@ -12,6 +12,12 @@ from lines.linelib import (
     fn_parametric_line,
     fn_std_form_line,
     fn_secant_line,
+    intersect_all_pairs,
+    intersect_pairs,
+    intersect_segments,
+    point_segment_distances,
+    SegmentIntersections,
+    standard_form_coefficients,
 )
 
 __all__ = [
@@ -21,4 +27,10 @@ __all__ = [
     "fn_parametric_line",
     "fn_std_form_line",
     "fn_secant_line",
+    "intersect_all_pairs",
+    "intersect_pairs",
+    "intersect_segments",
+    "point_segment_distances",
+    "SegmentIntersections",
+    "standard_form_coefficients",
 ]
@@ -1,8 +1,19 @@
 """
 Library with the functions that return the line equations
+
+Besides the helpers for a single line, the module provides array kernels that
+work on many segments at once, given as (..., 2, 2) arrays with the two end
+points of each segment:
++ `standard_form_coefficients` returns the (a, b, c) coefficients of the lines.
++ `intersect_segments`, `intersect_all_pairs` and `intersect_pairs` intersect
+  them with Cramer's rule, masking the parallel lines instead of raising, and
+  with a 1-D overlap test for the collinear ones.
++ `point_segment_distances` returns the distances from points to segments.
 """
 
-from typing import Callable, Tuple
+from typing import Callable, NamedTuple, Tuple
+
+import numpy as np
 
 
 def fn_parametric_line(
@@ -82,3 +93,179 @@ def fn_secant_line(
     p2 = (x2, f(x2))
     a, b, c = canonical_line_coefficients(p1, p2)
     return fn_std_form_line(a, b, c)
+
+
+class SegmentIntersections(NamedTuple):
+    """
+    The intersections of pairs of segments, as returned by
+    `intersect_segments`.
+
+    Attributes:
+        points (np.ndarray): The (..., 2) intersection points of the lines
+            through the segments, NaN for the parallel ones except for the
+            collinear segments that overlap, which get the first point of
+            segments1 in the overlap.
+        intersect (np.ndarray): The (...,) boolean mask of the pairs of
+            segments that intersect, including the collinear ones that
+            overlap.
+        parallel (np.ndarray): The (...,) boolean mask of the pairs of
+            segments whose lines are parallel (or coincident).
+    """
+
+    points: np.ndarray
+    intersect: np.ndarray
+    parallel: np.ndarray
+
+
+def standard_form_coefficients(segments) -> np.ndarray:
+    """
+    Returns the (..., 3) array with the coefficients (a, b, c) of the lines
+    "ax + by = c" through the (..., 2, 2) segments, as
+    `canonical_line_coefficients` does for a single pair of points.
+    """
+    segments = np.asarray(segments, dtype=np.float64)
+    (x1, y1), (x2, y2) = np.moveaxis(segments, (-2, -1), (0, 1))
+    return np.stack([y2 - y1, x1 - x2, x1 * y2 - x2 * y1], axis=-1)
+
+
+def _segment_parameters(points, segments) -> np.ndarray:
+    """
+    Returns the parameters t of the projections of the points on the lines
+    "r(t) = u + t (w - u)" through the segments, 0 for degenerate segments.
+    """
+    u, w = segments[..., 0, :], segments[..., 1, :]
+    direction = w - u
+    squared_length = np.sum(direction**2, axis=-1)
+    dot = np.sum((points - u) * direction, axis=-1)
+    return np.divide(
+        dot,
+        squared_length,
+        out=np.zeros(np.broadcast(dot, squared_length).shape),
+        where=squared_length > 0,
+    )
+
+
+def intersect_segments(
+    segments1, segments2, tolerance: float = 1e-9
+) -> SegmentIntersections:
+    """
+    Intersects each segment of segments1 with the matching one of segments2.
+
+    The intersection of the lines "a1 x + b1 y = c1" and "a2 x + b2 y = c2" is
+    computed in closed form with Cramer's rule, and the lines are considered
+    parallel when the determinant a1 b2 - a2 b1 is zero relative to the
+    lengths of the segments. Parallel segments intersect when they lie on the
+    same line and overlap along it.
+
+    Args:
+        segments1 (array-like): The (..., 2, 2) first segments.
+        segments2 (array-like): The (..., 2, 2) second segments, which
+            broadcast against segments1.
+        tolerance (float): How far (as a fraction of the length of each
+            segment) the intersection may be beyond the end points.
+
+    Returns:
+        SegmentIntersections: The intersection points and the masks of the
+            segments that intersect and of the parallel ones.
+    """
+    segments1 = np.asarray(segments1, dtype=np.float64)
+    segments2 = np.asarray(segments2, dtype=np.float64)
+    a1, b1, c1 = np.moveaxis(standard_form_coefficients(segments1), -1, 0)
+    a2, b2, c2 = np.moveaxis(standard_form_coefficients(segments2), -1, 0)
+
+    det = a1 * b2 - a2 * b1
+    # a and b are the components of the direction of each segment
+    scale = np.hypot(a1, b1) * np.hypot(a2, b2)
+    parallel = np.abs(det) <= 1e-12 * scale
+    with np.errstate(divide="ignore", invalid="ignore"):
+        det = np.where(parallel, np.nan, det)
+        points = np.stack(
+            [(c1 * b2 - c2 * b1) / det, (a1 * c2 - a2 * c1) / det], axis=-1
+        )
+
+    t1 = _segment_parameters(points, segments1)
+    t2 = _segment_parameters(points, segments2)
+    intersect = (
+        ~parallel
+        & (t1 >= -tolerance)
+        & (t1 <= 1 + tolerance)
+        & (t2 >= -tolerance)
+        & (t2 <= 1 + tolerance)
+    )
+
+    overlap, start = _collinear_overlaps(segments1, segments2, tolerance)
+    overlap &= parallel
+    points = np.where(overlap[..., np.newaxis], start, points)
+    return SegmentIntersections(points, intersect | overlap, parallel)
+
+
+def _collinear_overlaps(segments1, segments2, tolerance):
+    """
+    Returns the mask of the pairs of segments that lie on the same line and
+    overlap along it, and the first point of segments1 in the overlap.
+    """
+    u1, w1 = segments1[..., 0, :], segments1[..., 1, :]
+    direction = w1 - u1
+    squared_length = np.sum(direction**2, axis=-1)
+    # the cross products are the distances from the ends of segments2 to the
+    # line through segments1, times the length of segments1
+    offsets = segments2 - u1[..., np.newaxis, :]
+    cross = (
+        direction[..., np.newaxis, 0] * offsets[..., 1]
+        - direction[..., np.newaxis, 1] * offsets[..., 0]
+    )
+    collinear = (
+        (squared_length > 0)
+        & (np.sum((segments2[..., 1, :] - segments2[..., 0, :]) ** 2, -1) > 0)
+        & (np.abs(cross).max(axis=-1) <= tolerance * squared_length)
+    )
+    # the ends of segments2 along segments1, which spans [0, 1]
+    ends = _segment_parameters(segments2, segments1[..., np.newaxis, :, :])
+    first, last = ends.min(axis=-1), ends.max(axis=-1)
+    overlap = collinear & (first <= 1 + tolerance) & (last >= -tolerance)
+    start = u1 + np.clip(first, 0, 1)[..., np.newaxis] * direction
+    return overlap, start
+
+
+def intersect_all_pairs(
+    segments1, segments2=None, tolerance: float = 1e-9
+) -> SegmentIntersections:
+    """
+    Intersects every one of the (N, 2, 2) segments1 with every one of the
+    (M, 2, 2) segments2 (segments1 if not given), so the results have shape
+    (N, M).
+    """
+    segments1 = np.asarray(segments1, dtype=np.float64)
+    segments2 = segments1 if segments2 is None else np.asarray(segments2)
+    return intersect_segments(
+        segments1[:, np.newaxis], segments2[np.newaxis, :], tolerance
+    )
+
+
+def intersect_pairs(
+    segments, pairs, tolerance: float = 1e-9
+) -> SegmentIntersections:
+    """
+    Intersects the pairs of the (N, 2, 2) segments given by the (K, 2) array of
+    indices pairs, so the results have shape (K,). Use it instead of
+    `intersect_all_pairs` when only a few of the N^2 pairs are candidates
+    (e.g. after a bounding box test).
+    """
+    segments = np.asarray(segments, dtype=np.float64)
+    i, j = np.asarray(pairs, dtype=np.intp).reshape(-1, 2).T
+    return intersect_segments(segments[i], segments[j], tolerance)
+
+
+def point_segment_distances(points, segments) -> np.ndarray:
+    """
+    Returns the distances from the (..., 2) points to the closest points of the
+    (..., 2, 2) segments, which broadcast against each other. For instance,
+    points[:, np.newaxis] and segments give the (N, M) distances of N points
+    to M segments.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    segments = np.asarray(segments, dtype=np.float64)
+    t = np.clip(_segment_parameters(points, segments), 0, 1)
+    u, w = segments[..., 0, :], segments[..., 1, :]
+    closest = u + t[..., np.newaxis] * (w - u)
+    return np.hypot(*np.moveaxis(points - closest, -1, 0))
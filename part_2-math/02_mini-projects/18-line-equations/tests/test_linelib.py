@@ -0,0 +1,158 @@
+"""Unit tests for the segment kernels of linelib"""
+import unittest
+
+import numpy as np
+
+from lines.linelib import (
+    canonical_line_coefficients,
+    intersect_all_pairs,
+    intersect_pairs,
+    intersect_segments,
+    point_segment_distances,
+    standard_form_coefficients,
+)
+
+
+def intersect_one_pair(s1, s2):
+    """
+    Intersects two segments with np.linalg.solve, returning None for the
+    parallel ones
+    """
+    (a1, b1, c1), (a2, b2, c2) = (
+        canonical_line_coefficients(*s1),
+        canonical_line_coefficients(*s2),
+    )
+    try:
+        point = np.linalg.solve([[a1, b1], [a2, b2]], [c1, c2])
+    except np.linalg.LinAlgError:
+        return None
+    (u1, w1), (u2, w2) = np.asarray(s1), np.asarray(s2)
+    within = all(
+        -1e-9 <= np.dot(point - u, w - u) / np.dot(w - u, w - u) <= 1 + 1e-9
+        for u, w in ((u1, w1), (u2, w2))
+    )
+    return point, within
+
+
+class IntersectSegmentsTest(unittest.TestCase):
+    """
+    intersect_segments, intersect_all_pairs and intersect_pairs test class
+    """
+
+    def setUp(self):
+        self.segments = np.random.default_rng(0).uniform(-10, 10, (60, 2, 2))
+
+    def test_standard_form_coefficients(self):
+        """
+        Validates the coefficients against canonical_line_coefficients
+        """
+        expected = [canonical_line_coefficients(*s) for s in self.segments]
+        got = standard_form_coefficients(self.segments)
+        self.assertTrue(np.allclose(got, expected))
+
+    def test_matches_pairwise_solve(self):
+        """
+        Validates every pair of random segments against np.linalg.solve
+        """
+        result = intersect_all_pairs(self.segments)
+        self.assertEqual(result.intersect.shape, (60, 60))
+        for i, s1 in enumerate(self.segments):
+            for j, s2 in enumerate(self.segments):
+                if i == j:
+                    continue
+                point, within = intersect_one_pair(s1, s2)
+                self.assertTrue(np.allclose(result.points[i, j], point))
+                self.assertEqual(result.intersect[i, j], within)
+        self.assertTrue(np.array_equal(result.intersect, result.intersect.T))
+        self.assertGreater(np.triu(result.intersect, k=1).sum(), 0)
+
+    def test_intersect_pairs(self):
+        """
+        Validates that intersect_pairs gives the entries of the pairs given
+        """
+        all_pairs = intersect_all_pairs(self.segments)
+        pairs = [(0, 1), (5, 3), (10, 59), (7, 7)]
+        result = intersect_pairs(self.segments, pairs)
+        for k, (i, j) in enumerate(pairs):
+            self.assertEqual(result.intersect[k], all_pairs.intersect[i, j])
+            self.assertTrue(
+                np.allclose(
+                    result.points[k], all_pairs.points[i, j], equal_nan=True
+                )
+            )
+        empty = intersect_pairs(self.segments, [])
+        self.assertEqual(empty.points.shape, (0, 2))
+
+    def test_parallel_segments(self):
+        """
+        Validates that parallel segments only intersect when they are
+        collinear and overlap, at the first point of the first segment in the
+        overlap
+        """
+        cases = [
+            # (segment1, segment2, intersect, point)
+            ([(0, 0), (2, 0)], [(1, 0), (3, 0)], True, (1, 0)),
+            ([(1, 0), (3, 0)], [(0, 0), (2, 0)], True, (1, 0)),
+            ([(0, 0), (2, 0)], [(3, 0), (1, 0)], True, (1, 0)),
+            ([(0, 0), (4, 0)], [(1, 0), (2, 0)], True, (1, 0)),
+            ([(0, 0), (2, 0)], [(2, 0), (3, 0)], True, (2, 0)),
+            ([(1, 1), (3, 3)], [(4, 4), (2, 2)], True, (2, 2)),
+            ([(0, 5), (0, 1)], [(0, 0), (0, 2)], True, (0, 2)),
+            ([(0, 0), (2, 0)], [(3, 0), (5, 0)], False, None),
+            ([(0, 0), (2, 0)], [(0, 1), (2, 1)], False, None),
+            ([(0, 0), (2, 0)], [(1, 0), (1, 0)], False, None),
+        ]
+        for segment1, segment2, intersect, point in cases:
+            result = intersect_segments(segment1, segment2)
+            self.assertTrue(result.parallel, (segment1, segment2))
+            self.assertEqual(result.intersect, intersect, (segment1, segment2))
+            if point is None:
+                self.assertTrue(np.isnan(result.points).all())
+            else:
+                self.assertTrue(np.allclose(result.points, point))
+
+    def test_overlaps_in_batches(self):
+        """
+        Validates the collinear overlaps when the segments are broadcast
+        """
+        segments = np.array(
+            [[(0, 0), (2, 0)], [(1, 0), (3, 0)], [(5, 0), (6, 0)]]
+        )
+        result = intersect_all_pairs(segments)
+        self.assertEqual(
+            result.intersect.tolist(),
+            [[True, True, False], [True, True, False], [False, False, True]],
+        )
+        self.assertTrue(np.allclose(result.points[0, 1], (1, 0)))
+        self.assertTrue(np.allclose(result.points[1, 0], (1, 0)))
+
+
+class PointSegmentDistancesTest(unittest.TestCase):
+    """
+    point_segment_distances test class
+    """
+
+    def test_matches_sampled_segments(self):
+        """
+        Validates the distances against the closest of many points sampled on
+        each segment
+        """
+        rng = np.random.default_rng(1)
+        points = rng.uniform(-10, 10, (20, 2))
+        segments = rng.uniform(-10, 10, (15, 2, 2))
+        got = point_segment_distances(points[:, np.newaxis], segments)
+        self.assertEqual(got.shape, (20, 15))
+        t = np.linspace(0, 1, 10_001)[:, np.newaxis]
+        for j, (u, w) in enumerate(segments):
+            samples = u + t * (w - u)
+            expected = np.hypot(*(points[:, np.newaxis] - samples).T).min(0)
+            self.assertTrue(np.allclose(got[:, j], expected, atol=1e-2))
+
+    def test_degenerate_segments(self):
+        """Validates the distance to a segment that is a single point"""
+        got = point_segment_distances([(3, 4)], [[(0, 0), (0, 0)]])
+        self.assertTrue(np.allclose(got, [5]))
+
+
+if __name__ == "__main__":
+    unittest.main()
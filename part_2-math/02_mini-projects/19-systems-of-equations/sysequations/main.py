@@ -1,10 +1,29 @@
 """
 Solving system of linear equations with NumPy
+
+Without arguments, the program reads one system interactively. Otherwise, it
+solves the system(s) given in files:
+
+    python -m sysequations.main MATRIX RHS [--output OUTPUT] [--multiple-rhs]
+
+See `sysequations.solver.load_matrix` for the supported matrix files, which
+include stacks of dense systems and sparse matrices.
 """
 
+import argparse
+
 import numpy as np
 
-if __name__ == "__main__":
+from sysequations.solver import (
+    MAX_CONDITION,
+    load_matrix,
+    load_rhs,
+    solve,
+    solve_batch,
+)
+
+
+def solve_interactively():
     # Ask the user for the number of equations
     n = int(input("Enter the number of equations: "))
 
@@ -26,7 +45,7 @@ if __name__ == "__main__":
     A = np.array(A)
     C = np.array(C)
 
-    solutions = np.linalg.solve(A, C)
+    solutions = solve(A, C)
     print(f"The solutions are: {solutions}")
     print("=" * 50)
     for i, row in enumerate(A):
@@ -37,3 +56,59 @@ if __name__ == "__main__":
         print(f"x{i + 1} = {solutions[i]}")
     print("=" * 50)
 
+
+def solve_files(args):
+    a = load_matrix(args.matrix)
+    b = load_rhs(args.rhs)
+    if isinstance(a, np.ndarray) and a.ndim > 2:
+        solution = solve_batch(
+            a, b, args.max_condition, multiple_rhs=args.multiple_rhs
+        )
+        x = solution.x
+        print(
+            f"Solved {solution.ok.sum()} of {solution.ok.size} systems "
+            f"({np.isinf(solution.conditions).sum()} singular)"
+        )
+    else:
+        x = solve(a, b, args.max_condition)
+
+    if args.output:
+        np.save(args.output, x)
+    else:
+        print(x)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Solve systems of linear equations"
+    )
+    parser.add_argument(
+        "matrix",
+        nargs="?",
+        help="file with the matrix of the system (.npy, .mtx, .npz or text)",
+    )
+    parser.add_argument(
+        "rhs", nargs="?", help="file with the right-hand side (.npy or text)"
+    )
+    parser.add_argument(
+        "-o", "--output", help=".npy file where the solutions are saved"
+    )
+    parser.add_argument(
+        "--max-condition",
+        type=float,
+        default=MAX_CONDITION,
+        help="condition number above which a system is rejected",
+    )
+    parser.add_argument(
+        "--multiple-rhs",
+        action="store_true",
+        help="the right-hand side of a stack of systems is (N, n, k)",
+    )
+    args = parser.parse_args()
+
+    if args.matrix is None:
+        solve_interactively()
+    elif args.rhs is None:
+        parser.error("the right-hand side file is required")
+    else:
+        solve_files(args)
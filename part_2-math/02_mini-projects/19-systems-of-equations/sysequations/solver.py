@@ -0,0 +1,314 @@
+"""
+Solving many systems of linear equations at once with NumPy, and large sparse
+systems with SciPy.
+
++ `solve` solves a single system and raises an error if it's singular or
+  ill-conditioned.
++ `solve_batch` solves a stack of systems of the same size in a single call,
+  reporting the condition number of each of them instead of raising.
++ `factorize` factorizes a (dense or sparse) matrix once, so it can be solved
+  against many right-hand sides without factorizing it again.
++ `load_matrix` and `load_rhs` read systems from files, including sparse
+  matrices in COO (Matrix Market) and CSR (SciPy .npz) formats.
+
+The condition numbers are 1-norm estimates: the inverse of dense matrices is
+computed in the same call that solves the systems, so the condition number
+comes at no extra factorization, and for sparse matrices it's estimated from a
+few solves with the LU factorization, without computing the inverse.
+
+SciPy is only required for sparse matrices (install the `sparse` extra).
+"""
+
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+# Systems whose condition number is above this are considered ill-conditioned,
+# as about 12 of the 16 significant digits of a float64 may be lost
+MAX_CONDITION = 1e12
+
+
+class SingularSystemError(np.linalg.LinAlgError):
+    """Raised when the matrix of a system is singular."""
+
+
+class IllConditionedSystemError(np.linalg.LinAlgError):
+    """
+    Raised when the condition number of the matrix of a system is so large
+    that the solution is not reliable.
+
+    Attributes:
+        condition (float): The estimated condition number of the matrix.
+    """
+
+    def __init__(self, condition: float) -> None:
+        super().__init__(
+            f"The system is ill-conditioned (condition number {condition:.3g})"
+        )
+        self.condition = condition
+
+
+class BatchSolution(NamedTuple):
+    """
+    The solutions of a stack of systems, as returned by `solve_batch`.
+
+    Attributes:
+        x (np.ndarray): The (..., n) or (..., n, k) solutions, NaN for the
+            systems that are singular or ill-conditioned.
+        conditions (np.ndarray): The (...,) 1-norm condition numbers of the
+            matrices, inf for the singular ones.
+        ok (np.ndarray): The (...,) boolean mask of the systems whose solution
+            is reliable.
+    """
+
+    x: np.ndarray
+    conditions: np.ndarray
+    ok: np.ndarray
+
+
+def _is_sparse(a) -> bool:
+    return hasattr(a, "tocsc")
+
+
+def _scipy_sparse():
+    try:
+        # pylint: disable=import-outside-toplevel
+        import scipy.sparse
+        import scipy.sparse.linalg
+    except ImportError as err:
+        raise ImportError(
+            "Sparse systems require SciPy: pip install sysequations[sparse]"
+        ) from err
+    return scipy.sparse
+
+
+def _norm1(a: np.ndarray) -> np.ndarray:
+    """The 1-norm (maximum absolute column sum) of a stack of matrices."""
+    return np.abs(a).sum(axis=-2).max(axis=-1)
+
+
+def _inverse_and_solution(a: np.ndarray, rhs: np.ndarray):
+    """
+    Solve the stacked systems a x = [rhs | I] for the (..., n, k) right-hand
+    sides, which gives the solutions and the inverses of the matrices with a
+    single factorization of each of them.
+    """
+    n = a.shape[-1]
+    identity = np.broadcast_to(np.eye(n), (*a.shape[:-2], n, n))
+    rhs = np.broadcast_to(rhs, (*a.shape[:-2], *rhs.shape[-2:]))
+    solution = np.linalg.solve(a, np.concatenate([rhs, identity], axis=-1))
+    return solution[..., :-n], solution[..., -n:]
+
+
+def solve_batch(
+    a, b, max_condition: float = MAX_CONDITION, multiple_rhs: bool = False
+) -> BatchSolution:
+    """
+    Solve a stack of dense systems of the same size in a single call.
+
+    Args:
+        a (array-like): The (..., n, n) matrices of the systems.
+        b (array-like): The (..., n) right-hand sides, one per system, or
+            (..., n, k) with multiple_rhs to solve each system for k
+            right-hand sides. The leading dimensions are broadcast to those
+            of a, so e.g. a single (n,) right-hand side is used for all the
+            systems.
+        max_condition (float): The condition number above which a system is
+            considered ill-conditioned.
+        multiple_rhs (bool): Whether the last two dimensions of b are the
+            (n, k) right-hand sides of each system.
+
+    Returns:
+        BatchSolution: The solutions, the condition number of each matrix and
+            the mask of the systems that are neither singular nor
+            ill-conditioned.
+    """
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    if a.ndim < 2 or a.shape[-1] != a.shape[-2]:
+        raise ValueError(f"Expected (..., n, n) matrices, got {a.shape}")
+    n = a.shape[-1]
+    expected = f"(..., {n}, k)" if multiple_rhs else f"(..., {n})"
+    if b.ndim < 1 + multiple_rhs or b.shape[-1 - multiple_rhs] != n:
+        raise ValueError(f"Expected {expected} right-hand sides, got {b.shape}")
+    rhs = b if multiple_rhs else b[..., np.newaxis]
+
+    try:
+        x, inverse = _inverse_and_solution(a, rhs)
+        singular = np.zeros(a.shape[:-2], dtype=bool)
+    except np.linalg.LinAlgError:
+        # some matrix of the stack is singular: replace the singular ones by
+        # the identity so the rest can still be solved in a single call
+        singular = np.linalg.matrix_rank(a) < a.shape[-1]
+        identity = np.eye(a.shape[-1])
+        a = np.where(singular[..., np.newaxis, np.newaxis], identity, a)
+        x, inverse = _inverse_and_solution(a, rhs)
+    if not multiple_rhs:
+        x = x[..., 0]
+
+    with np.errstate(all="ignore"):
+        conditions = np.where(singular, np.inf, _norm1(a) * _norm1(inverse))
+    ok = np.isfinite(conditions) & (conditions <= max_condition)
+    x = np.where(ok.reshape(ok.shape + (1,) * (x.ndim - ok.ndim)), x, np.nan)
+    return BatchSolution(x, conditions, ok)
+
+
+class Factorization:
+    """
+    The factorization of the matrix of a system, which is computed once and
+    then used to solve the system for any number of right-hand sides.
+
+    Dense matrices are inverted (once) with NumPy, so each solve is a single
+    matrix product, and sparse matrices are factorized with SciPy's sparse LU
+    (SuperLU), which keeps the factors sparse.
+
+    Args:
+        a (array-like | scipy.sparse matrix): The (n, n) matrix.
+        max_condition (float): The condition number above which the matrix is
+            considered ill-conditioned.
+
+    Attributes:
+        condition (float): The estimated 1-norm condition number of the
+            matrix.
+
+    Raises:
+        SingularSystemError: If the matrix is singular.
+        IllConditionedSystemError: If its condition number is above
+            max_condition.
+    """
+
+    def __init__(self, a, max_condition: float = MAX_CONDITION) -> None:
+        if _is_sparse(a):
+            self._factorize_sparse(a)
+        else:
+            self._factorize_dense(a)
+        if not self.condition <= max_condition:
+            raise IllConditionedSystemError(self.condition)
+
+    def _factorize_dense(self, a) -> None:
+        a = np.asarray(a, dtype=np.float64)
+        if a.ndim != 2 or a.shape[0] != a.shape[1]:
+            raise ValueError(f"Expected an (n, n) matrix, got {a.shape}")
+        try:
+            self._inverse = np.linalg.inv(a)
+        except np.linalg.LinAlgError as err:
+            raise SingularSystemError("The matrix is singular") from err
+        self._lu = None
+        self.shape = a.shape
+        self.condition = float(_norm1(a) * _norm1(self._inverse))
+
+    def _factorize_sparse(self, a) -> None:
+        sparse = _scipy_sparse()
+        a = sparse.csc_matrix(a, dtype=np.float64)
+        if a.shape[0] != a.shape[1]:
+            raise ValueError(f"Expected an (n, n) matrix, got {a.shape}")
+        try:
+            self._lu = sparse.linalg.splu(a)
+        except RuntimeError as err:
+            # SuperLU reports exactly singular matrices as RuntimeError
+            raise SingularSystemError(str(err)) from err
+        self._inverse = None
+        self.shape = a.shape
+        # Hager-Higham estimate of the 1-norm of the inverse, which only needs
+        # a few solves with the factorization
+        inverse = sparse.linalg.LinearOperator(
+            a.shape,
+            matvec=self._lu.solve,
+            rmatvec=lambda y: self._lu.solve(y, trans="T"),
+            dtype=np.float64,
+        )
+        self.condition = float(
+            sparse.linalg.onenormest(a) * sparse.linalg.onenormest(inverse)
+        )
+        if not np.isfinite(self.condition):
+            raise SingularSystemError("The matrix is singular")
+
+    def solve(self, b) -> np.ndarray:
+        """
+        Solve the system for the (n,) right-hand side b, or for the k columns
+        of an (n, k) array of right-hand sides.
+        """
+        b = np.asarray(b, dtype=np.float64)
+        if b.shape[0] != self.shape[0]:
+            raise ValueError(
+                f"Expected {self.shape[0]} rows in the right-hand side, "
+                f"got {b.shape[0]}"
+            )
+        if self._lu is not None:
+            return self._lu.solve(b)
+        return self._inverse @ b
+
+
+def factorize(a, max_condition: float = MAX_CONDITION) -> Factorization:
+    """
+    Factorize the matrix of a system so it can be solved for many right-hand
+    sides. See `Factorization`.
+    """
+    return Factorization(a, max_condition)
+
+
+def solve(a, b, max_condition: float = MAX_CONDITION) -> np.ndarray:
+    """
+    Solve the system a x = b.
+
+    Args:
+        a (array-like | scipy.sparse matrix): The (n, n) matrix of the system.
+        b (array-like): The (n,) right-hand side, or (n, k) for k of them.
+        max_condition (float): The condition number above which the system is
+            considered ill-conditioned.
+
+    Returns:
+        np.ndarray: The (n,) or (n, k) solution.
+
+    Raises:
+        SingularSystemError: If the matrix is singular.
+        IllConditionedSystemError: If its condition number is above
+            max_condition.
+    """
+    if _is_sparse(a):
+        return factorize(a, max_condition).solve(b)
+    solution = solve_batch(a, b, max_condition, multiple_rhs=np.ndim(b) == 2)
+    if np.isinf(solution.conditions):
+        raise SingularSystemError("The matrix is singular")
+    if not solution.ok:
+        raise IllConditionedSystemError(float(solution.conditions))
+    return solution.x
+
+
+def load_matrix(path):
+    """
+    Load the matrix (or stack of matrices) of a system from a file.
+
+    Args:
+        path (str | Path): A .npy file with a dense (n, n) matrix or an
+            (N, n, n) stack of them, a .mtx Matrix Market file (COO format),
+            a .npz file saved with scipy.sparse.save_npz (e.g. in CSR format)
+            or a text file with a row of the matrix per line.
+
+    Returns:
+        np.ndarray | scipy.sparse.csr_matrix: The matrix, sparse for the .mtx
+            and .npz files.
+    """
+    path = Path(path)
+    if path.suffix == ".npy":
+        return np.load(path)
+    if path.suffix == ".mtx":
+        _scipy_sparse()
+        import scipy.io  # pylint: disable=import-outside-toplevel
+
+        return scipy.io.mmread(path).tocsr()
+    if path.suffix == ".npz":
+        return _scipy_sparse().load_npz(path).tocsr()
+    return np.loadtxt(path, ndmin=2)
+
+
+def load_rhs(path) -> np.ndarray:
+    """
+    Load the right-hand side(s) of a system from a .npy file or a text file
+    with one value (or one row of k values) per line.
+    """
+    path = Path(path)
+    if path.suffix == ".npy":
+        return np.load(path)
+    return np.loadtxt(path)
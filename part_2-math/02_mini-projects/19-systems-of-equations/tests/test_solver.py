@@ -0,0 +1,195 @@
+"""Unit tests for the batched, factorized and sparse solvers"""
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from sysequations.solver import (
+    IllConditionedSystemError,
+    SingularSystemError,
+    factorize,
+    load_matrix,
+    load_rhs,
+    solve,
+    solve_batch,
+)
+
+try:
+    import scipy.io
+    import scipy.sparse
+except ImportError:
+    scipy = None
+
+A = np.array([[4.0, 1.0, 0.0], [1.0, 3.0, 1.0], [0.0, 1.0, 2.0]])
+SINGULAR = np.array([[1.0, 2.0, 3.0], [2.0, 4.0, 6.0], [0.0, 1.0, 1.0]])
+
+
+def random_systems(count, n, seed=0):
+    """Returns count well-conditioned (n, n) matrices"""
+    rng = np.random.default_rng(seed)
+    return rng.random((count, n, n)) + n * np.eye(n)
+
+
+class SolveTest(unittest.TestCase):
+    """
+    solve and factorize test class
+    """
+
+    def test_single_system(self):
+        """Validates the solution for one and for several right-hand sides"""
+        b = np.array([1.0, 2.0, 3.0])
+        self.assertTrue(np.allclose(A @ solve(A, b), b))
+        rhs = np.column_stack([b, -b, 2 * b])
+        self.assertTrue(np.allclose(A @ solve(A, rhs), rhs))
+
+    def test_singular_and_ill_conditioned(self):
+        """Validates that unreliable systems are rejected"""
+        with self.assertRaises(SingularSystemError):
+            solve(SINGULAR, [1, 2, 3])
+        with self.assertRaises(SingularSystemError):
+            factorize(SINGULAR)
+        nearly_singular = SINGULAR + np.diag([0, 1e-14, 0])
+        with self.assertRaises(IllConditionedSystemError) as cm:
+            solve(nearly_singular, [1, 2, 3])
+        self.assertGreater(cm.exception.condition, 1e12)
+        self.assertTrue(
+            np.isfinite(solve(nearly_singular, [1, 2, 3], max_condition=np.inf))
+            .all()
+        )
+
+    def test_factorization(self):
+        """
+        Validates that a factorization solves any right-hand side and reports
+        the condition number
+        """
+        factorization = factorize(A)
+        expected = np.linalg.cond(A, 1)
+        self.assertAlmostEqual(factorization.condition, expected)
+        for b in ([1, 0, 0], np.ones((3, 4))):
+            self.assertTrue(np.allclose(A @ factorization.solve(b), b))
+        with self.assertRaises(ValueError):
+            factorization.solve([1, 2])
+
+
+class SolveBatchTest(unittest.TestCase):
+    """
+    solve_batch test class
+    """
+
+    def test_one_rhs_per_system(self):
+        """
+        Validates the solutions of a stack with one right-hand side per system
+        and with a single right-hand side for all of them
+        """
+        a = random_systems(5, 3)
+        for b in (np.arange(15.0).reshape(5, 3), np.array([1.0, 2.0, 3.0])):
+            solution = solve_batch(a, b)
+            self.assertEqual(solution.x.shape, (5, 3))
+            self.assertTrue(solution.ok.all())
+            rhs = np.broadcast_to(b, (5, 3))
+            expected = [np.linalg.solve(m, r) for m, r in zip(a, rhs)]
+            self.assertTrue(np.allclose(solution.x, expected))
+
+    def test_multiple_rhs(self):
+        """
+        Validates the layout of multiple right-hand sides, including the
+        stacks of n systems of size n, whose layout can't be told from the
+        shapes
+        """
+        for count in (3, 4):
+            a = random_systems(count, 3)
+            b = np.arange(6.0).reshape(3, 2)
+            solution = solve_batch(a, b, multiple_rhs=True)
+            self.assertEqual(solution.x.shape, (count, 3, 2))
+            self.assertTrue(np.allclose(a @ solution.x, b))
+            stacked = np.arange(count * 6.0).reshape(count, 3, 2)
+            solution = solve_batch(a, stacked, multiple_rhs=True)
+            self.assertTrue(np.allclose(a @ solution.x, stacked))
+
+    def test_invalid_rhs(self):
+        """Validates that right-hand sides of the wrong layout are rejected"""
+        a = random_systems(3, 3)
+        with self.assertRaises(ValueError):
+            solve_batch(a, np.ones((3, 2)))
+        with self.assertRaises(ValueError):
+            solve_batch(a, np.ones(3), multiple_rhs=True)
+        with self.assertRaises(ValueError):
+            solve_batch(np.ones((3, 2)), np.ones(3))
+
+    def test_unreliable_systems(self):
+        """
+        Validates that singular and ill-conditioned systems get NaN solutions
+        without failing the rest of the batch
+        """
+        a = np.stack([A, SINGULAR, SINGULAR + np.diag([0, 1e-14, 0]), A])
+        solution = solve_batch(a, [1.0, 2.0, 3.0])
+        self.assertEqual(solution.ok.tolist(), [True, False, False, True])
+        self.assertTrue(np.isinf(solution.conditions[1]))
+        self.assertGreater(solution.conditions[2], 1e12)
+        self.assertTrue(np.isnan(solution.x[1:3]).all())
+        self.assertTrue(np.allclose(A @ solution.x[0], [1, 2, 3]))
+
+
+class LoadTest(unittest.TestCase):
+    """
+    load_matrix and load_rhs test class
+    """
+
+    def test_dense_files(self):
+        """Validates the dense .npy and text files"""
+        with tempfile.TemporaryDirectory() as directory:
+            np.save(Path(directory, "a.npy"), A)
+            np.savetxt(Path(directory, "a.txt"), A)
+            np.savetxt(Path(directory, "b.txt"), [1, 2, 3])
+            for name in ("a.npy", "a.txt"):
+                self.assertTrue(
+                    np.array_equal(load_matrix(Path(directory, name)), A)
+                )
+            b = load_rhs(Path(directory, "b.txt"))
+            self.assertTrue(np.array_equal(b, [1, 2, 3]))
+
+
+@unittest.skipUnless(scipy, "SciPy is not installed")
+class SparseTest(unittest.TestCase):
+    """
+    Sparse systems test class
+    """
+
+    def test_solve(self):
+        """
+        Validates the sparse LU solutions and the condition number estimated
+        with onenormest against the dense ones
+        """
+        n = 50
+        a = scipy.sparse.diags(
+            [-1.0, 4.0, -1.0], [-1, 0, 1], shape=(n, n), format="csr"
+        )
+        b = np.arange(n, dtype=np.float64)
+        self.assertTrue(np.allclose(solve(a, b), solve(a.toarray(), b)))
+        factorization = factorize(a)
+        self.assertAlmostEqual(
+            factorization.condition, np.linalg.cond(a.toarray(), 1), 6
+        )
+        rhs = np.column_stack([b, -b])
+        self.assertTrue(np.allclose(a @ factorization.solve(rhs), rhs))
+
+    def test_singular(self):
+        """Validates that singular sparse matrices are rejected"""
+        with self.assertRaises(SingularSystemError):
+            solve(scipy.sparse.csr_matrix(SINGULAR), [1, 2, 3])
+
+    def test_sparse_files(self):
+        """Validates the .mtx and .npz files"""
+        a = scipy.sparse.csr_matrix(A)
+        with tempfile.TemporaryDirectory() as directory:
+            scipy.io.mmwrite(Path(directory, "a.mtx"), a.tocoo())
+            scipy.sparse.save_npz(Path(directory, "a.npz"), a)
+            for name in ("a.mtx", "a.npz"):
+                loaded = load_matrix(Path(directory, name))
+                self.assertTrue(scipy.sparse.issparse(loaded))
+                self.assertTrue(np.array_equal(loaded.toarray(), A))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,6 @@ __init__.py for the plthlp package that provides helper functions for
 matplotlib.
 """
 
-from plthlp.helperslib import plot_function
+from plthlp.helperslib import plot_function, sample_function
 
-__all__ = ["plot_function"]
+__all__ = ["plot_function", "sample_function"]
@@ -1,11 +1,103 @@
 """
 Matplotlib helper functions
+
+Functions are sampled adaptively: a coarse grid is refined only where the
+curve bends, and the function is called once per refinement pass with all the
+new points in an array (falling back to one call per point for functions that
+don't work on arrays).
 """
 
 import matplotlib.pyplot as plt
 import numpy as np
 
 
+def _vectorize(fn, ts):
+    """
+    Return a version of fn that takes an array of points and returns an array
+    of floats, along with the values of fn on the initial grid ts.
+
+    fn is first called with the whole grid, and called that way from then on
+    if that gives the same values as calling it on a few of the points of the
+    grid (a constant result is broadcast). Other functions, e.g. using `math`
+    or `if`, are called point by point, and the points where they raise an
+    error (such as math.log(0)) are left as gaps in the plot.
+    """
+
+    def fn_of_array(ts):
+        return np.broadcast_to(fn(ts), np.shape(ts)).astype(np.float64)
+
+    def fn_of_point(t):
+        try:
+            return fn(t)
+        except (ArithmeticError, ValueError):
+            return np.nan
+
+    try:
+        xs = fn_of_array(ts)
+        probe = [0, len(ts) // 2, -1]
+        expected = [fn_of_point(t) for t in ts[probe].tolist()]
+        if np.allclose(xs[probe], expected, equal_nan=True):
+            return fn_of_array, xs
+    except Exception:  # pylint: disable=broad-exception-caught
+        pass
+    fn_of_points = np.vectorize(fn_of_point, otypes=[np.float64])
+    return fn_of_points, fn_of_points(ts)
+
+
+def sample_function(fn, tmin, tmax, samples=100, tolerance=1e-3, max_depth=12):
+    """
+    Sample a function of one variable over [tmin, tmax], adding points only
+    where a straight line between the samples doesn't follow the curve.
+
+    Each pass evaluates the midpoints of the intervals that are still being
+    refined, and keeps refining those whose midpoint is further than
+    tolerance (relative to the range of the values) from the line between the
+    ends of the interval, or where the function stops being finite.
+
+    Args:
+        fn (function): The function to sample.
+        tmin (float): The start of the interval.
+        tmax (float): The end of the interval.
+        samples (int): The number of points of the initial grid.
+        tolerance (float): The maximum deviation from a straight line, as a
+            fraction of the range of the values.
+        max_depth (int): The maximum number of refinement passes.
+
+    Returns:
+        tuple: The sorted (N,) array of points and the (N,) array with the
+            values of fn at them.
+    """
+    ts = np.linspace(tmin, tmax, samples)
+    with np.errstate(all="ignore"):
+        fn, xs = _vectorize(fn, ts)
+        active = np.ones(len(ts) - 1, dtype=bool)
+        for _ in range(max_depth):
+            if not active.any():
+                break
+            intervals = np.flatnonzero(active)
+            left, right = xs[intervals], xs[intervals + 1]
+            mids = (ts[intervals] + ts[intervals + 1]) / 2
+            xs_mid = fn(mids)
+
+            finite = xs[np.isfinite(xs)]
+            scale = np.ptp(finite) if finite.size else 0.0
+            deviation = np.abs(xs_mid - (left + right) / 2) / (scale or 1.0)
+            # NaN deviations are refined too, unless the function is not
+            # finite anywhere in the interval
+            refine = ~(deviation <= tolerance) & (
+                np.isfinite(xs_mid) | np.isfinite(left) | np.isfinite(right)
+            )
+
+            # every evaluated midpoint is kept, but only the halves of the
+            # intervals that bend are refined in the next pass
+            ts = np.insert(ts, intervals + 1, mids)
+            xs = np.insert(xs, intervals + 1, xs_mid)
+            flags = np.zeros_like(active)
+            flags[intervals] = refine
+            active = np.repeat(flags, np.where(active, 2, 1))
+    return ts, xs
+
+
 def plot_function(
     fn,
     tmin,
@@ -18,9 +110,10 @@ def plot_function(
     **kwargs
 ):
     """
-    Plot a function of one variable x over t using matplotlib.
+    Plot a function of one variable x over t using matplotlib, sampled with
+    `sample_function`.
     """
-    ts = np.linspace(tmin, tmax, 1000)
+    ts, xs = sample_function(fn, tmin, tmax)
     if tlabel:
         plt.xlabel(tlabel)
     if xlabel:
@@ -30,7 +123,6 @@ def plot_function(
     plt.xlim(tmin, tmax + total_t / 10)
     if grid:
         plt.grid(True)
-    xs = [fn(t) for t in ts ]
     plt.plot(ts, xs, **kwargs)
     if axes:
         total_t = tmax - tmin
@@ -0,0 +1,123 @@
+"""Unit tests for the adaptive sampling of the Matplotlib helpers"""
+import math
+import unittest
+from unittest.mock import patch
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+
+from plthlp import plot_function, sample_function  # noqa: E402
+
+
+def sawtooth(t):
+    return t - math.floor(t)
+
+
+class SampleFunctionTest(unittest.TestCase):
+    """
+    sample_function test class
+    """
+
+    def assertFollowsCurve(self, fn, ts, xs, tolerance):
+        """
+        Checks that the straight lines between the samples are within the
+        tolerance of the function, on a fine grid
+        """
+        fine = np.linspace(ts[0], ts[-1], 20_001)
+        exact = np.array([fn(t) for t in fine.tolist()])
+        scale = np.ptp(xs)
+        error = np.abs(np.interp(fine, ts, xs) - exact).max()
+        self.assertLess(error, 10 * tolerance * scale)
+
+    def test_straight_lines_are_not_refined(self):
+        """
+        Validates that linear and constant functions only get the midpoints of
+        the first pass
+        """
+        for fn in (lambda t: 2 * t + 1, lambda t: 3):
+            ts, xs = sample_function(fn, -1, 1, samples=11)
+            self.assertTrue(np.allclose(ts, np.linspace(-1, 1, 21)))
+            self.assertTrue(np.allclose(xs, [fn(t) for t in ts]))
+
+    def test_curves_are_refined(self):
+        """
+        Validates that the samples follow the curve, with more points where it
+        bends the most
+        """
+        ts, xs = sample_function(np.sin, 0, 10, samples=20, tolerance=1e-4)
+        self.assertTrue((np.diff(ts) > 0).all())
+        self.assertTrue(np.allclose(xs, np.sin(ts)))
+        self.assertFollowsCurve(math.sin, ts, xs, 1e-4)
+
+        ts, _ = sample_function(
+            lambda t: abs(t - 0.3), -1, 1, samples=10, tolerance=1e-4
+        )
+        near_kink = np.count_nonzero(np.abs(ts - 0.3) < 0.1)
+        self.assertGreater(near_kink, np.count_nonzero(ts > 0.5))
+
+    def test_point_by_point_functions(self):
+        """
+        Validates functions that don't work on arrays, such as those using
+        `math` or `if`
+        """
+        ts, xs = sample_function(sawtooth, 0, 3, tolerance=1e-3)
+        self.assertTrue(np.allclose(xs, [sawtooth(t) for t in ts]))
+        ts, xs = sample_function(math.cos, 0, 10, tolerance=1e-4)
+        self.assertFollowsCurve(math.cos, ts, xs, 1e-4)
+
+    def test_array_functions_are_called_once_per_pass(self):
+        """
+        Validates that functions working on arrays get all the points of each
+        pass in a single call
+        """
+        calls = []
+
+        def fn(t):
+            calls.append(np.shape(t))
+            return np.sin(t)
+
+        sample_function(fn, 0, 10, samples=20, max_depth=5)
+        arrays = [shape for shape in calls if shape]
+        self.assertLessEqual(len(arrays), 1 + 5)
+        self.assertEqual(arrays[0], (20,))
+
+    def test_undefined_points(self):
+        """
+        Validates that the points where the function isn't defined or raises
+        are gaps instead of errors
+        """
+        for fn in (math.log, np.log, math.sqrt):
+            ts, xs = sample_function(fn, -1, 1, samples=21)
+            self.assertTrue(np.isnan(xs[ts < 0]).all())
+            self.assertTrue(np.isfinite(xs[ts > 0]).all())
+        ts, xs = sample_function(lambda t: 1 / math.sin(t), -1, 1, 21)
+        self.assertEqual(np.count_nonzero(ts == 0), 1)
+        self.assertTrue(np.isnan(xs[ts == 0]).all())
+        self.assertTrue(np.isfinite(xs[ts != 0]).all())
+
+
+class PlotFunctionTest(unittest.TestCase):
+    """
+    plot_function test class
+    """
+
+    def tearDown(self):
+        plt.close("all")
+
+    def test_plots_the_samples(self):
+        """Validates that the plotted line has the adaptive samples"""
+        with patch.object(plt, "show"):
+            plot_function(math.sin, 0, 10, axes=True, grid=True, title="sin")
+        line = plt.gca().get_lines()[0]
+        ts, xs = sample_function(math.sin, 0, 10)
+        self.assertTrue(np.allclose(line.get_xdata(), ts))
+        self.assertTrue(np.allclose(line.get_ydata(), xs))
+        self.assertEqual(plt.gca().get_title(), "sin")
+
+
+if __name__ == "__main__":
+    unittest.main()
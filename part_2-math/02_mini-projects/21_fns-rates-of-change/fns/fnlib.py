@@ -2,6 +2,8 @@
 
 import numpy as np
 
+from fns.adaptive import CumulativeIntegral, derivative, vectorize
+
 
 def average_rate_of_change(f, a, b):
     """Return the average rate of change of f(x) from a to b.
@@ -73,16 +75,10 @@ def instantaneous_rate_of_change(f, x, digits=6):
         float: The instantaneous rate of change of f(x) at x.
     """
     tolerance = 10**-digits
-    h = 1
-    approx = average_rate_of_change(f, x - h, x + h)
-    for _ in range(2 * digits):
-        h /= 10
-        new_approx = average_rate_of_change(f, x - h, x + h)
-        if abs(new_approx - approx) < tolerance:
-            return round(new_approx, digits)
-        else:
-            approx = new_approx
-    raise Exception("Derivative did not converge after {2 * digits} iterations")
+    value, error = derivative(f, x)
+    if np.any(error >= tolerance):
+        raise Exception(f"Derivative did not converge to {digits} digits")
+    return np.round(value, digits) if np.ndim(value) else round(value, digits)
 
 
 def get_rate_of_change_fn(f):
@@ -92,7 +88,8 @@ def get_rate_of_change_fn(f):
         f (function): A function of one variable.
 
     Returns:
-        function: The rate of change function of f(x).
+        function: The rate of change function of f(x), which also takes an
+            array of points.
     """
     return lambda x: instantaneous_rate_of_change(f, x)
 
@@ -137,9 +134,8 @@ def antiderivative_change(q, x1, x2, dx):
     Returns:
         float: The change in the antiderivative of q(x) on the interval [x1, x2].
     """
-    return sum(
-        [brief_antiderivative_change(q, x, dx) for x in np.arange(x1, x2, dx)]
-    )
+    xs = np.arange(x1, x2, dx)
+    return float(np.sum(brief_antiderivative_change(vectorize(q), xs, dx)))
 
 
 def integral_change(q, x1, x2, dx):
@@ -222,23 +218,18 @@ def get_antiderivative_fn(q, v0, digits=6):
         digits (int): The number of digits of precision.
 
     Returns:
-        function: The antiderivative function of q(x).
+        function: The antiderivative function of q(x), which also takes an
+            array of points.
     """
 
+    # The integrals already computed are reused by later calls
+    integral = CumulativeIntegral(q, v0, tolerance=10 ** -(digits + 2))
+
     def antiderivative_fn(t):
-        tolerance = 10**-digits
-        dt = 1
-        approx = v0 + antiderivative_change(q, 0, t, dt)
-        for _ in range(digits * 2):
-            dt = dt / 10
-            next_approx = v0 + antiderivative_change(q, 0, t, dt)
-            if abs(next_approx - approx) < tolerance:
-                return round(next_approx, digits)
-            else:
-                approx = next_approx
-        raise Exception(
-            f"Antiderivative did not converge in {digits * 2} iterations"
-        )
+        value = integral(t)
+        if np.ndim(value):
+            return np.round(value, digits)
+        return round(value, digits)
 
     return antiderivative_fn
 
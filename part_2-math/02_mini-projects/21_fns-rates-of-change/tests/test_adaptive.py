@@ -0,0 +1,149 @@
+"""Unit tests for the adaptive integration and differentiation"""
+import math
+import unittest
+
+import numpy as np
+
+from fns.adaptive import CumulativeIntegral, derivative, integral, vectorize
+from fns.fnlib import get_antiderivative_fn, instantaneous_rate_of_change
+
+
+def step(x):
+    return 1.0 if x > 1 else 0.0
+
+
+class VectorizeTest(unittest.TestCase):
+    """
+    vectorize test class
+    """
+
+    def test_matches_point_by_point(self):
+        """
+        Validates that the vectorized function gives the value of f at every
+        point, whether f works on arrays or not
+        """
+        xs = np.linspace(0.1, 3, 7)
+        for f in (np.sin, math.sin, step, lambda x: 3, lambda x: max(x, 2)):
+            self.assertTrue(np.allclose(vectorize(f)(xs), [f(x) for x in xs]))
+
+    def test_nan_outside_the_domain(self):
+        """
+        Validates that the points outside the domain of f give NaN, both for
+        NumPy and math functions
+        """
+        for f in (np.sqrt, math.sqrt, np.log, math.log):
+            got = vectorize(f)(np.array([-1.0, 4.0]))
+            self.assertTrue(np.isnan(got[0]))
+            self.assertAlmostEqual(got[1], f(4.0))
+        got = vectorize(lambda x: 1 / x)(np.array([0.0, 4.0]))
+        self.assertFalse(np.isfinite(got[0]))
+
+
+class IntegralTest(unittest.TestCase):
+    """
+    integral test class
+    """
+
+    def test_known_integrals(self):
+        """Validates integrals with closed forms, for points and arrays"""
+        self.assertAlmostEqual(integral(lambda x: x**3, 0, 2), 4, 10)
+        self.assertAlmostEqual(integral(math.cos, 0, math.pi / 2), 1, 10)
+        bs = np.array([1.0, 2.0, 5.0])
+        self.assertTrue(
+            np.allclose(integral(np.exp, 0, bs), np.exp(bs) - 1, atol=1e-9)
+        )
+
+    def test_kink(self):
+        """Validates that the intervals around a kink are split"""
+        self.assertAlmostEqual(integral(lambda x: abs(x - 1), 0, 3), 2.5, 9)
+
+    def test_not_converging(self):
+        """Validates that a singular integral raises an exception"""
+        with self.assertRaises(Exception):
+            integral(lambda x: 1 / (x - 0.3) ** 2, 0, 1, max_subdivisions=5)
+
+
+class DerivativeTest(unittest.TestCase):
+    """
+    derivative and instantaneous_rate_of_change test class
+    """
+
+    def test_known_derivatives(self):
+        """Validates derivatives with closed forms, for points and arrays"""
+        value, error = derivative(math.sin, 1)
+        self.assertAlmostEqual(value, math.cos(1), 10)
+        self.assertLess(error, 1e-9)
+        xs = np.array([-3.0, 0.0, 2.5, 100.0])
+        values, errors = derivative(lambda x: x**3, xs)
+        self.assertTrue(np.allclose(values, 3 * xs**2))
+        self.assertTrue((errors < 1e-6 * np.maximum(1, xs**2)).all())
+
+    def test_near_the_end_of_the_domain(self):
+        """
+        Validates that the derivative converges where the function isn't
+        defined within the initial step, and that points where it's undefined
+        on one side report an infinite error
+        """
+        for f in (np.sqrt, math.sqrt):
+            values, errors = derivative(f, [1e-3, 1e-8, 0.0, -1.0])
+            self.assertAlmostEqual(values[0], 0.5 / math.sqrt(1e-3), 6)
+            self.assertAlmostEqual(values[1] * 1e-4, 0.5, 6)
+            self.assertTrue(np.isinf(errors[2:]).all())
+            self.assertEqual(
+                instantaneous_rate_of_change(f, 1e-3),
+                round(0.5 / math.sqrt(1e-3), 6),
+            )
+            with self.assertRaises(Exception):
+                instantaneous_rate_of_change(f, 0)
+
+    def test_rate_of_change_digits(self):
+        """Validates the rounding of instantaneous_rate_of_change"""
+        self.assertEqual(instantaneous_rate_of_change(math.exp, 1, 4), 2.7183)
+        got = instantaneous_rate_of_change(np.exp, [0, 1], 4)
+        self.assertTrue(np.array_equal(got, [1, 2.7183]))
+
+
+class CumulativeIntegralTest(unittest.TestCase):
+    """
+    CumulativeIntegral test class
+    """
+
+    def test_values(self):
+        """
+        Validates the values on both sides of x0, for points and arrays, in
+        any order
+        """
+        F = CumulativeIntegral(np.cos, v0=2, x0=1)
+        self.assertEqual(F(1), 2)
+        xs = np.array([3.0, -2.0, 1.5, 0.0])
+        self.assertTrue(np.allclose(F(xs), 2 + np.sin(xs) - math.sin(1)))
+        self.assertAlmostEqual(F(10), 2 + math.sin(10) - math.sin(1), 8)
+        self.assertAlmostEqual(F(-0.5), 2 + math.sin(-0.5) - math.sin(1), 8)
+
+    def test_reuses_the_table(self):
+        """
+        Validates that the points already evaluated aren't integrated again
+        """
+        calls = []
+
+        def q(x):
+            calls.append(np.size(x))
+            return 2 * x
+
+        F = CumulativeIntegral(q)
+        F(np.linspace(0, 5, 11))
+        count = len(calls)
+        self.assertTrue(np.allclose(F([1.5, 5, 0.5]), [2.25, 25, 0.25]))
+        self.assertEqual(len(calls), count)
+        self.assertAlmostEqual(F(6), 36)
+        self.assertGreater(len(calls), count)
+
+    def test_antiderivative_fn(self):
+        """Validates get_antiderivative_fn against a closed form"""
+        antiderivative = get_antiderivative_fn(lambda t: 3 * t**2, 1)
+        self.assertEqual(antiderivative(2), 9)
+        self.assertTrue(np.array_equal(antiderivative([0, 1, 3]), [1, 2, 28]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,20 @@
+"""
+__init__.py for the eulerkinematics package that exposes the integrators of
+the trajectories of moving objects.
+"""
+
+from eulerkinematics.integrators import (
+    INTEGRATORS,
+    Kinematics,
+    get_kinematics_euler,
+    integrate,
+    stream,
+)
+
+__all__ = [
+    "INTEGRATORS",
+    "Kinematics",
+    "get_kinematics_euler",
+    "integrate",
+    "stream",
+]
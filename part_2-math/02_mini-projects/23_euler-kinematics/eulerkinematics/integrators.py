@@ -0,0 +1,213 @@
+"""
+Numerical integrators for the trajectory of moving objects.
+
+The state of the objects is given by NumPy arrays: a position s and a velocity
+v of shape (dim,) for a single object, or (particles, dim) to integrate many
+objects at once. The acceleration is either constant (an array that
+broadcasts to the shape of the state) or a function acceleration(t, s, v) that
+returns the accelerations of all the objects at once.
+
+The results are written to arrays of shape (steps + 1, *state shape) that are
+allocated once before integrating, and `stream` yields them in chunks of a
+fixed number of steps, so very long simulations don't need to fit in memory.
+
+Three methods are available:
++ "euler": the explicit Euler method, which uses the velocity and the
+  acceleration at the beginning of each step.
++ "rk4": the classic 4th order Runge-Kutta method.
++ "verlet": the velocity Verlet method, which is symplectic, so the energy of
+  orbits doesn't drift over time as with Euler.
+
+For a constant acceleration, the trajectory is computed in closed form for all
+the steps at once: Euler gives s_n = s0 + n dt v0 + dt^2 a n (n - 1) / 2, and
+RK4 and Verlet are exact (s0 + v0 t + a t^2 / 2).
+"""
+
+from typing import Iterator, NamedTuple
+
+import numpy as np
+
+
+class Kinematics(NamedTuple):
+    """
+    The trajectory of one or many objects.
+
+    Attributes:
+        times (np.ndarray): the (S,) times of the steps.
+        positions (np.ndarray): the (S, *state shape) positions at each time.
+        velocities (np.ndarray): the (S, *state shape) velocities at each time.
+        accelerations (np.ndarray): the (S, *state shape) accelerations at each
+            time.
+    """
+
+    times: np.ndarray
+    positions: np.ndarray
+    velocities: np.ndarray
+    accelerations: np.ndarray
+
+
+def _euler_step(acceleration, t, s, v, a, dt):
+    s_next = s + dt * v
+    v_next = v + dt * a
+    return s_next, v_next, acceleration(t + dt, s_next, v_next)
+
+
+def _rk4_step(acceleration, t, s, v, a, dt):
+    # the derivative of s is v, and the one of v is the acceleration
+    v2 = v + dt / 2 * a
+    a2 = acceleration(t + dt / 2, s + dt / 2 * v, v2)
+    v3 = v + dt / 2 * a2
+    a3 = acceleration(t + dt / 2, s + dt / 2 * v2, v3)
+    v4 = v + dt * a3
+    a4 = acceleration(t + dt, s + dt * v3, v4)
+    s_next = s + dt / 6 * (v + 2 * v2 + 2 * v3 + v4)
+    v_next = v + dt / 6 * (a + 2 * a2 + 2 * a3 + a4)
+    return s_next, v_next, acceleration(t + dt, s_next, v_next)
+
+
+def _verlet_step(acceleration, t, s, v, a, dt):
+    # accelerations that depend on the velocity are evaluated with the velocity
+    # predicted by Euler, as velocity Verlet assumes they only depend on s
+    s_next = s + dt * v + dt**2 / 2 * a
+    a_next = acceleration(t + dt, s_next, v + dt * a)
+    return s_next, v + dt / 2 * (a + a_next), a_next
+
+
+INTEGRATORS = {
+    "euler": _euler_step,
+    "rk4": _rk4_step,
+    "verlet": _verlet_step,
+}
+
+
+def _check_method(method: str) -> None:
+    if method not in INTEGRATORS:
+        raise ValueError(
+            f"unknown method {method!r}, expected one of {tuple(INTEGRATORS)}"
+        )
+
+
+def _closed_form(t0, s0, v0, a0, dt, first, count, method) -> Kinematics:
+    """The steps first to first + count - 1 for a constant acceleration."""
+    n = np.arange(first, first + count, dtype=np.float64)
+    times = t0 + n * dt
+    n = n.reshape(-1, *(1,) * s0.ndim)
+    if method == "euler":
+        positions = s0 + n * dt * v0 + dt**2 * a0 * (n * (n - 1) / 2)
+    else:
+        positions = s0 + n * dt * v0 + a0 * (n * dt) ** 2 / 2
+    velocities = v0 + n * dt * a0
+    accelerations = np.broadcast_to(a0, positions.shape).copy()
+    return Kinematics(times, positions, velocities, accelerations)
+
+
+def stream(
+    t0: float,
+    s0,
+    v0,
+    acceleration,
+    t_end: float,
+    steps: int,
+    method: str = "euler",
+    chunk_size: int = 10_000,
+) -> Iterator[Kinematics]:
+    """
+    Integrates the trajectory of one or many objects, yielding the results in
+    chunks of at most chunk_size steps.
+
+    Args:
+        t0 (float): The initial time.
+        s0 (array-like): The (dim,) or (particles, dim) initial positions.
+        v0 (array-like): The initial velocities, with the shape of s0.
+        acceleration (array-like | Callable): A constant acceleration that
+            broadcasts to the shape of s0, or a function acceleration(t, s, v)
+            that returns the accelerations for the arrays of positions and
+            velocities s and v.
+        t_end (float): The final time.
+        steps (int): The number of steps between t0 and t_end.
+        method (str): One of "euler", "rk4" or "verlet".
+        chunk_size (int): The maximum number of steps of each chunk.
+
+    Yields:
+        Kinematics: The consecutive chunks of the trajectory, the first one
+            starting with the initial state at t0. The arrays of each chunk are
+            new, so they can be kept after the next chunk is computed.
+    """
+    _check_method(method)
+    if steps < 1 or chunk_size < 1:
+        raise ValueError("steps and chunk_size must be positive")
+    dt = (t_end - t0) / steps
+    s0 = np.asarray(s0, dtype=np.float64)
+    v0 = np.broadcast_to(np.asarray(v0, dtype=np.float64), s0.shape)
+    total = steps + 1
+
+    if not callable(acceleration):
+        a0 = np.broadcast_to(np.asarray(acceleration, np.float64), s0.shape)
+        for first in range(0, total, chunk_size):
+            count = min(chunk_size, total - first)
+            yield _closed_form(t0, s0, v0, a0, dt, first, count, method)
+        return
+
+    step = INTEGRATORS[method]
+    t, s, v = t0, s0, v0
+    a = np.broadcast_to(np.asarray(acceleration(t, s, v), np.float64), s.shape)
+    n = 0
+    while n < total:
+        count = min(chunk_size, total - n)
+        chunk = Kinematics(
+            t0 + dt * np.arange(n, n + count, dtype=np.float64),
+            np.empty((count, *s.shape)),
+            np.empty((count, *s.shape)),
+            np.empty((count, *s.shape)),
+        )
+        for k in range(count):
+            if n + k > 0:
+                s, v, a = step(acceleration, t, s, v, a, dt)
+                t = t0 + (n + k) * dt
+            chunk.positions[k] = s
+            chunk.velocities[k] = v
+            chunk.accelerations[k] = a
+        n += count
+        yield chunk
+
+
+def integrate(
+    t0: float,
+    s0,
+    v0,
+    acceleration,
+    t_end: float,
+    steps: int,
+    method: str = "euler",
+) -> Kinematics:
+    """
+    Integrates the trajectory of one or many objects from t0 to t_end.
+
+    Args:
+        t0 (float): The initial time.
+        s0 (array-like): The (dim,) or (particles, dim) initial positions.
+        v0 (array-like): The initial velocities, with the shape of s0.
+        acceleration (array-like | Callable): A constant acceleration that
+            broadcasts to the shape of s0, or a function acceleration(t, s, v)
+            that returns the accelerations for the arrays of positions and
+            velocities s and v.
+        t_end (float): The final time.
+        steps (int): The number of steps between t0 and t_end.
+        method (str): One of "euler", "rk4" or "verlet".
+
+    Returns:
+        Kinematics: The (steps + 1,) times and the (steps + 1, *state shape)
+            positions, velocities and accelerations.
+    """
+    (kinematics,) = stream(
+        t0, s0, v0, acceleration, t_end, steps, method, chunk_size=steps + 1
+    )
+    return kinematics
+
+
+def get_kinematics_euler(t0, s0, v0, a0, t_end, steps) -> Kinematics:
+    """
+    Array version of get_kinematics_euler in 03_vector-3d-lib, for a constant
+    acceleration a0.
+    """
+    return integrate(t0, s0, v0, a0, t_end, steps, method="euler")
@@ -0,0 +1,167 @@
+"""Unit tests for the integrators of the trajectories of moving objects"""
+import unittest
+
+import numpy as np
+
+from eulerkinematics import INTEGRATORS, get_kinematics_euler, integrate, stream
+
+
+def euler_loop(t0, s0, v0, a0, t_end, steps):
+    """The loop of get_kinematics_euler in 03_vector-3d-lib, with tuples"""
+    dt = (t_end - t0) / steps
+    t, s, v = t0, s0, v0
+    times, positions, velocities = [t], [s], [v]
+    for _ in range(steps):
+        t += dt
+        s = tuple(si + dt * vi for si, vi in zip(s, v))
+        v = tuple(vi + dt * ai for vi, ai in zip(v, a0))
+        times.append(t)
+        positions.append(s)
+        velocities.append(v)
+    return times, positions, velocities
+
+
+def spring(t, s, v):
+    return -s
+
+
+def concatenate(chunks):
+    """Joins the chunks yielded by stream into a single trajectory"""
+    return [np.concatenate(arrays) for arrays in zip(*chunks)]
+
+
+class ConstantAccelerationTest(unittest.TestCase):
+    """
+    Closed-form trajectories test class
+    """
+
+    def test_get_kinematics_euler(self):
+        """
+        Validates the trajectory of the example of 03_vector-3d-lib against
+        its loop
+        """
+        args = (0, (0, 0, 0), (1, 2, 0), (0, -1, 1), 10, 10)
+        kinematics = get_kinematics_euler(*args)
+        self.assertEqual(kinematics.positions[-1].tolist(), [10, -25, 45])
+        times, positions, velocities = euler_loop(*args)
+        self.assertTrue(np.allclose(kinematics.times, times))
+        self.assertTrue(np.allclose(kinematics.positions, positions))
+        self.assertTrue(np.allclose(kinematics.velocities, velocities))
+        self.assertTrue(np.allclose(kinematics.accelerations, (0, -1, 1)))
+
+    def test_closed_form_matches_steps(self):
+        """
+        Validates that the closed form of each method matches its steps with
+        the same acceleration given as a function
+        """
+        s0, v0, a0 = (1, 2, 0), (3, 0, -1), np.array([0, -9.81, 0.5])
+        for method in INTEGRATORS:
+            closed = integrate(0.5, s0, v0, a0, 4, 70, method)
+            stepped = integrate(0.5, s0, v0, lambda t, s, v: a0, 4, 70, method)
+            for got, expected in zip(closed, stepped):
+                self.assertTrue(np.allclose(got, expected), method)
+
+    def test_rk4_and_verlet_are_exact(self):
+        """
+        Validates that RK4 and Verlet follow s0 + v0 t + a t^2 / 2, while Euler
+        lags behind
+        """
+        t = np.linspace(0, 2, 11)[:, np.newaxis]
+        exact = 1 + 3 * t - 9.81 * t**2 / 2
+        for method in ("rk4", "verlet"):
+            kinematics = integrate(
+                0, [1], [3], lambda t, s, v: -9.81, 2, 10, method
+            )
+            self.assertTrue(np.allclose(kinematics.positions, exact), method)
+        euler = integrate(0, [1], [3], [-9.81], 2, 10)
+        self.assertTrue((euler.positions[1:] > exact[1:]).all())
+
+
+class OscillatorTest(unittest.TestCase):
+    """
+    Spring oscillator (a = -s) test class
+    """
+
+    def energy(self, kinematics):
+        return (
+            (kinematics.positions**2).sum(axis=-1)
+            + (kinematics.velocities**2).sum(axis=-1)
+        ) / 2
+
+    def test_energy(self):
+        """
+        Validates that Verlet and RK4 keep the energy of the oscillator over
+        many periods, while Euler makes it grow
+        """
+        steps, t_end = 20_000, 200
+        energies = {
+            method: self.energy(
+                integrate(0, [1, 0], [0, 1], spring, t_end, steps, method)
+            )
+            for method in INTEGRATORS
+        }
+        self.assertTrue(np.allclose(energies["verlet"], 1, rtol=1e-6))
+        self.assertTrue(np.allclose(energies["rk4"], 1, rtol=1e-6))
+        self.assertGreater(energies["euler"][-1], 2)
+
+    def test_exact_solution(self):
+        """Validates the accuracy of each method against cos(t)"""
+        t_end, steps = 10, 1000
+        errors = {}
+        for method in INTEGRATORS:
+            kinematics = integrate(0, [1], [0], spring, t_end, steps, method)
+            exact = np.cos(kinematics.times)
+            errors[method] = np.abs(kinematics.positions[:, 0] - exact).max()
+        self.assertLess(errors["rk4"], 1e-9)
+        self.assertLess(errors["verlet"], 1e-3)
+        self.assertLess(errors["verlet"], errors["euler"])
+
+    def test_many_particles(self):
+        """
+        Validates that integrating many particles at once matches integrating
+        them one by one
+        """
+        s0 = np.array([[1.0, 0.0], [0.0, 2.0], [-1.0, 1.0]])
+        v0 = np.array([[0.0, 1.0], [1.0, 0.0], [0.5, 0.5]])
+        for method in INTEGRATORS:
+            together = integrate(0, s0, v0, spring, 5, 100, method)
+            self.assertEqual(together.positions.shape, (101, 3, 2))
+            for k in range(3):
+                alone = integrate(0, s0[k], v0[k], spring, 5, 100, method)
+                self.assertTrue(
+                    np.allclose(together.positions[:, k], alone.positions)
+                )
+
+
+class StreamTest(unittest.TestCase):
+    """
+    stream test class
+    """
+
+    def test_chunks(self):
+        """
+        Validates that the chunks have at most chunk_size steps and together
+        make up the trajectory given by integrate
+        """
+        for acceleration in ((0, -1), spring):
+            args = (0, (1, 0), (0, 1), acceleration, 3, 30)
+            expected = integrate(*args)
+            for chunk_size in (1, 7, 31, 100):
+                chunks = list(stream(*args, chunk_size=chunk_size))
+                self.assertEqual(len(chunks), -(-31 // chunk_size))
+                self.assertTrue(
+                    all(len(chunk.times) <= chunk_size for chunk in chunks)
+                )
+                for got, values in zip(concatenate(chunks), expected):
+                    self.assertTrue(np.allclose(got, values))
+
+    def test_invalid_arguments(self):
+        """Validates that unknown methods and empty ranges are rejected"""
+        for kwargs in ({"method": "leapfrog"}, {"steps": 0}, {"chunk_size": 0}):
+            arguments = {"steps": 10, **kwargs}
+            with self.assertRaises(ValueError):
+                next(stream(0, (0,), (1,), (0,), 1, **arguments))
+
+
+if __name__ == "__main__":
+    unittest.main()
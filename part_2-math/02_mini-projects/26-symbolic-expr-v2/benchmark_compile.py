@@ -0,0 +1,87 @@
+"""
+Benchmark for the evaluation of symbolic expressions.
+
+Evaluates the same expression on many points with the recursive `evaluate`,
+with `python_function` and with the functions returned by `compile`, both
+point by point and, with `vectorize=True`, on NumPy arrays in a single call.
+Then evaluates the expression and its gradient with one compiled function per
+expression and with the single function of `compile_gradient`, which computes
+the subexpressions shared by all of them once.
+
+Usage: python benchmark_compile.py [--points 100000]
+"""
+
+import argparse
+from timeit import default_timer as timer
+
+import numpy as np
+
+from symexpr import Apply, Function, Number, Power, Variable, compile_gradient
+
+
+def expression():
+    """(3x^2 + x) * sin(x) + y / (x + 1)"""
+    x, y = Variable("x"), Variable("y")
+    return (Number(3) * Power(x, Number(2)) + x) * Apply(
+        Function("sin"), x
+    ) + y / (x + 1)
+
+
+def timed(label, fn, points):
+    start = timer()
+    result = fn()
+    elapsed = timer() - start
+    print(f"{label:<32} {elapsed:9.4f} s {1e9 * elapsed / points:10.1f} ns/pt")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--points", type=int, default=100_000)
+    args = parser.parse_args()
+
+    expr = expression()
+    xs = np.linspace(0, 10, args.points)
+    ys = np.linspace(-1, 1, args.points)
+    pairs = list(zip(xs.tolist(), ys.tolist()))
+
+    expected = timed(
+        "evaluate",
+        lambda: [expr.evaluate(x=x, y=y) for x, y in pairs],
+        args.points,
+    )
+    timed(
+        "python_function",
+        lambda: [expr.python_function(x=x, y=y) for x, y in pairs],
+        args.points,
+    )
+    f = expr.compile(["x", "y"])
+    timed("compile", lambda: [f(x, y) for x, y in pairs], args.points)
+    g = expr.compile(["x", "y"], vectorize=True)
+    result = timed("compile(vectorize=True)", lambda: g(xs, ys), args.points)
+
+    print(f"max difference: {np.abs(result - expected).max():.3g}")
+
+    print("\nValue and gradient")
+    x, y = Variable("x"), Variable("y")
+    separate = [
+        e.compile(["x", "y"])
+        for e in (expr, expr.derivative(x), expr.derivative(y))
+    ]
+    expected = timed(
+        "compile per expression",
+        lambda: [tuple(f(x, y) for f in separate) for x, y in pairs],
+        args.points,
+    )
+    h = compile_gradient(expr, ["x", "y"])
+    result = timed(
+        "compile_gradient",
+        lambda: [h(x, y) for x, y in pairs],
+        args.points,
+    )
+    result = [(value, *gradient) for value, gradient in result]
+    print(f"max difference: {np.abs(np.subtract(result, expected)).max():.3g}")
+
+
+if __name__ == "__main__":
+    main()
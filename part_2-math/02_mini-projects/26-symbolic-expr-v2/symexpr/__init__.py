@@ -16,6 +16,7 @@ from symexpr.expressions import (
     Sum,
     Variable,
 )
+from symexpr.compiler import compile_gradient, compile_system
 from symexpr.utils import distinct_variables
 
 __all__ = [
@@ -30,5 +31,7 @@ __all__ = [
     "Quotient",
     "Sum",
     "Variable",
+    "compile_gradient",
+    "compile_system",
     "distinct_variables",
 ]
@@ -0,0 +1,244 @@
+"""
+Compilation of symbolic expressions into native Python functions.
+
+The Python source of the expressions is generated and compiled only once, into
+a function whose parameters are the variables of the expressions, so calling
+it doesn't walk the expression tree or parse any source code.
+
+Expressions are hash-consed, so a subexpression that appears several times,
+in one expression or across several of them (e.g. a function and its
+derivatives), is a single node. The generated code computes each of those
+shared nodes once, stores it in a local variable and reuses it (common
+subexpression elimination).
+
+The well-known functions are looked up in a namespace called `math` by the
+generated code, so binding that name to NumPy instead of the `math` module
+makes the same source work on NumPy arrays, evaluating the expressions on
+millions of points in a single call.
+"""
+
+import math
+
+from symexpr.expressions import (
+    Apply,
+    Difference,
+    Expression,
+    Negative,
+    Number,
+    Power,
+    Product,
+    Quotient,
+    Sum,
+    Variable,
+)
+
+_OPERATORS = {
+    Sum: "+",
+    Difference: "-",
+    Product: "*",
+    Quotient: "/",
+    Power: "**",
+}
+
+
+def _namespace(vectorize: bool) -> dict:
+    if not vectorize:
+        return {"math": math}
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    return {"math": np}
+
+
+def _children(expr: Expression) -> list[Expression]:
+    return [op for op in expr._operands() if isinstance(op, Expression)]
+
+
+def _topological_order(exprs) -> tuple[list[Expression], dict]:
+    """
+    Return the distinct nodes of the expressions, every node after its
+    operands, and the number of times each node is used as an operand or as
+    one of the expressions.
+    """
+    order, uses, visited = [], {}, set()
+    for root in exprs:
+        uses[root] = uses.get(root, 0) + 1
+        # iterative post-order traversal, so deep expressions don't hit the
+        # recursion limit
+        stack = [(root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                order.append(node)
+                continue
+            if node in visited:
+                continue
+            visited.add(node)
+            stack.append((node, True))
+            for child in _children(node):
+                uses[child] = uses.get(child, 0) + 1
+                if child not in visited:
+                    stack.append((child, False))
+    return order, uses
+
+
+def _operand(code: str) -> str:
+    return code if code.isidentifier() else f"({code})"
+
+
+def _node_code(node: Expression, codes: dict) -> str:
+    """Return the Python code of the node given the code of its operands."""
+    if isinstance(node, Variable):
+        return node.name
+    if isinstance(node, Number):
+        return str(node.value)
+    if isinstance(node, Negative):
+        return f"-{_operand(codes[node.expr])}"
+    if isinstance(node, Apply):
+        return f"math.{node.function.name}({codes[node.argument]})"
+    left, right = (_operand(codes[child]) for child in _children(node))
+    return f"{left} {_OPERATORS[type(node)]} {right}"
+
+
+def _as_tuple(codes) -> str:
+    return "(" + "".join(f"{code}, " for code in codes) + ")"
+
+
+def generate_source(
+    exprs, variables, name="compiled_expressions", output=_as_tuple
+):
+    """
+    Generate the source of a Python function that takes the given variables
+    and returns the tuple of values of the expressions, computing every
+    subexpression shared by any of them only once.
+
+    Args:
+        exprs (list[Expression]): The expressions to compute.
+        variables (list[str]): The names of the parameters of the function.
+        name (str): The name of the function.
+        output (function): Takes the list with the code of the value of each
+            expression and returns the code of the result of the function. By
+            default, the tuple of values.
+
+    Returns:
+        str: The source code of the function.
+    """
+    order, uses = _topological_order(exprs)
+    lines, codes = [], {}
+    for node in order:
+        code = _node_code(node, codes)
+        if uses[node] > 1 and not isinstance(node, (Variable, Number)):
+            codes[node] = f"_{len(lines)}"
+            lines.append(f"    {codes[node]} = {code}")
+        else:
+            codes[node] = code
+    lines.append(f"    return {output([codes[expr] for expr in exprs])}")
+    return f"def {name}({', '.join(variables)}):\n" + "\n".join(lines) + "\n"
+
+
+def variables_of(exprs) -> list[str]:
+    """
+    Return the names of the distinct variables of the expressions, in
+    alphabetical order.
+    """
+    order, _ = _topological_order(exprs)
+    return sorted({node.name for node in order if isinstance(node, Variable)})
+
+
+def _compile(exprs, variables, vectorize, output=_as_tuple):
+    names = variables_of(exprs)
+    variables = names if variables is None else list(variables)
+    missing = set(names) - set(variables)
+    if missing:
+        raise ValueError(f"Variables {sorted(missing)} not in {variables}")
+    invalid = [
+        name
+        for name in variables
+        if not name.isidentifier() or name == "math" or name.startswith("_")
+    ]
+    if invalid:
+        raise ValueError(f"Invalid variable names {invalid}")
+
+    source = generate_source(exprs, variables, output=output)
+    namespace = _namespace(vectorize)
+    exec(compile(source, "<symexpr>", "exec"), namespace)
+    function = namespace["compiled_expressions"]
+    # the expressions may be huge as trees, so the (shared) source is shown
+    function.__doc__ = source
+    return function
+
+
+def compile_system(exprs, variables=None, vectorize=False):
+    """
+    Compile several expressions into a single Python function that returns
+    the tuple of their values, computing their common subexpressions once.
+
+    Args:
+        exprs (list[Expression]): The expressions to compile.
+        variables (list[str], optional): The names of the parameters of the
+            function, in order. Defaults to the variables of the expressions in
+            alphabetical order.
+        vectorize (bool): If True, the function uses NumPy for the well-known
+            functions, so its arguments can be NumPy arrays.
+
+    Returns:
+        function: A function that takes the values of the variables, as
+            positional or keyword arguments, and returns a tuple with the value
+            of each expression.
+
+    Raises:
+        ValueError: If the expressions contain variables that are not in
+            variables, or if any of them is not a valid Python identifier.
+    """
+    return _compile(list(exprs), variables, vectorize)
+
+
+def compile_expression(expr, variables=None, vectorize=False):
+    """
+    Compile the expression into a Python function.
+
+    Args:
+        expr (Expression): The expression to compile.
+        variables (list[str], optional): The names of the parameters of the
+            function, in order. Defaults to the variables of the expression in
+            alphabetical order.
+        vectorize (bool): If True, the function uses NumPy for the well-known
+            functions, so its arguments can be NumPy arrays.
+
+    Returns:
+        function: A function that takes the values of the variables, as
+            positional or keyword arguments, and returns the value of the
+            expression.
+
+    Raises:
+        ValueError: If the expression contains variables that are not in
+            variables, or if any of them is not a valid Python identifier.
+    """
+    return _compile([expr], variables, vectorize, lambda codes: codes[0])
+
+
+def compile_gradient(expr, variables=None, vectorize=False):
+    """
+    Compile the expression together with its derivatives with respect to each
+    of the variables into a single function, sharing the work common to all
+    of them.
+
+    Args:
+        expr (Expression): The expression to compile.
+        variables (list[str], optional): The variables of the gradient, which
+            are also the parameters of the function, in order. Defaults to the
+            variables of the expression in alphabetical order.
+        vectorize (bool): If True, the function accepts NumPy arrays.
+
+    Returns:
+        function: A function that takes the values of the variables and
+            returns the tuple (value, gradient), where gradient is the tuple
+            of partial derivatives in the order of variables.
+    """
+    variables = variables_of([expr]) if variables is None else list(variables)
+    partials = [expr.derivative(Variable(name)) for name in variables]
+    return _compile(
+        [expr, *partials],
+        variables,
+        vectorize,
+        lambda codes: f"({codes[0]}, {_as_tuple(codes[1:])})",
+    )
@@ -3,7 +3,9 @@ Python classes that represent symbolic Mathematical expressions.
 """
 
 import math
+import weakref
 from abc import ABC, abstractmethod
+from functools import wraps
 
 _well_known_function_bindings = {
     "sin": math.sin,
@@ -13,12 +15,98 @@ _well_known_function_bindings = {
     "sqrt": math.sqrt,
 }
 
+# All the expressions alive, keyed by their class and their operands, so that
+# structurally equal expressions are the same object (hash-consing): shared
+# subexpressions are stored once, and equality is identity.
+_interned = weakref.WeakValueDictionary()
+
+
+def _memoized(method):
+    """
+    Cache the results of a method of an Expression per node and arguments.
+    Expressions are immutable and interned, so results can be reused by any
+    expression that shares the node.
+    """
+
+    @wraps(method)
+    def memoized_method(self, *args):
+        key = (method.__name__, *args)
+        try:
+            return self._memo[key]
+        except KeyError:
+            result = self._memo[key] = method(self, *args)
+            return result
+
+    return memoized_method
+
+
+def _is_numeric(expr) -> bool:
+    return (
+        isinstance(expr, Number)
+        and isinstance(expr.value, (int, float))
+        and not isinstance(expr.value, bool)
+    )
+
+
+def _is_value(expr, value) -> bool:
+    return _is_numeric(expr) and expr.value == value
+
+
+# Integer powers are only folded up to this size: 3^10000000 would take
+# seconds to compute and could not even be printed
+_MAX_FOLDED_POWER_BITS = 1024
+
+
+def _is_small_power(base, exponent) -> bool:
+    if isinstance(base, int) and isinstance(exponent, int) and abs(base) > 1:
+        return exponent * math.log2(abs(base)) <= _MAX_FOLDED_POWER_BITS
+    return True
+
 
 class Expression(ABC):
     """
     Base class for all symbolic expressions.
+
+    Expressions are immutable and hash-consed: creating an expression equal to
+    an existing one returns the existing object. Trivial operations are
+    simplified when the expressions are created, so e.g. `Product(Number(1), x)`
+    is `x` and `Sum(Number(2), Number(3))` is `Number(5)`.
     """
 
+    __slots__ = ("_memo", "__weakref__")
+
+    @classmethod
+    def _intern(cls, key, **operands):
+        """
+        Return the interned expression of this class with the given operands,
+        creating it if needed.
+        """
+        key = (cls, *key)
+        expr = _interned.get(key)
+        if expr is None:
+            expr = object.__new__(cls)
+            for name, operand in operands.items():
+                object.__setattr__(expr, name, operand)
+            object.__setattr__(expr, "_memo", {})
+            _interned[key] = expr
+        return expr
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return (type(self), self._operands())
+
+    @abstractmethod
+    def _operands(self):
+        """
+        Return the arguments that create the expression.
+
+        Returns:
+            tuple: The operands of the expression.
+        """
+        pass
+
     @abstractmethod
     def evaluate(self, **bindings):
         """
@@ -62,8 +150,37 @@ class Expression(ABC):
         Returns:
             float: The numerical result of evaluating the expression.
         """
+        # The source is generated and parsed only once per expression
+        if "code" not in self._memo:
+            self._memo["code"] = compile(
+                self._python_expr(), "<symexpr>", "eval"
+            )
         global_vars = {"math": math}
-        return eval(self._python_expr(), global_vars, bindings)
+        return eval(self._memo["code"], global_vars, bindings)
+
+    def compile(self, vars=None, vectorize=False):
+        """
+        Return a Python function that evaluates the expression, compiled once
+        and cached per expression, so that each call just runs native code.
+
+        Args:
+            vars (list[str], optional): The names of the parameters of the
+                function, in order. Defaults to the variables of the expression
+                in alphabetical order.
+            vectorize (bool): If True, the function accepts NumPy arrays and
+                evaluates the expression on all their elements at once.
+
+        Returns:
+            function: A function that takes the values of the variables, e.g.
+                `expr.compile(["x", "y"])(2, 3)` or `f(x=2, y=3)`.
+        """
+        # pylint: disable=import-outside-toplevel
+        from symexpr.compiler import compile_expression
+
+        key = ("compile", None if vars is None else tuple(vars), vectorize)
+        if key not in self._memo:
+            self._memo[key] = compile_expression(self, vars, vectorize)
+        return self._memo[key]
 
     @staticmethod
     def _to_number_if_needed(arg):
@@ -158,8 +275,13 @@ class Variable(Expression):
     Represents a single variable.
     """
 
-    def __init__(self, name: str):
-        self.name = name
+    __slots__ = ("name",)
+
+    def __new__(cls, name: str):
+        return cls._intern((name,), name=name)
+
+    def _operands(self):
+        return (self.name,)
 
     def evaluate(self, **bindings):
         try:
@@ -170,6 +292,7 @@ class Variable(Expression):
     def _python_expr(self):
         return self.name
 
+    @_memoized
     def expand(self) -> Expression:
         return self
 
@@ -184,11 +307,13 @@ class Variable(Expression):
     def latex(self):
         return self.name
 
+    @_memoized
     def derivative(self, variable):
         if variable.name == self.name:
             return Number(1)
         return Number(0)
 
+    @_memoized
     def substitute(self, var, expression):
         if var.name == self.name:
             return expression
@@ -200,8 +325,14 @@ class Number(Expression):
     Represents a single number.
     """
 
-    def __init__(self, value: int | float):
-        self.value = value
+    __slots__ = ("value",)
+
+    def __new__(cls, value: int | float):
+        # 1 and 1.0 are different numbers, as they are written differently
+        return cls._intern((type(value), value), value=value)
+
+    def _operands(self):
+        return (self.value,)
 
     def evaluate(self, **bindings):
         return self.value
@@ -209,6 +340,7 @@ class Number(Expression):
     def _python_expr(self):
         return str(self.value)
 
+    @_memoized
     def expand(self) -> Expression:
         return self
 
@@ -223,9 +355,11 @@ class Number(Expression):
     def latex(self):
         return str(self.value)
 
+    @_memoized
     def derivative(self, variable: str):
         return Number(0)
 
+    @_memoized
     def substitute(self, var, expression):
         return self
 
@@ -235,12 +369,23 @@ class Negative(Expression):
     Represents the negative of an expression.
     """
 
-    def __init__(self, expr: Expression):
-        self.expr = expr
+    __slots__ = ("expr",)
+
+    def __new__(cls, expr: Expression):
+        # -(n) = -n, -(-a) = a
+        if _is_numeric(expr):
+            return Number(-expr.value)
+        if isinstance(expr, Negative):
+            return expr.expr
+        return cls._intern((expr,), expr=expr)
+
+    def _operands(self):
+        return (self.expr,)
 
     def evaluate(self, **bindings):
         return -1 * self.expr.evaluate(**bindings)
 
+    @_memoized
     def expand(self):
         return Negative(self.expr.expand())
 
@@ -258,9 +403,11 @@ class Negative(Expression):
     def latex(self):
         return f"-{self.expr.latex()}"
 
+    @_memoized
     def derivative(self, variable: str):
         return Negative(self.expr.derivative(variable))
 
+    @_memoized
     def substitute(self, var, expression):
         return Negative(self.expr.substitute(var, expression))
 
@@ -270,9 +417,20 @@ class Sum(Expression):
     Represents the sum of two expressions.
     """
 
-    def __init__(self, left: Expression, right: Expression):
-        self.left = left
-        self.right = right
+    __slots__ = ("left", "right")
+
+    def __new__(cls, left: Expression, right: Expression):
+        if _is_numeric(left) and _is_numeric(right):
+            return Number(left.value + right.value)
+        # 0 + a = a, a + 0 = a
+        if _is_value(left, 0):
+            return right
+        if _is_value(right, 0):
+            return left
+        return cls._intern((left, right), left=left, right=right)
+
+    def _operands(self):
+        return (self.left, self.right)
 
     def evaluate(self, **bindings):
         return self.left.evaluate(**bindings) + self.right.evaluate(**bindings)
@@ -280,6 +438,7 @@ class Sum(Expression):
     def _python_expr(self):
         return f"({self.left._python_expr()}) + ({self.right._python_expr()})"
 
+    @_memoized
     def expand(self):
         return Sum(self.left.expand(), self.right.expand())
 
@@ -294,11 +453,13 @@ class Sum(Expression):
     def latex(self):
         return f"{self.left.latex()} + {self.right.latex()}"
 
+    @_memoized
     def derivative(self, variable: str):
         return Sum(
             self.left.derivative(variable), self.right.derivative(variable)
         )
 
+    @_memoized
     def substitute(self, var, new):
         return Sum(
             self.left.substitute(var, new), self.right.substitute(var, new)
@@ -310,13 +471,27 @@ class Difference(Expression):
     Represents the difference of two expressions.
     """
 
-    def __init__(self, left: Expression, right: Expression):
-        self.left = left
-        self.right = right
+    __slots__ = ("left", "right")
+
+    def __new__(cls, left: Expression, right: Expression):
+        if _is_numeric(left) and _is_numeric(right):
+            return Number(left.value - right.value)
+        # a - a = 0, a - 0 = a, 0 - a = -a
+        if left is right:
+            return Number(0)
+        if _is_value(right, 0):
+            return left
+        if _is_value(left, 0):
+            return Negative(right)
+        return cls._intern((left, right), left=left, right=right)
+
+    def _operands(self):
+        return (self.left, self.right)
 
     def evaluate(self, **bindings):
         return self.left.evaluate(**bindings) - self.right.evaluate(**bindings)
 
+    @_memoized
     def expand(self):
         return Difference(self.left.expand(), self.right.expand())
 
@@ -334,11 +509,13 @@ class Difference(Expression):
     def latex(self):
         return f"{self.left.latex()} - {self.right.latex()}"
 
+    @_memoized
     def derivative(self, variable: str):
         return Difference(
             self.left.derivative(variable), self.right.derivative(variable)
         )
 
+    @_memoized
     def substitute(self, var, new):
         return Difference(
             self.left.substitute(var, new), self.right.substitute(var, new)
@@ -350,9 +527,29 @@ class Product(Expression):
     Represents the product of two expressions.
     """
 
-    def __init__(self, left: Expression, right: Expression):
-        self.left = left
-        self.right = right
+    __slots__ = ("left", "right")
+
+    def __new__(cls, left: Expression, right: Expression):
+        if _is_numeric(left) and _is_numeric(right):
+            return Number(left.value * right.value)
+        # 0 * a = 0, a * 0 = 0, 1 * a = a, a * 1 = a
+        if _is_value(left, 0) or _is_value(right, 0):
+            return Number(0)
+        if _is_value(left, 1):
+            return right
+        if _is_value(right, 1):
+            return left
+        # a * (b * c) = (a * b) * c when both a and b are numbers
+        if (
+            _is_numeric(left)
+            and isinstance(right, Product)
+            and _is_numeric(right.left)
+        ):
+            return Product(Number(left.value * right.left.value), right.right)
+        return cls._intern((left, right), left=left, right=right)
+
+    def _operands(self):
+        return (self.left, self.right)
 
     def evaluate(self, **bindings):
         return self.left.evaluate(**bindings) * self.right.evaluate(**bindings)
@@ -360,6 +557,7 @@ class Product(Expression):
     def _python_expr(self):
         return f"({self.left._python_expr()}) * ({self.right._python_expr()})"
 
+    @_memoized
     def expand(self) -> Expression:
         expanded_left = self.left.expand()
         expanded_right = self.right.expand()
@@ -390,6 +588,7 @@ class Product(Expression):
     def latex(self):
         return f"{self.left.latex()} \\cdot {self.right.latex()}"
 
+    @_memoized
     def derivative(self, variable):
         if isinstance(self.left, Number):
             return Product(self.left, self.right.derivative(variable))
@@ -405,6 +604,7 @@ class Product(Expression):
                 Product(self.left, self.right.derivative(variable)),
             )
 
+    @_memoized
     def substitute(self, var, new):
         return Product(
             self.left.substitute(var, new), self.right.substitute(var, new)
@@ -416,15 +616,39 @@ class Quotient(Expression):
     Represents the quotient of a numerator and a denominator.
     """
 
-    def __init__(self, numerator: Expression, denominator: Expression):
-        self.numerator = numerator
-        self.denominator = denominator
+    __slots__ = ("numerator", "denominator")
+
+    def __new__(cls, numerator: Expression, denominator: Expression):
+        if _is_numeric(numerator) and _is_numeric(denominator):
+            n, d = numerator.value, denominator.value
+            # integer quotients are only folded when they are exact, so that
+            # e.g. 1 / 3 stays a fraction
+            if d != 0 and (isinstance(n, float) or isinstance(d, float)):
+                return Number(n / d)
+            if d != 0 and n % d == 0:
+                return Number(n // d)
+        # 0 / a = 0, a / 1 = a, a / a = 1
+        if _is_value(numerator, 0) and not _is_value(denominator, 0):
+            return Number(0)
+        if _is_value(denominator, 1):
+            return numerator
+        if numerator is denominator and not _is_value(numerator, 0):
+            return Number(1)
+        return cls._intern(
+            (numerator, denominator),
+            numerator=numerator,
+            denominator=denominator,
+        )
+
+    def _operands(self):
+        return (self.numerator, self.denominator)
 
     def evaluate(self, **bindings):
         return self.numerator.evaluate(**bindings) / self.denominator.evaluate(
             **bindings
         )
 
+    @_memoized
     def expand(self):
         return Quotient(self.numerator.expand(), self.denominator.expand())
 
@@ -444,11 +668,18 @@ class Quotient(Expression):
             f"\\frac{{{self.numerator.latex()}}}{{{self.denominator.latex()}}}"
         )
 
+    @_memoized
     def derivative(self, variable: str):
-        return Product(
-            self.numerator, Quotient(Number(1), self.denominator)
-        ).derivative(variable)
+        # (n / d)' = (n' * d - n * d') / d^2
+        return Quotient(
+            Difference(
+                Product(self.numerator.derivative(variable), self.denominator),
+                Product(self.numerator, self.denominator.derivative(variable)),
+            ),
+            Power(self.denominator, Number(2)),
+        )
 
+    @_memoized
     def substitute(self, var, new):
         return Quotient(
             self.numerator.substitute(var, new),
@@ -460,9 +691,37 @@ class Power(Expression):
     Represents the power of a base and an exponent.
     """
 
-    def __init__(self, base: Expression, exponent: Expression):
-        self.base = base
-        self.exponent = exponent
+    __slots__ = ("base", "exponent")
+
+    def __new__(cls, base: Expression, exponent: Expression):
+        if (
+            _is_numeric(base)
+            and _is_numeric(exponent)
+            and _is_small_power(base.value, exponent.value)
+        ):
+            # as with quotients, 2^-1 stays a fraction, and powers that are
+            # complex, undefined (e.g. 0^-1) or too large for a float (e.g.
+            # 2.0^10000) are left as they are
+            try:
+                value = base.value**exponent.value
+            except (ZeroDivisionError, OverflowError):
+                value = None
+            if isinstance(value, int) or (
+                isinstance(value, float)
+                and isinstance(base.value * exponent.value, float)
+            ):
+                return Number(value)
+        # a^0 = 1, a^1 = a, 1^a = 1
+        if _is_value(exponent, 0):
+            return Number(1)
+        if _is_value(exponent, 1):
+            return base
+        if _is_value(base, 1):
+            return Number(1)
+        return cls._intern((base, exponent), base=base, exponent=exponent)
+
+    def _operands(self):
+        return (self.base, self.exponent)
 
     def evaluate(self, **bindings):
         return self.base.evaluate(**bindings) ** self.exponent.evaluate(
@@ -474,6 +733,7 @@ class Power(Expression):
             f"({self.base._python_expr()}) ** ({self.exponent._python_expr()})"
         )
 
+    @_memoized
     def expand(self):
         return Power(self.base.expand(), self.exponent.expand())
 
@@ -488,6 +748,7 @@ class Power(Expression):
     def latex(self):
         return f"{self.base.latex()}^{{{self.exponent.latex()}}}"
 
+    @_memoized
     def derivative(self, variable: str):
         if isinstance(self.exponent, Number):
             power_rule = Product(
@@ -496,17 +757,30 @@ class Power(Expression):
             )
             return Product(power_rule, self.base.derivative(variable))
         elif isinstance(self.base, Number):
-            exponential_rule = Product(
-                Apply(Function("ln"), Number(self.base.value)),
-            )
+            # (b^u)' = log(b) * b^u * u'
+            exponential_rule = Product(Apply(Function("log"), self.base), self)
             return Product(exponential_rule, self.exponent.derivative(variable))
         else:
-            raise NotImplementedError(
-                "Can't calculate derivative of {str(self)}"
+            # (f^g)' = f^g * (g' * log(f) + g * f' / f)
+            return Product(
+                self,
+                Sum(
+                    Product(
+                        self.exponent.derivative(variable),
+                        Apply(Function("log"), self.base),
+                    ),
+                    Quotient(
+                        Product(self.exponent, self.base.derivative(variable)),
+                        self.base,
+                    ),
+                ),
             )
 
+    @_memoized
     def substitute(self, var, new):
-        return self
+        return Power(
+            self.base.substitute(var, new), self.exponent.substitute(var, new)
+        )
 
 class Function:
     """
@@ -541,9 +815,15 @@ class Apply(Expression):
     Represents the application of a function to an argument.
     """
 
-    def __init__(self, function: Function, argument: Expression):
-        self.function = function
-        self.argument = argument
+    __slots__ = ("function", "argument")
+
+    def __new__(cls, function: Function, argument: Expression):
+        return cls._intern(
+            (function.name, argument), function=function, argument=argument
+        )
+
+    def _operands(self):
+        return (self.function, self.argument)
 
     def evaluate(self, **bindings):
         return _well_known_function_bindings[self.function.name](
@@ -553,6 +833,7 @@ class Apply(Expression):
     def _python_expr(self):
         return f"math.{self.function.name}({self.argument._python_expr()})"
 
+    @_memoized
     def expand(self):
         return Apply(self.function, self.argument.expand())
 
@@ -567,6 +848,7 @@ class Apply(Expression):
     def latex(self):
         return f"{self.function.latex()}({{{self.argument.latex()}}})"
 
+    @_memoized
     def derivative(self, variable: str):
         if self.function.name in _well_known_derivatives:
             return Product(
@@ -579,6 +861,7 @@ class Apply(Expression):
             f"Derivative of {self.function.name!r} not implemented."
         )
 
+    @_memoized
     def substitute(self, var, new):
         return Apply(self.function, self.argument.substitute(var, new))
 
@@ -587,6 +870,7 @@ _var = Variable("placeholder variable for derivatives")
 _well_known_derivatives = {
     "sin": Apply(Function("cos"), _var),
     "cos": Negative(Apply(Function("sin"), _var)),
-    "ln": Quotient(Number(1), _var),
+    "tan": Quotient(Number(1), Power(Apply(Function("cos"), _var), Number(2))),
+    "log": Quotient(Number(1), _var),
     "sqrt": Quotient(Number(1), Product(Number(2), Apply(Function("sqrt"), _var))),
 }
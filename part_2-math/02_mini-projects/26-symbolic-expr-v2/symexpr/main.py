@@ -122,7 +122,11 @@ if __name__ == "__main__":
 
     # Contains sum
     print("Checking if an expression contains a sum...")
+    # sums of numbers are folded when created, so 2 + 3 is Number(5)
     expr = Number(2) + Number(3)
+    print(repr(expr), contains_sum(expr))
+
+    expr = Number(2) + Variable("x")
     print(contains_sum(expr))
 
     expr = Product(
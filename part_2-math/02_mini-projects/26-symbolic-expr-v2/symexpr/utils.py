@@ -29,7 +29,7 @@ def distinct_variables(expr: Expression) -> set[str]:
     # Then, in the combinators, we can just use recursion to keep collecting the
     # variables.
     if isinstance(expr, Variable):
-        return set(expr.name)
+        return {expr.name}
     elif isinstance(expr, Number):
         return set()
     elif isinstance(expr, Sum):
@@ -0,0 +1,81 @@
+"""Unit tests for the compilation of systems of expressions"""
+import math
+import unittest
+
+from symexpr import Apply, Function, Variable, compile_gradient, compile_system
+from symexpr.compiler import generate_source
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+x, y = Variable("x"), Variable("y")
+
+
+def sin(expr):
+    return Apply(Function("sin"), expr)
+
+
+class CompileSystemTest(unittest.TestCase):
+    """
+    compile_system test class
+    """
+
+    def test_values(self):
+        """Validates the values of the expressions of a system"""
+        exprs = [sin(x * y), sin(x * y) + y, x**2]
+        f = compile_system(exprs, ["x", "y"])
+        self.assertEqual(
+            f(0.5, 2), tuple(e.evaluate(x=0.5, y=2) for e in exprs)
+        )
+
+    def test_shared_subexpressions_are_computed_once(self):
+        """
+        Validates that a subexpression shared by several expressions appears
+        once in the generated code
+        """
+        source = generate_source(
+            [sin(x * y) + 1, sin(x * y) * 2], ["x", "y"]
+        )
+        self.assertEqual(source.count("math.sin"), 1)
+        self.assertEqual(source.count("x * y"), 1)
+
+
+class CompileGradientTest(unittest.TestCase):
+    """
+    compile_gradient test class
+    """
+
+    def test_gradient(self):
+        """
+        Validates the value and the partial derivatives against closed forms
+        """
+        expr = sin(x) * y**2 + x / y
+        f = compile_gradient(expr, ["x", "y"])
+        value, (df_dx, df_dy) = f(0.5, 2)
+        self.assertAlmostEqual(value, expr.evaluate(x=0.5, y=2))
+        self.assertAlmostEqual(df_dx, math.cos(0.5) * 4 + 1 / 2)
+        self.assertAlmostEqual(df_dy, math.sin(0.5) * 4 - 0.5 / 4)
+
+    def test_default_variables(self):
+        """
+        Validates that the variables default to those of the expression in
+        alphabetical order
+        """
+        _, gradient = compile_gradient(y * 3 + x)(1, 1)
+        self.assertEqual(gradient, (1, 3))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_vectorized_gradient(self):
+        """Validates the gradient on arrays of points"""
+        f = compile_gradient(sin(x) * y, ["x", "y"], vectorize=True)
+        xs, ys = np.linspace(0, 3, 7), np.linspace(-1, 1, 7)
+        value, (df_dx, df_dy) = f(xs, ys)
+        self.assertTrue(np.allclose(value, np.sin(xs) * ys))
+        self.assertTrue(np.allclose(df_dx, np.cos(xs) * ys))
+        self.assertTrue(np.allclose(df_dy, np.sin(xs)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,211 @@
+"""Unit tests for the symbolic expressions"""
+import gc
+import math
+import pickle
+import unittest
+import weakref
+
+from symexpr import (
+    Apply,
+    Difference,
+    Function,
+    Negative,
+    Number,
+    Power,
+    Product,
+    Quotient,
+    Sum,
+    Variable,
+)
+
+x, y = Variable("x"), Variable("y")
+
+
+def sin(expr):
+    return Apply(Function("sin"), expr)
+
+
+class HashConsingTest(unittest.TestCase):
+    """
+    Hash-consing test class
+    """
+
+    def test_equal_expressions_are_identical(self):
+        """
+        Validates that structurally equal expressions are the same object
+        """
+        self.assertIs(Variable("x"), x)
+        self.assertIs(Number(2.5), Number(2.5))
+        self.assertIs(sin(x * y + 1), sin(x * y + 1))
+        self.assertIsNot(x + y, y + x)
+
+    def test_numbers_of_different_types(self):
+        """Validates that 1 and 1.0 are distinct numbers"""
+        self.assertIsNot(Number(1), Number(1.0))
+        self.assertIsInstance(Number(1.0).value, float)
+
+    def test_immutable(self):
+        """Validates that the expressions can't be changed"""
+        with self.assertRaises(AttributeError):
+            x.name = "y"
+        with self.assertRaises(AttributeError):
+            (x + y).left = y
+
+    def test_pickle(self):
+        """Validates that unpickled expressions are interned"""
+        expr = sin(x) ** 2 / (x + 1)
+        self.assertIs(pickle.loads(pickle.dumps(expr)), expr)
+
+    def test_unused_expressions_are_released(self):
+        """Validates that the interned expressions are weakly referenced"""
+        ref = weakref.ref(Power(Variable("unused"), Number(3)))
+        gc.collect()
+        self.assertIsNone(ref())
+
+
+class SimplificationTest(unittest.TestCase):
+    """
+    Simplification test class
+    """
+
+    def test_numbers_are_folded(self):
+        """Validates the folding of the operations on numbers"""
+        self.assertIs(Number(2) + Number(3), Number(5))
+        self.assertIs(Sum(Number(2), Number(3)), Number(5))
+        self.assertIs(Number(2) - Number(3), Number(-1))
+        self.assertIs(Number(2) * Number(3), Number(6))
+        self.assertIs(Number(6) / Number(3), Number(2))
+        self.assertIs(Number(2) ** Number(10), Number(1024))
+        self.assertIs(Negative(Number(2)), Number(-2))
+        self.assertIs(Number(1.5) * Number(2), Number(3.0))
+
+    def test_inexact_results_are_kept(self):
+        """
+        Validates that inexact quotients and powers, and those that are
+        undefined, aren't folded
+        """
+        for expr in (
+            Number(1) / Number(3),
+            Number(2) ** Number(-1),
+            Number(0) ** Number(-1),
+            Number(-8) ** Number(0.5),
+            Number(2.0) ** Number(10000),
+        ):
+            self.assertIsInstance(expr, (Quotient, Power), str(expr))
+
+    def test_large_powers_are_kept(self):
+        """
+        Validates that integer powers are only folded while they are small
+        """
+        self.assertIs(Number(2) ** Number(1024), Number(2**1024))
+        self.assertIsInstance(Number(2) ** Number(1025), Power)
+        expr = Power(Number(3), Number(10**7))
+        self.assertIsInstance(expr, Power)
+        self.assertEqual(str(expr), "3^10000000")
+        self.assertIs(Number(-1) ** Number(10**7), Number(1))
+
+    def test_identities(self):
+        """Validates that the trivial identities are eliminated"""
+        self.assertIs(Number(0) + x, x)
+        self.assertIs(x + 0, x)
+        self.assertIs(x - 0, x)
+        self.assertIs(Number(0) - x, Negative(x))
+        self.assertIs(x - x, Number(0))
+        self.assertIs(Number(1) * x, x)
+        self.assertIs(x * 0, Number(0))
+        self.assertIs(x / 1, x)
+        self.assertIs(x / x, Number(1))
+        self.assertIs(Number(0) / x, Number(0))
+        self.assertIs(x ** 1, x)
+        self.assertIs(x ** 0, Number(1))
+        self.assertIs(Number(1) ** x, Number(1))
+        self.assertIs(Negative(Negative(x)), x)
+        self.assertIs(Number(2) * (Number(3) * x), Number(6) * x)
+
+    def test_simplified_expressions_evaluate_the_same(self):
+        """
+        Validates that the simplified expressions keep their value
+        """
+        expr = (x * 1 + 0) * (Number(2) + Number(3)) - (y - y) / (x + 1)
+        self.assertIs(expr, x * 5 - Number(0) / (x + 1))
+        self.assertEqual(expr.evaluate(x=3, y=2), 15)
+
+
+class DerivativeTest(unittest.TestCase):
+    """
+    Derivative test class
+    """
+
+    def assertDerivative(self, expr, expected, **bindings):
+        """
+        Compares the derivative with respect to x with the expected function
+        at a few values of x
+        """
+        derivative = expr.derivative(x)
+        for value in (0.3, 1.7, 2.5):
+            self.assertAlmostEqual(
+                derivative.evaluate(x=value, **bindings),
+                expected(value),
+                msg=str(derivative),
+            )
+
+    def test_known_derivatives(self):
+        """Validates derivatives with closed forms"""
+        self.assertIs(Number(5).derivative(x), Number(0))
+        self.assertIs(x.derivative(x), Number(1))
+        self.assertIs(y.derivative(x), Number(0))
+        self.assertIs((x**2).derivative(x), Number(2) * x)
+        self.assertDerivative(sin(x**2), lambda t: 2 * t * math.cos(t**2))
+        self.assertDerivative(
+            (3 * x**2 + x) * sin(x),
+            lambda t: (6 * t + 1) * math.sin(t) + (3 * t**2 + t) * math.cos(t),
+        )
+        self.assertDerivative(
+            Apply(Function("sqrt"), x * y) / (x + 1),
+            lambda t: (
+                math.sqrt(2 / t) / 2 / (t + 1) - math.sqrt(2 * t) / (t + 1) ** 2
+            ),
+            y=2,
+        )
+        self.assertDerivative(Number(2) ** x, lambda t: math.log(2) * 2**t)
+        self.assertDerivative(x**x, lambda t: t**t * (math.log(t) + 1))
+
+    def test_derivatives_are_memoized(self):
+        """
+        Validates that derivatives are computed once per node and shared by
+        the expressions that contain it
+        """
+        shared = sin(x) * x**3
+        self.assertIs(shared.derivative(x), shared.derivative(x))
+        derivative = (shared + 1).derivative(x)
+        self.assertIs(derivative, shared.derivative(x))
+        self.assertIs(Difference(shared, y).derivative(x), derivative)
+
+
+class ExpressionCompileTest(unittest.TestCase):
+    """
+    Expression.compile and python_function test class
+    """
+
+    def test_compile_matches_evaluate(self):
+        """
+        Validates that compiled functions and python_function give the values
+        of evaluate
+        """
+        expr = sin(x) * y + Quotient(x, y + 2) - Power(x, Number(3))
+        compiled = expr.compile(["x", "y"])
+        self.assertIs(expr.compile(["x", "y"]), compiled)
+        for bindings in ({"x": 0.5, "y": 2}, {"x": -3, "y": 0.25}):
+            expected = expr.evaluate(**bindings)
+            self.assertAlmostEqual(compiled(**bindings), expected)
+            self.assertAlmostEqual(expr.python_function(**bindings), expected)
+        self.assertAlmostEqual(compiled(0.5, 2), expr.evaluate(x=0.5, y=2))
+
+    def test_missing_variables(self):
+        """Validates that every variable must be a parameter"""
+        with self.assertRaises(ValueError):
+            (x + y).compile(["x"])
+
+
+if __name__ == "__main__":
+    unittest.main()
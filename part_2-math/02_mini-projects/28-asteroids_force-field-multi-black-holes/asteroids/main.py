@@ -7,6 +7,8 @@ from random import randint
 import pygame
 
 from asteroids.models.asteroid import Asteroid, BlackHole, PolygonModel, Ship
+from asteroids.models.collisions import colliding_with, hit_by_segment
+from asteroids.models.world import World
 
 asteroid_count = 1
 width, height = 400, 400
@@ -75,6 +77,9 @@ if __name__ == "__main__":
 
     black_holes = [black_hole, black_hole2]
 
+    # The asteroids are advanced all at once by the world
+    world = World.from_models(asteroids, black_holes)
+
     # Used to track how fast the screen updates
     clock = pygame.time.Clock()
 
@@ -95,10 +100,10 @@ if __name__ == "__main__":
         draw_poly(screen, ship)
         for black_hole in black_holes:
             draw_poly(screen, black_hole, fill=True)
+        world.update_sources(black_holes)
+        world.step(milliseconds)
+        world.sync_models(asteroids)
         for asteroid in asteroids:
-            asteroid.move(
-                milliseconds, thrust_vector=(0, 0), gravity_sources=black_holes
-            )
             draw_poly(screen, asteroid)
 
         # Let the black holes attract each other
@@ -114,9 +119,10 @@ if __name__ == "__main__":
             laser_beam = ship.laser_segment()
             draw_segment(screen, laser_beam)
 
-            for asteroid in asteroids:
-                if asteroid.does_intersect(laser_beam):
-                    asteroids.remove(asteroid)
+            hit = hit_by_segment(laser_beam, asteroids)
+            world.remove([asteroids.index(asteroid) for asteroid in hit])
+            for asteroid in hit:
+                asteroids.remove(asteroid)
             done = len(asteroids) == 0
 
         if keys[pygame.K_LEFT]:
@@ -138,9 +144,8 @@ if __name__ == "__main__":
             milliseconds, thrust_vector=(tx, ty), gravity_sources=black_holes
         )
 
-        for asteroid in asteroids:
-            if asteroid.does_collide(ship):
-                done = True
+        if colliding_with(ship, asteroids):
+            done = True
 
         # Update the screen
         pygame.display.flip()
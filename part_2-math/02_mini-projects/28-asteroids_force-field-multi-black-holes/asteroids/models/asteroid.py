@@ -15,6 +15,13 @@ from vec2d.math import (
     translate,
 )
 
+from asteroids.models.collisions import (
+    bounding_box,
+    boxes_overlap,
+    polygon_intersects_segment,
+    polygons_collide,
+)
+
 
 class PolygonModel:
     """
@@ -74,13 +81,65 @@ class PolygonModel:
             return False
 
     def __init__(self, points) -> None:
-        self.points = points
-        self.rotation_angle = 0
-        self.x = 0
-        self.y = 0
+        self._points = points
+        self._rotation_angle = 0
+        self._x = 0
+        self._y = 0
         self.vx = 0
         self.vy = 0
         self.angular_velocity = 0
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """
+        Discards the cached transformed points, segments and bounding box, so
+        that they're recomputed the next time they're needed.
+        """
+        self._transformed = None
+        self._segments = None
+        self._bounding_box = None
+
+    # x, y, rotation_angle, and points are properties so that the cached
+    # geometry is invalidated whenever they change, either in move or from
+    # outside (e.g. when the ship is rotated with the keyboard)
+    @property
+    def points(self):
+        return self._points
+
+    @points.setter
+    def points(self, value):
+        self._points = value
+        self._invalidate()
+
+    @property
+    def x(self):
+        return self._x
+
+    @x.setter
+    def x(self, value):
+        if value != self._x:
+            self._x = value
+            self._invalidate()
+
+    @property
+    def y(self):
+        return self._y
+
+    @y.setter
+    def y(self, value):
+        if value != self._y:
+            self._y = value
+            self._invalidate()
+
+    @property
+    def rotation_angle(self):
+        return self._rotation_angle
+
+    @rotation_angle.setter
+    def rotation_angle(self, value):
+        if value != self._rotation_angle:
+            self._rotation_angle = value
+            self._invalidate()
 
     def move(self, milliseconds, thrust_vector, gravity_sources):
         tx, ty = thrust_vector
@@ -115,12 +174,18 @@ class PolygonModel:
 
     def transformed(self):
         """
-        Returns the list of points resulting of applying the corresponding
+        Returns the tuple of points resulting of applying the corresponding
         translation and rotation status of the polygon to the points that define
         the polygon shape.
+
+        The result is cached until the polygon is moved or rotated.
         """
-        rotated_points = rotate(self.rotation_angle, self.points)
-        return translate((self.x, self.y), rotated_points)
+        if self._transformed is None:
+            rotated_points = rotate(self.rotation_angle, self.points)
+            self._transformed = tuple(
+                translate((self.x, self.y), rotated_points)
+            )
+        return self._transformed
 
     def segments(
         self,
@@ -128,29 +193,46 @@ class PolygonModel:
         """
         Returns the segments that define the Polygon
         """
-        points = self.transformed()
-        for i in range(len(points)):
-            yield (points[i], points[(i + 1) % len(points)])
+        if self._segments is None:
+            points = self.transformed()
+            self._segments = [
+                (points[i], points[(i + 1) % len(points)])
+                for i in range(len(points))
+            ]
+        yield from self._segments
+
+    def bounding_box(self) -> tuple[float, float, float, float]:
+        """
+        Returns the axis-aligned bounding box (x_min, y_min, x_max, y_max) of
+        the transformed polygon. Cached along with the transformed points.
+        """
+        if self._bounding_box is None:
+            self._bounding_box = bounding_box(self.transformed())
+        return self._bounding_box
 
     def does_intersect(self, laser_beam_segment):
         """
         Returns True if the given segment intersects with any of the segments of
         the polygon, False otherwise
         """
-        for segment in self.segments():
-            if PolygonModel.do_segments_intersect(segment, laser_beam_segment):
-                return True
-        return False
+        if not boxes_overlap(
+            self.bounding_box(), bounding_box(laser_beam_segment)
+        ):
+            return False
+        return polygon_intersects_segment(
+            self.transformed(), laser_beam_segment
+        )
 
     def does_collide(self, other_polygon):
         """
         Returns true if any of the segments of the polygon intersects with any
         of the segments of the other polygon given.
         """
-        for segment in other_polygon.segments():
-            if self.does_intersect(segment):
-                return True
-        return False
+        if not boxes_overlap(self.bounding_box(), other_polygon.bounding_box()):
+            return False
+        return polygons_collide(
+            self.transformed(), other_polygon.transformed()
+        )
 
 
 class Ship(PolygonModel):
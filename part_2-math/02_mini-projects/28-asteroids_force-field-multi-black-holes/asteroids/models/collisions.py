@@ -0,0 +1,188 @@
+"""Collision detection for the Asteroids game
+
+Collision detection is done in two phases:
++ a broad phase that uses a uniform grid (SpatialHash) over the axis-aligned
+  bounding boxes of the polygons to find the pairs of polygons that might
+  collide.
++ a narrow phase that tests all the segment pairs of two polygons at once with
+  NumPy, instead of solving one 2x2 system per pair of segments.
+"""
+
+from collections import defaultdict
+from math import floor
+
+import numpy as np
+
+
+def bounding_box(points) -> tuple[float, float, float, float]:
+    """
+    Returns the axis-aligned bounding box (x_min, y_min, x_max, y_max) of the
+    given points.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    (x_min, y_min), (x_max, y_max) = points.min(axis=0), points.max(axis=0)
+    return float(x_min), float(y_min), float(x_max), float(y_max)
+
+
+def boxes_overlap(box1, box2) -> bool:
+    """Returns True if the two given bounding boxes overlap."""
+    return (
+        box1[0] <= box2[2]
+        and box2[0] <= box1[2]
+        and box1[1] <= box2[3]
+        and box2[1] <= box1[3]
+    )
+
+
+def polygon_segments(points) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the start and end points of the segments of the closed polygon
+    defined by the given points, as two (N, 2) arrays.
+    """
+    starts = np.asarray(points, dtype=np.float64)
+    return starts, np.roll(starts, -1, axis=0)
+
+
+def segments_intersect(p1, p2, q1, q2) -> np.ndarray:
+    """
+    Returns a boolean array telling whether the segments p1-p2 intersect with
+    the segments q1-q2. The arguments are arrays of points whose shapes
+    broadcast against each other, so that passing (N, 1, 2) and (1, M, 2)
+    arrays tests all the N x M pairs of segments in one go.
+
+    Uses the signs of the 2D cross products (orientation tests) of the end
+    points of each segment with respect to the other segment, so no linear
+    system needs to be solved. Parallel segments never intersect, as in
+    PolygonModel.do_segments_intersect.
+    """
+    p1, p2, q1, q2 = (np.asarray(a, dtype=np.float64) for a in (p1, p2, q1, q2))
+    r, s = p2 - p1, q2 - q1
+    qp = q1 - p1
+
+    def cross(u, v):
+        return u[..., 0] * v[..., 1] - u[..., 1] * v[..., 0]
+
+    denominator = cross(r, s)
+    parallel = denominator == 0
+    safe_denominator = np.where(parallel, 1.0, denominator)
+    t = cross(qp, s) / safe_denominator
+    u = cross(qp, r) / safe_denominator
+    return ~parallel & (t >= 0) & (t <= 1) & (u >= 0) & (u <= 1)
+
+
+def polygons_collide(points1, points2) -> bool:
+    """
+    Returns True if any of the segments of the closed polygon defined by
+    points1 intersects with any of the segments of the polygon defined by
+    points2, testing all the segment pairs in a single array operation.
+    """
+    starts1, ends1 = polygon_segments(points1)
+    starts2, ends2 = polygon_segments(points2)
+    return bool(
+        segments_intersect(
+            starts1[:, None], ends1[:, None], starts2[None], ends2[None]
+        ).any()
+    )
+
+
+def polygon_intersects_segment(points, segment) -> bool:
+    """
+    Returns True if any of the segments of the closed polygon defined by the
+    given points intersects with the given segment.
+    """
+    starts, ends = polygon_segments(points)
+    return bool(segments_intersect(starts, ends, *segment).any())
+
+
+class SpatialHash:
+    """
+    Uniform grid that buckets items by the cells covered by their axis-aligned
+    bounding boxes, so that only the items sharing a cell have to be checked
+    against each other.
+
+    The cell size should be about the size of the items; for the asteroids,
+    whose radius is at most 1, the default of 2 units works well.
+    """
+
+    def __init__(self, cell_size=2.0) -> None:
+        self.cell_size = cell_size
+        self.cells = defaultdict(list)
+        self.boxes = {}
+
+    def _cells(self, box):
+        x_min, y_min, x_max, y_max = box
+        size = self.cell_size
+        for i in range(floor(x_min / size), floor(x_max / size) + 1):
+            for j in range(floor(y_min / size), floor(y_max / size) + 1):
+                yield i, j
+
+    def insert(self, item, box) -> None:
+        """Adds the item with the given bounding box to the grid."""
+        self.boxes[item] = box
+        for cell in self._cells(box):
+            self.cells[cell].append(item)
+
+    def query(self, box) -> set:
+        """Returns the items whose bounding boxes overlap the given box."""
+        found = set()
+        for cell in self._cells(box):
+            for item in self.cells.get(cell, ()):
+                if item not in found and boxes_overlap(self.boxes[item], box):
+                    found.add(item)
+        return found
+
+    def pairs(self) -> set:
+        """
+        Returns the pairs of items (i, j) inserted in the grid whose bounding
+        boxes overlap. Each pair is returned once, with i inserted before j.
+        """
+        order = {item: n for n, item in enumerate(self.boxes)}
+        found = set()
+        for items in self.cells.values():
+            for n, a in enumerate(items):
+                for b in items[n + 1 :]:
+                    pair = (a, b) if order[a] < order[b] else (b, a)
+                    if pair not in found and boxes_overlap(
+                        self.boxes[a], self.boxes[b]
+                    ):
+                        found.add(pair)
+        return found
+
+
+def colliding_with(polygon, others, cell_size=2.0) -> list:
+    """
+    Returns the polygons from others that collide with the given polygon,
+    running the narrow phase only on those whose bounding boxes overlap with
+    the polygon's.
+    """
+    grid = SpatialHash(cell_size)
+    for n, other in enumerate(others):
+        grid.insert(n, other.bounding_box())
+    return [
+        others[n]
+        for n in sorted(grid.query(polygon.bounding_box()))
+        if polygons_collide(polygon.transformed(), others[n].transformed())
+    ]
+
+
+def hit_by_segment(segment, polygons) -> list:
+    """
+    Returns the polygons hit by the given segment (e.g. a laser beam). The
+    bounding boxes of all the polygons are first checked against the segment's
+    bounding box in one vectorized operation.
+    """
+    if not polygons:
+        return []
+    boxes = np.array([polygon.bounding_box() for polygon in polygons])
+    x_min, y_min, x_max, y_max = bounding_box(segment)
+    candidates = np.flatnonzero(
+        (boxes[:, 0] <= x_max)
+        & (x_min <= boxes[:, 2])
+        & (boxes[:, 1] <= y_max)
+        & (y_min <= boxes[:, 3])
+    )
+    return [
+        polygons[n]
+        for n in candidates
+        if polygon_intersects_segment(polygons[n].transformed(), segment)
+    ]
@@ -0,0 +1,183 @@
+"""Vectorized simulation of the Asteroids game world
+
+The World keeps the positions, velocities, rotation angles and angular
+velocities of all the bodies, and the positions and gravity of all the
+gravity sources (black holes), in NumPy arrays, so that every body is advanced
+in a single vectorized step instead of calling PolygonModel.move once per
+body.
+"""
+
+import numpy as np
+
+from asteroids.models.asteroid import PolygonModel
+
+INTEGRATORS = ("euler", "verlet")
+
+
+def gravitational_field(positions, source_positions, gravities):
+    """
+    Vectorized version of asteroid.gravitational_field that returns an (N, 2)
+    array with the gravitational field at each of the given (N, 2) positions.
+
+    Each source pulls with -gravity * (position - source_position), so the
+    total field is linear in the position:
+    -(sum of gravities) * position + sum of (gravity * source_position), which
+    is computed in O(N + M) for N positions and M sources. A body located at a
+    source (e.g. a black hole) gets no pull from it, as its term is zero.
+    """
+    positions = np.asarray(positions, dtype=np.float64)
+    gravities = np.asarray(gravities, dtype=np.float64)
+    if gravities.size == 0:
+        return np.zeros_like(positions)
+    source_positions = np.asarray(source_positions, dtype=np.float64)
+    weighted_sources = gravities @ source_positions
+    return weighted_sources - gravities.sum() * positions
+
+
+class World:
+    """
+    Holds the state of N bodies and M gravity sources in arrays and advances
+    all of them at once.
+
+    The bounds and the BOUNCE rule are the ones of PolygonModel: when BOUNCE is
+    True, bodies outside the bounds have the corresponding component of their
+    velocity reversed; otherwise, they wrap around to the other side.
+    """
+
+    X_MIN = PolygonModel.X_MIN
+    X_MAX = PolygonModel.X_MAX
+    Y_MIN = PolygonModel.Y_MIN
+    Y_MAX = PolygonModel.Y_MAX
+
+    BOUNCE = PolygonModel.BOUNCE
+
+    def __init__(
+        self,
+        positions,
+        velocities=None,
+        *,
+        rotation_angles=None,
+        angular_velocities=None,
+        source_positions=(),
+        gravities=(),
+        integrator="euler",
+    ) -> None:
+        if integrator not in INTEGRATORS:
+            raise ValueError(
+                f"unknown integrator {integrator!r}, expected one of "
+                f"{INTEGRATORS}"
+            )
+        self.positions = np.array(positions, dtype=np.float64).reshape(-1, 2)
+        count = len(self.positions)
+        self.velocities = self._array(velocities, (count, 2))
+        self.rotation_angles = self._array(rotation_angles, (count,))
+        self.angular_velocities = self._array(angular_velocities, (count,))
+        self.source_positions = np.array(
+            source_positions, dtype=np.float64
+        ).reshape(-1, 2)
+        self.gravities = np.array(gravities, dtype=np.float64).reshape(-1)
+        self.integrator = integrator
+
+    @staticmethod
+    def _array(values, shape):
+        if values is None:
+            return np.zeros(shape)
+        return np.array(values, dtype=np.float64).reshape(shape)
+
+    @classmethod
+    def from_models(cls, models, gravity_sources=(), **kwargs):
+        """
+        Returns a World holding the state of the given PolygonModel bodies, and
+        the given gravity sources (e.g. BlackHole instances).
+        """
+        return cls(
+            [(m.x, m.y) for m in models],
+            [(m.vx, m.vy) for m in models],
+            rotation_angles=[m.rotation_angle for m in models],
+            angular_velocities=[m.angular_velocity for m in models],
+            source_positions=[(s.x, s.y) for s in gravity_sources],
+            gravities=[s.gravity for s in gravity_sources],
+            **kwargs,
+        )
+
+    def update_sources(self, gravity_sources) -> None:
+        """
+        Copies the positions and gravity of the given gravity sources (e.g.
+        BlackHole instances), which may have moved since the world was created.
+        """
+        self.source_positions = np.array(
+            [(s.x, s.y) for s in gravity_sources], dtype=np.float64
+        ).reshape(-1, 2)
+        self.gravities = np.array(
+            [s.gravity for s in gravity_sources], dtype=np.float64
+        ).reshape(-1)
+
+    def remove(self, indices) -> None:
+        """
+        Removes the bodies at the given indices (e.g. the asteroids destroyed
+        by the laser), keeping the order of the rest.
+        """
+        self.positions = np.delete(self.positions, indices, axis=0)
+        self.velocities = np.delete(self.velocities, indices, axis=0)
+        self.rotation_angles = np.delete(self.rotation_angles, indices)
+        self.angular_velocities = np.delete(self.angular_velocities, indices)
+
+    def sync_models(self, models) -> None:
+        """
+        Copies the state of the bodies back into the given PolygonModel
+        instances (in the same order used to create the world), so that they
+        can be drawn or tested for collisions.
+        """
+        for n, m in enumerate(models):
+            m.x, m.y = self.positions[n].tolist()
+            m.vx, m.vy = self.velocities[n].tolist()
+            m.rotation_angle = float(self.rotation_angles[n])
+
+    def __len__(self):
+        return len(self.positions)
+
+    def accelerations(self, positions, thrust=None):
+        """Returns the (N, 2) accelerations of the bodies at the positions."""
+        a = gravitational_field(
+            positions, self.source_positions, self.gravities
+        )
+        if thrust is not None:
+            a += thrust
+        return a
+
+    def step(self, milliseconds, thrust=None) -> None:
+        """
+        Advances all the bodies by the given number of milliseconds.
+
+        Args:
+            milliseconds (float): the elapsed time.
+            thrust (np.ndarray, Optional): a 2D thrust vector applied to all the
+                bodies, or an (N, 2) array with one thrust vector per body.
+        """
+        dt = milliseconds / 1000.0
+        if self.integrator == "verlet":
+            # Velocity Verlet: symplectic, so orbits don't gain or lose energy
+            # over time as with Euler
+            a = self.accelerations(self.positions, thrust)
+            self.positions += self.velocities * dt + 0.5 * a * dt**2
+            a_next = self.accelerations(self.positions, thrust)
+            self.velocities += 0.5 * (a + a_next) * dt
+        else:
+            # Semi-implicit Euler, same as PolygonModel.move
+            self.velocities += self.accelerations(self.positions, thrust) * dt
+            self.positions += self.velocities * dt
+
+        self._apply_bounds()
+        self.rotation_angles += self.angular_velocities * dt
+
+    def _apply_bounds(self) -> None:
+        x, y = self.positions[:, 0], self.positions[:, 1]
+        if self.BOUNCE:
+            self.velocities[(x < self.X_MIN) | (x > self.X_MAX), 0] *= -1
+            self.velocities[(y < self.Y_MIN) | (y > self.Y_MAX), 1] *= -1
+        else:
+            width, height = self.X_MAX - self.X_MIN, self.Y_MAX - self.Y_MIN
+            x[x < self.X_MIN] += width
+            y[y < self.Y_MIN] += height
+            x[x > self.X_MAX] -= width
+            y[y > self.Y_MAX] -= height
@@ -0,0 +1,93 @@
+"""
+Benchmark for the collision detection of the Asteroids game.
+
+Scatters thousands of asteroids over a large field and finds all the colliding
+pairs of asteroids, and the asteroids hit by a laser beam, comparing the
+brute-force approach (every pair, every segment pair solved with
+np.linalg.solve) with the spatial hash broad phase followed by the vectorized
+narrow phase.
+
+Usage: python benchmark_collisions.py [--asteroids 2000] [--brute-force 100]
+"""
+
+import argparse
+import random
+from timeit import default_timer as timer
+
+from asteroids.models.asteroid import Asteroid, PolygonModel
+from asteroids.models.collisions import (
+    SpatialHash,
+    bounding_box,
+    hit_by_segment,
+    polygons_collide,
+)
+
+
+def brute_force_collide(a, b):
+    """Segment by segment collision test of the original implementation"""
+    return any(
+        PolygonModel.do_segments_intersect(s1, s2)
+        for s2 in b.segments()
+        for s1 in a.segments()
+    )
+
+
+def brute_force_pairs(asteroids):
+    """Tests every pair of asteroids"""
+    return {
+        (i, j)
+        for i in range(len(asteroids))
+        for j in range(i + 1, len(asteroids))
+        if brute_force_collide(asteroids[i], asteroids[j])
+    }
+
+
+def broad_phase_pairs(asteroids):
+    """Tests only the pairs whose bounding boxes overlap"""
+    grid = SpatialHash(cell_size=2.0)
+    points = [asteroid.transformed() for asteroid in asteroids]
+    for n, asteroid_points in enumerate(points):
+        grid.insert(n, bounding_box(asteroid_points))
+    return {
+        (i, j) for i, j in grid.pairs() if polygons_collide(points[i], points[j])
+    }
+
+
+def scene(count):
+    """Returns count asteroids over a field with ~1 asteroid per 4 units^2"""
+    side = (4 * count) ** 0.5
+    asteroids = [Asteroid() for _ in range(count)]
+    for asteroid in asteroids:
+        asteroid.x = random.uniform(-side / 2, side / 2)
+        asteroid.y = random.uniform(-side / 2, side / 2)
+        asteroid.rotation_angle = random.uniform(0, 6.28)
+    return asteroids, side
+
+
+def report(name, fn, *args):
+    """Runs fn(*args) printing how long it took and returns its result"""
+    start = timer()
+    result = fn(*args)
+    print(f"{name:>40}: {timer() - start:8.3f} s")
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--asteroids", type=int, default=2000)
+    parser.add_argument("--brute-force", type=int, default=100)
+    args = parser.parse_args()
+
+    random.seed(0)
+    small, _ = scene(args.brute_force)
+    n = args.brute_force
+    slow = report(f"brute force ({n} asteroids)", brute_force_pairs, small)
+    fast = report(f"broad phase ({n} asteroids)", broad_phase_pairs, small)
+    assert slow == fast, "both approaches must find the same collisions"
+
+    large, side = scene(args.asteroids)
+    n = args.asteroids
+    pairs = report(f"broad phase ({n} asteroids)", broad_phase_pairs, large)
+    laser = ((-side / 2, -side / 2), (side / 2, side / 2))
+    hits = report(f"laser hits ({n} asteroids)", hit_by_segment, laser, large)
+    print(f"{len(pairs)} colliding pairs, {len(hits)} asteroids hit by laser")
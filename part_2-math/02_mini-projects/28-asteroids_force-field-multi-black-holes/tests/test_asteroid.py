@@ -0,0 +1,86 @@
+"""Unit tests for the cached geometry of the Asteroids game models"""
+import unittest
+from math import pi
+
+import numpy as np
+from vec2d.math import rotate, translate
+
+from asteroids.models.asteroid import BlackHole, PolygonModel, Ship
+
+
+def expected_points(model):
+    """Transformed points of the model, computed without any cache"""
+    return translate(
+        (model.x, model.y), rotate(model.rotation_angle, model.points)
+    )
+
+
+class PolygonModelTest(unittest.TestCase):
+    """
+    PolygonModel test class
+    """
+
+    def assertGeometry(self, model):
+        """Compares the cached geometry of the model with the expected one"""
+        points = expected_points(model)
+        self.assertTrue(np.allclose(model.transformed(), points))
+        self.assertTrue(
+            np.allclose(
+                list(model.segments()),
+                list(zip(points, points[1:] + points[:1])),
+            )
+        )
+        xs, ys = zip(*points)
+        self.assertTrue(
+            np.allclose(
+                model.bounding_box(), (min(xs), min(ys), max(xs), max(ys))
+            )
+        )
+
+    def test_cache_is_invalidated(self):
+        """
+        Validates that the transformed points, segments and bounding box are
+        recomputed when x, y, rotation_angle or points change
+        """
+        model = PolygonModel([(1, 0), (0, 1), (-1, 0), (0, -1)])
+        self.assertGeometry(model)
+        black_hole = BlackHole(0.1)
+        black_hole.x = 5
+        new_points = [(2, 0), (0, 2), (0, 0)]
+        changes = {
+            "x": lambda: setattr(model, "x", 3),
+            "y": lambda: setattr(model, "y", -2),
+            "rotation_angle": lambda: setattr(model, "rotation_angle", pi / 6),
+            "points": lambda: setattr(model, "points", new_points),
+            "move": lambda: model.move(500, (1, 1), [black_hole]),
+        }
+        for name, change in changes.items():
+            before = model.transformed()
+            change()
+            self.assertNotEqual(model.transformed(), before, name)
+            self.assertGeometry(model)
+
+    def test_cache_is_reused(self):
+        """
+        Validates that the geometry is only computed once while the polygon
+        doesn't change, even when set to its current values
+        """
+        model = PolygonModel([(1, 0), (0, 1), (-1, 0)])
+        points = model.transformed()
+        model.x, model.y, model.rotation_angle = 0, 0, 0
+        self.assertIs(model.transformed(), points)
+        self.assertIs(model.bounding_box(), model.bounding_box())
+
+    def test_transformed_is_immutable(self):
+        """
+        Validates that the cached points are returned as a tuple, so callers
+        can't change them
+        """
+        model = Ship()
+        self.assertIsInstance(model.transformed(), tuple)
+        with self.assertRaises(TypeError):
+            model.transformed()[0] = (0, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+"""Unit tests for the collision detection of the Asteroids game"""
+import random
+import unittest
+
+import numpy as np
+
+from asteroids.models.asteroid import Asteroid, PolygonModel
+from asteroids.models.collisions import (
+    SpatialHash,
+    bounding_box,
+    boxes_overlap,
+    colliding_with,
+    hit_by_segment,
+    polygons_collide,
+    segments_intersect,
+)
+
+
+def per_pair_collide(a, b):
+    """Segment by segment collision test of the original implementation"""
+    return any(
+        PolygonModel.do_segments_intersect(s1, s2)
+        for s2 in b.segments()
+        for s1 in a.segments()
+    )
+
+
+def scene(count, side):
+    """Returns count asteroids randomly placed over a side x side field"""
+    asteroids = [Asteroid() for _ in range(count)]
+    for asteroid in asteroids:
+        asteroid.x = random.uniform(-side / 2, side / 2)
+        asteroid.y = random.uniform(-side / 2, side / 2)
+        asteroid.rotation_angle = random.uniform(0, 6.28)
+    return asteroids
+
+
+class CollisionsTest(unittest.TestCase):
+    """
+    Collision detection test class
+    """
+
+    def setUp(self):
+        random.seed(0)
+
+    def test_segments_intersect(self):
+        """
+        Validates that segments_intersect matches the per-pair
+        PolygonModel.do_segments_intersect
+        """
+        points = np.random.default_rng(0).uniform(-1, 1, (200, 4, 2))
+        got = segments_intersect(*np.moveaxis(points, 1, 0))
+        expected = [
+            PolygonModel.do_segments_intersect((p1, p2), (q1, q2))
+            for p1, p2, q1, q2 in points.tolist()
+        ]
+        self.assertListEqual(got.tolist(), expected)
+        self.assertTrue(0 < got.sum() < len(got))
+
+        # all the pairs at once, by broadcasting
+        starts, ends = points[:10, 0], points[:10, 1]
+        grid = segments_intersect(
+            starts[:, None], ends[:, None], starts[None], ends[None]
+        )
+        self.assertEqual(grid.shape, (10, 10))
+        self.assertListEqual(grid.diagonal().tolist(), [False] * 10)
+
+    def test_polygons_collide(self):
+        """
+        Validates that polygons_collide matches the per-pair check for every
+        pair of a crowded scene
+        """
+        asteroids = scene(40, 10)
+        for a in asteroids:
+            for b in asteroids:
+                if a is not b:
+                    expected = per_pair_collide(a, b)
+                    self.assertEqual(
+                        polygons_collide(a.transformed(), b.transformed()),
+                        expected,
+                    )
+                    self.assertEqual(a.does_collide(b), expected)
+
+    def test_spatial_hash(self):
+        """
+        Validates that SpatialHash finds the same overlapping bounding boxes
+        as testing every pair of boxes
+        """
+        asteroids = scene(200, 30)
+        boxes = [asteroid.bounding_box() for asteroid in asteroids]
+        grid = SpatialHash(cell_size=2.0)
+        for n, box in enumerate(boxes):
+            grid.insert(n, box)
+
+        expected = {
+            (i, j)
+            for i in range(len(boxes))
+            for j in range(i + 1, len(boxes))
+            if boxes_overlap(boxes[i], boxes[j])
+        }
+        self.assertSetEqual(grid.pairs(), expected)
+        self.assertTrue(expected)
+
+        query = (-3, -3, 3, 3)
+        self.assertSetEqual(
+            grid.query(query),
+            {n for n, box in enumerate(boxes) if boxes_overlap(box, query)},
+        )
+
+    def test_colliding_with(self):
+        """
+        Validates that colliding_with returns the same polygons as checking
+        every one of them, in their original order
+        """
+        asteroids = scene(100, 20)
+        for polygon in asteroids[:20]:
+            others = [other for other in asteroids if other is not polygon]
+            expected = [
+                other for other in others if per_pair_collide(polygon, other)
+            ]
+            self.assertListEqual(colliding_with(polygon, others), expected)
+
+    def test_hit_by_segment(self):
+        """
+        Validates that hit_by_segment returns the same polygons as checking
+        every segment of every polygon against the laser beam
+        """
+        asteroids = scene(100, 20)
+        laser = ((-10.0, -7.0), (10.0, 8.0))
+        expected = [
+            asteroid
+            for asteroid in asteroids
+            if any(
+                PolygonModel.do_segments_intersect(segment, laser)
+                for segment in asteroid.segments()
+            )
+        ]
+        self.assertTrue(expected)
+        self.assertListEqual(hit_by_segment(laser, asteroids), expected)
+        self.assertListEqual(hit_by_segment(laser, []), [])
+
+    def test_bounding_box(self):
+        """Validates the bounding box of a list of points"""
+        self.assertTupleEqual(
+            bounding_box([(1, 2), (-1, 5), (0, -3)]), (-1.0, -3.0, 1.0, 5.0)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
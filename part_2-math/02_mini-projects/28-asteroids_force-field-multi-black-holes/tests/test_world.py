@@ -0,0 +1,153 @@
+"""Unit tests for the vectorized World of the Asteroids game"""
+import random
+import unittest
+from math import cos, sqrt
+from unittest.mock import patch
+
+import numpy as np
+
+from asteroids.models import asteroid
+from asteroids.models.asteroid import Asteroid, BlackHole, PolygonModel
+from asteroids.models.world import World, gravitational_field
+
+
+def black_holes():
+    """Returns the two black holes of the game"""
+    sources = [BlackHole(0.1), BlackHole(0.1)]
+    sources[1].x, sources[1].y = 5, -5
+    return sources
+
+
+def asteroids(count):
+    """Returns count randomly placed asteroids"""
+    models = [Asteroid() for _ in range(count)]
+    for model in models:
+        model.x, model.y = random.uniform(-9, 9), random.uniform(-9, 9)
+    return models
+
+
+class WorldTest(unittest.TestCase):
+    """
+    World test class
+    """
+
+    def setUp(self):
+        random.seed(0)
+
+    def assertSameState(self, world, models):
+        """Compares the state of the world with the given models"""
+        self.assertTrue(
+            np.allclose(world.positions, [(m.x, m.y) for m in models])
+        )
+        self.assertTrue(
+            np.allclose(world.velocities, [(m.vx, m.vy) for m in models])
+        )
+        self.assertTrue(
+            np.allclose(
+                world.rotation_angles, [m.rotation_angle for m in models]
+            )
+        )
+
+    def test_gravitational_field(self):
+        """
+        Validates the vectorized field against asteroid.gravitational_field
+        """
+        sources = black_holes()
+        models = asteroids(20)
+        got = gravitational_field(
+            [(m.x, m.y) for m in models],
+            [(s.x, s.y) for s in sources],
+            [s.gravity for s in sources],
+        )
+        expected = [
+            asteroid.gravitational_field(sources, m.x, m.y) for m in models
+        ]
+        self.assertTrue(np.allclose(got, expected))
+
+    def test_euler_matches_move(self):
+        """
+        Validates that Euler steps match PolygonModel.move for every body, both
+        when the bodies bounce and when they wrap around the bounds
+        """
+        for bounce in (True, False):
+            with (
+                patch.object(PolygonModel, "BOUNCE", bounce),
+                patch.object(World, "BOUNCE", bounce),
+            ):
+                sources = black_holes()
+                models = asteroids(30)
+                world = World.from_models(models, sources)
+                for milliseconds in [16, 33, 50] * 100:
+                    world.step(milliseconds)
+                    for model in models:
+                        model.move(milliseconds, (0, 0), sources)
+                self.assertSameState(world, models)
+
+                # the bodies did reach the bounds
+                x, y = world.positions.T
+                self.assertTrue((abs(x) > 5).any() and (abs(y) > 5).any())
+
+    def test_verlet_oscillator(self):
+        """
+        Validates that Verlet steps follow the exact solution of a body pulled
+        by a single source, x(t) = cos(sqrt(g) t), more closely than Euler,
+        and keep its energy
+        """
+        gravity, milliseconds, steps = 0.5, 50, 400
+        exact = cos(sqrt(gravity) * milliseconds * steps / 1000)
+        errors = {}
+        for integrator in ("euler", "verlet"):
+            world = World(
+                [(1, 0)],
+                source_positions=[(0, 0)],
+                gravities=[gravity],
+                integrator=integrator,
+            )
+            energies = []
+            for _ in range(steps):
+                world.step(milliseconds)
+                (x, _), (vx, _) = world.positions[0], world.velocities[0]
+                energies.append(vx**2 + gravity * x**2)
+            errors[integrator] = abs(world.positions[0, 0] - exact)
+
+        self.assertLess(errors["verlet"], 1e-3)
+        self.assertLess(errors["verlet"], errors["euler"])
+        self.assertTrue(np.allclose(energies, gravity, rtol=1e-3))
+
+    def test_unknown_integrator(self):
+        """Validates that only the known integrators are accepted"""
+        with self.assertRaises(ValueError):
+            World([(0, 0)], integrator="rk4")
+
+    def test_update_sources_and_remove(self):
+        """
+        Validates that moved sources and removed bodies are taken into account
+        in the following steps, as they are by PolygonModel.move
+        """
+        sources = black_holes()
+        models = asteroids(10)
+        world = World.from_models(models, sources)
+        for _ in range(20):
+            world.update_sources(sources)
+            world.step(16)
+            for model in models:
+                model.move(16, (0, 0), sources)
+            for source in sources:
+                others = [other for other in sources if other is not source]
+                source.move(16, (0, 0), others)
+
+        world.remove([0, 4])
+        del models[4], models[0]
+        self.assertEqual(len(world), 8)
+        world.update_sources(sources)
+        world.step(16)
+        for model in models:
+            model.move(16, (0, 0), sources)
+        self.assertSameState(world, models)
+
+        world.sync_models(models)
+        self.assertSameState(world, models)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,18 +2,32 @@
 """
 
 from cannonballsim.physics import (
+    TrajectoryBatch,
+    TrajectoryMetrics,
     hang_time,
+    hang_times,
     landing_position,
+    landing_positions,
     max_height,
+    max_heights,
+    trajectories,
     trajectory,
+    trajectory_metrics,
 )
 from cannonballsim.plotting import plot_trajectories, plot_trajectory_metric
 
 __all__ = [
+    "TrajectoryBatch",
+    "TrajectoryMetrics",
     "hang_time",
+    "hang_times",
     "landing_position",
+    "landing_positions",
     "max_height",
+    "max_heights",
+    "trajectories",
     "trajectory",
+    "trajectory_metrics",
     "plot_trajectories",
     "plot_trajectory_metric",
 ]
@@ -6,6 +6,9 @@ range, and hang time.
 """
 
 from math import cos, pi, sin
+from typing import NamedTuple
+
+import numpy as np
 
 
 def trajectory(
@@ -83,3 +86,207 @@ def hang_time(traj: tuple) -> float:
         of the trajectory.
     """
     return traj[0][-1]
+
+
+class TrajectoryBatch(NamedTuple):
+    """
+    The trajectories of many cannonballs, integrated together by
+    `trajectories`.
+
+    Attributes:
+        ts (np.ndarray): the (S,) array with the time of each step, shared by
+            all the trajectories.
+        xs (np.ndarray): the (K, S) array with the x coordinate of each of the K
+            trajectories at each step, NaN once the trajectory has ended.
+        zs (np.ndarray): the (K, S) array with the z coordinate (height) of each
+            trajectory at each step, NaN once the trajectory has ended.
+        steps (np.ndarray): the (K,) array with the index of the last step of
+            each trajectory, i.e. the first one below the ground.
+    """
+
+    ts: np.ndarray
+    xs: np.ndarray
+    zs: np.ndarray
+    steps: np.ndarray
+
+
+def trajectories(
+    thetas_deg,
+    speed=20,
+    height=0,
+    dt: float = 0.01,
+    g: float = -9.81,
+) -> TrajectoryBatch:
+    """
+    Calculate the trajectories of many cannonballs at once, stepping all of them
+    together with the same Euler scheme used by `trajectory`. Each trajectory
+    stops being updated as soon as it goes below the ground.
+
+    Args:
+        thetas_deg (array-like): Launch angles in degrees.
+        speed (float | array-like): Launch speed in m/s, one for all the
+            trajectories or one per angle.
+        height (float | array-like): Launch height in meters, one for all the
+            trajectories or one per angle.
+        dt (float): Time step in seconds.
+        g (float): Acceleration due to gravity in m/s^2. Must be negative.
+
+    Returns:
+        TrajectoryBatch: the time, x, and z coordinates of all the
+            trajectories along with the index of their last step.
+    """
+    if g >= 0:
+        raise ValueError("g must be negative for the cannonballs to land")
+
+    thetas, speeds, heights = np.broadcast_arrays(
+        np.asarray(thetas_deg, dtype=np.float64),
+        np.asarray(speed, dtype=np.float64),
+        np.asarray(height, dtype=np.float64),
+    )
+    thetas, speeds, heights = (a.ravel() for a in (thetas, speeds, heights))
+    vx = speeds * np.cos(pi * thetas / 180)
+    vz = speeds * np.sin(pi * thetas / 180)
+    steps = np.zeros(len(thetas), dtype=np.int64)
+
+    # The discrete Euler scheme gives z_n = height + n * dt * vz
+    # + g * dt^2 * n * (n + 1) / 2, so the number of steps before landing is
+    # known in advance and the output arrays can be allocated once. Rows are
+    # steps, so each step writes a contiguous row.
+    a, b = g * dt * dt / 2, dt * vz + g * dt * dt / 2
+    landing = (-b - np.sqrt(np.maximum(b * b - 4 * a * heights, 0))) / (2 * a)
+    size = int(np.ceil(landing.max(initial=0))) + 2
+    xs = np.empty((size, len(thetas)))
+    zs = np.empty((size, len(thetas)))
+    xs[0], zs[0] = 0, heights
+
+    # All the trajectories are stepped unconditionally, and the steps taken
+    # after a trajectory has ended are masked out at the end
+    t, n = 0, 0
+    ts = [t]
+    active = zs[0] >= 0
+    while active.any():
+        if n + 1 == size:
+            # only reached if rounding makes the estimate fall short
+            xs = np.concatenate([xs, np.empty_like(xs)])
+            zs = np.concatenate([zs, np.empty_like(zs)])
+            size = len(xs)
+        t += dt
+        vz += g * dt
+        np.add(xs[n], vx * dt, out=xs[n + 1])
+        np.add(zs[n], vz * dt, out=zs[n + 1])
+        n += 1
+        steps += active
+        ts.append(t)
+        active &= zs[n] >= 0
+
+    # (K, S) views on the (S, K) arrays, no copy needed
+    xs, zs = xs[: n + 1].T, zs[: n + 1].T
+    ended = np.arange(n + 1) > steps[:, np.newaxis]
+    xs[ended] = np.nan
+    zs[ended] = np.nan
+    return TrajectoryBatch(np.array(ts), xs, zs, steps)
+
+
+class TrajectoryMetrics(NamedTuple):
+    """
+    The metrics of many cannonball trajectories, computed by
+    `trajectory_metrics` without integrating them.
+
+    Attributes:
+        landing_positions (np.ndarray): the landing position of each trajectory.
+        max_heights (np.ndarray): the maximum height of each trajectory.
+        hang_times (np.ndarray): the hang time of each trajectory.
+    """
+
+    landing_positions: np.ndarray
+    max_heights: np.ndarray
+    hang_times: np.ndarray
+
+
+def trajectory_metrics(
+    thetas_deg,
+    speed=20,
+    height=0,
+    dt: float = 0.01,
+    g: float = -9.81,
+) -> TrajectoryMetrics:
+    """
+    Calculate the landing position, maximum height and hang time of many
+    cannonball trajectories in closed form, without storing the trajectories.
+
+    The Euler scheme used by `trajectory` gives, after n steps,
+    x_n = n * dt * vx and z_n = height + n * dt * vz + g * dt^2 * n * (n + 1) / 2,
+    so the number of steps before landing is the first integer n for which
+    z_n < 0, and the maximum height is z_n at the integer n closest to the
+    vertex of the parabola. The results match those of `trajectory` up to
+    floating-point rounding.
+
+    Args:
+        thetas_deg (array-like): Launch angles in degrees.
+        speed (float | array-like): Launch speed in m/s, one for all the
+            trajectories or one per angle.
+        height (float | array-like): Launch height in meters, one for all the
+            trajectories or one per angle.
+        dt (float): Time step in seconds.
+        g (float): Acceleration due to gravity in m/s^2. Must be negative.
+
+    Returns:
+        TrajectoryMetrics: the landing position, maximum height and hang time
+            of each trajectory.
+    """
+    if g >= 0:
+        raise ValueError("g must be negative for the cannonballs to land")
+
+    thetas, speeds, heights = np.broadcast_arrays(
+        np.asarray(thetas_deg, dtype=np.float64),
+        np.asarray(speed, dtype=np.float64),
+        np.asarray(height, dtype=np.float64),
+    )
+    vx = speeds * np.cos(pi * thetas / 180)
+    vz = speeds * np.sin(pi * thetas / 180)
+
+    def z(n):
+        return heights + n * dt * vz + g * dt * dt * n * (n + 1) / 2
+
+    # z_n is a concave quadratic in n: find its positive root and then fix the
+    # rounding so that steps is the first n with z_n < 0
+    a, b = g * dt * dt / 2, dt * vz + g * dt * dt / 2
+    root = (-b - np.sqrt(np.maximum(b * b - 4 * a * heights, 0))) / (2 * a)
+    steps = np.maximum(np.floor(root), 0)
+    steps = np.where(z(steps) >= 0, steps + 1, steps)
+    steps = np.where((steps > 1) & (z(steps - 1) < 0), steps - 1, steps)
+    steps = np.where(heights < 0, 0, steps)
+
+    vertex = np.clip(np.floor(-b / (2 * a)), 0, steps)
+    peak = np.maximum(z(vertex), z(np.minimum(vertex + 1, steps)))
+    return TrajectoryMetrics(steps * dt * vx, peak, steps * dt)
+
+
+def landing_positions(batch: TrajectoryBatch) -> np.ndarray:
+    """
+    Calculate the landing positions of a batch of trajectories.
+
+    Args:
+        batch (TrajectoryBatch): the trajectories returned by `trajectories`.
+    """
+    return batch.xs[np.arange(len(batch.steps)), batch.steps]
+
+
+def max_heights(batch: TrajectoryBatch) -> np.ndarray:
+    """
+    Calculate the maximum heights of a batch of trajectories.
+
+    Args:
+        batch (TrajectoryBatch): the trajectories returned by `trajectories`.
+    """
+    return np.nanmax(batch.zs, axis=1)
+
+
+def hang_times(batch: TrajectoryBatch) -> np.ndarray:
+    """
+    Calculate the hang times of a batch of trajectories.
+
+    Args:
+        batch (TrajectoryBatch): the trajectories returned by `trajectories`.
+    """
+    return batch.ts[batch.steps]
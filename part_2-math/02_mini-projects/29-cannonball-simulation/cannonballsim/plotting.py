@@ -6,7 +6,24 @@ from typing import List
 
 import matplotlib.pyplot as plt
 
-from cannonballsim.physics import trajectory
+from cannonballsim.physics import (
+    hang_time,
+    hang_times,
+    landing_position,
+    landing_positions,
+    max_height,
+    max_heights,
+    trajectories,
+    trajectory,
+)
+
+# Batched counterparts of the trajectory metrics, used to compute a metric for
+# all the angles at once
+BATCH_METRICS = {
+    hang_time: hang_times,
+    landing_position: landing_positions,
+    max_height: max_heights,
+}
 
 
 def plot_trajectories(*trajectories: tuple, show_seconds=False):
@@ -80,11 +97,13 @@ def plot_trajectory_metric(
     ax.axhline(y=0, color="k")
     ax.axvline(x=0, color="k")
 
-    ax.scatter(
-        angles_deg,
-        [metric(trajectory(theta_deg, **kwargs)) for theta_deg in angles_deg],
-        label=plot_label,
-    )
+    if metric in BATCH_METRICS:
+        values = BATCH_METRICS[metric](trajectories(list(angles_deg), **kwargs))
+    else:
+        values = [
+            metric(trajectory(theta_deg, **kwargs)) for theta_deg in angles_deg
+        ]
+    ax.scatter(angles_deg, values, label=plot_label)
 
     ax.legend()
     plt.show()
@@ -5,6 +5,7 @@ from cannonballsim import (
     plot_trajectories,
     plot_trajectory_metric,
     trajectory,
+    trajectory_metrics,
 )
 
 if __name__ == "__main__":
@@ -34,6 +35,12 @@ if __name__ == "__main__":
     #     metric_label="Height (m)",
     # )
 
+    # # Find the launch angle with the longest range among 10,000 angles, with
+    # # the metrics of all the trajectories computed at once
+    # angles = [90 * n / 9999 for n in range(10000)]
+    # ranges = trajectory_metrics(angles).landing_positions
+    # print(f"Best angle: {angles[ranges.argmax()]:.2f}°")
+
     # Plot a metric of the trajectory as a function of the launch angle
     # passing initial values to the trajectory function
     plot_trajectory_metric(
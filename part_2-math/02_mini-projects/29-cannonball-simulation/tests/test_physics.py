@@ -0,0 +1,84 @@
+"""Unit tests for the batched cannonball simulation"""
+import unittest
+
+import numpy as np
+
+from cannonballsim.physics import (
+    hang_time,
+    hang_times,
+    landing_position,
+    landing_positions,
+    max_height,
+    max_heights,
+    trajectories,
+    trajectory,
+    trajectory_metrics,
+)
+
+THETAS = [0, 10, 30, 45, 60, 80, 90]
+
+
+class TrajectoriesTest(unittest.TestCase):
+    """
+    trajectories and trajectory_metrics test class
+    """
+
+    def test_trajectories_match_trajectory(self):
+        """
+        Validates that each of the batched trajectories matches the one given
+        by trajectory, step by step, for several speeds and heights
+        """
+        for speed, height in ((20, 0), (35, 0), (20, 12.5)):
+            batch = trajectories(THETAS, speed, height)
+            for k, theta in enumerate(THETAS):
+                ts, xs, zs, _ = trajectory(theta, speed, height)
+                steps = batch.steps[k]
+                self.assertEqual(steps, len(ts) - 1)
+                self.assertTrue(np.allclose(batch.ts[: steps + 1], ts))
+                self.assertTrue(np.allclose(batch.xs[k, : steps + 1], xs))
+                self.assertTrue(np.allclose(batch.zs[k, : steps + 1], zs))
+                self.assertTrue(np.isnan(batch.zs[k, steps + 1 :]).all())
+
+    def test_batch_metrics(self):
+        """
+        Validates landing_positions, max_heights and hang_times against the
+        metrics of each trajectory
+        """
+        batch = trajectories(THETAS, speed=[10, 20, 30, 40, 50, 60, 70])
+        singles = [
+            trajectory(theta, speed)
+            for theta, speed in zip(THETAS, [10, 20, 30, 40, 50, 60, 70])
+        ]
+        for got, metric in (
+            (landing_positions(batch), landing_position),
+            (max_heights(batch), max_height),
+            (hang_times(batch), hang_time),
+        ):
+            self.assertTrue(np.allclose(got, [metric(t) for t in singles]))
+
+    def test_trajectory_metrics(self):
+        """
+        Validates that the closed-form metrics match those of trajectory
+        """
+        thetas = np.linspace(0, 90, 91)
+        for speed, height, dt in ((20, 0, 0.01), (15, 30, 0.01), (40, 5, 0.1)):
+            metrics = trajectory_metrics(thetas, speed, height, dt)
+            singles = [
+                trajectory(theta, speed, height, dt) for theta in thetas
+            ]
+            for got, metric in (
+                (metrics.landing_positions, landing_position),
+                (metrics.max_heights, max_height),
+                (metrics.hang_times, hang_time),
+            ):
+                self.assertTrue(np.allclose(got, [metric(t) for t in singles]))
+
+    def test_invalid_gravity(self):
+        """Validates that a non-negative gravity is rejected"""
+        for fn in (trajectories, trajectory_metrics):
+            with self.assertRaises(ValueError):
+                fn([45], g=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,8 @@ from math import cos, pi, sin
 import matplotlib.pyplot as plt
 import numpy as np
 
+from terrain import landing_map
+
 
 def flat_ground(x, y):
     return 0
@@ -100,7 +102,25 @@ def plot_trajectories_3d(
     plt.show()
 
 
+def plot_landing_map(thetas_deg, phis_deg, elevation=flat_ground, **kwargs):
+    impacts = landing_map(thetas_deg, phis_deg, elevation=elevation, **kwargs)
+
+    _, ax = plt.subplots()
+    ax.set_aspect("equal")
+    ax.grid(True)
+    ax.set_xlabel("x")
+    ax.set_ylabel("y")
+    points = ax.scatter(impacts.xs, impacts.ys, c=impacts.ts, s=2)
+    plt.colorbar(points, label="hang time (s)")
+    plt.show()
+
+
 if __name__ == "__main__":
+    # # Plot where the cannonballs land for launches over the whole hemisphere
+    # plot_landing_map(
+    #     np.linspace(0, 90, 91), np.linspace(0, 360, 361), elevation=ridge
+    # )
+
     plot_trajectories_3d(
         trajectory3d(20, 240, elevation=ridge),
         bounds=[-40, 0, -40, 0],
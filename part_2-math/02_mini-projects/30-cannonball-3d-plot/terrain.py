@@ -0,0 +1,249 @@
+"""Vectorized cannonball trajectories over terrain
+
+Integrates many (theta, phi) launches at once with the same Euler scheme used
+by `trajectory3d`, evaluating the elevation of the ground for all the
+cannonballs still in flight in a single call. The exact impact point is found
+by root-finding along the last step, instead of stopping once the cannonball
+is already below the ground.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+
+class GridElevation:
+    """
+    Elevation function given by a grid of sampled heights, which is
+    interpolated bilinearly. Points outside the grid take the elevation of the
+    nearest point of its border.
+
+    Args:
+        xs (array-like): the (W,) increasing x coordinates of the grid.
+        ys (array-like): the (H,) increasing y coordinates of the grid.
+        zs (array-like): the (H, W) elevations, as returned by
+            `elevation(*np.meshgrid(xs, ys))`.
+    """
+
+    def __init__(self, xs, ys, zs) -> None:
+        self.xs = np.asarray(xs, dtype=np.float64)
+        self.ys = np.asarray(ys, dtype=np.float64)
+        self.zs = np.asarray(zs, dtype=np.float64)
+        if self.zs.shape != (len(self.ys), len(self.xs)):
+            raise ValueError(
+                f"expected a {(len(self.ys), len(self.xs))} grid of elevations, "
+                f"got {self.zs.shape}"
+            )
+        if len(self.xs) < 2 or len(self.ys) < 2:
+            raise ValueError("the grid must have at least 2 x 2 points")
+
+    @classmethod
+    def sample(cls, elevation, bounds, resolution=100):
+        """
+        Returns the GridElevation that samples the given elevation function
+        in a resolution x resolution grid spanning the bounds
+        (xmin, xmax, ymin, ymax).
+        """
+        xmin, xmax, ymin, ymax = bounds
+        xs = np.linspace(xmin, xmax, resolution)
+        ys = np.linspace(ymin, ymax, resolution)
+        return cls(xs, ys, vectorized(elevation)(*np.meshgrid(xs, ys)))
+
+    @staticmethod
+    def _cell(coords, values):
+        # index of the cell containing each value and the position in the cell
+        values = np.clip(values, coords[0], coords[-1])
+        i = np.clip(np.searchsorted(coords, values) - 1, 0, len(coords) - 2)
+        return i, (values - coords[i]) / (coords[i + 1] - coords[i])
+
+    def __call__(self, x, y):
+        i, u = self._cell(self.xs, np.asarray(x, dtype=np.float64))
+        j, v = self._cell(self.ys, np.asarray(y, dtype=np.float64))
+        # gather the corners of the cells from the flattened grid
+        z, k, w = self.zs.ravel(), j * len(self.xs) + i, len(self.xs)
+        bottom = z[k] + u * (z[k + 1] - z[k])
+        top = z[k + w] + u * (z[k + w + 1] - z[k + w])
+        return bottom + v * (top - bottom)
+
+
+def vectorized(elevation):
+    """
+    Returns a version of the elevation function that takes arrays of x and y
+    coordinates and returns an array of elevations of their broadcast shape.
+
+    The elevation functions of main.py are written for a single (x, y) point.
+    Those made of arithmetic operators, such as `ridge`, or constant ones,
+    such as `flat_ground`, give the same elevations when called once with
+    arrays, which is checked against point by point calls on a few probe
+    points. Any other function, e.g. one using `math`, an `if` or a reduction
+    over its arguments, is called point by point through np.vectorize.
+    """
+
+    def elevation_of(x, y):
+        shape = np.broadcast_shapes(np.shape(x), np.shape(y))
+        return np.broadcast_to(elevation(x, y), shape).astype(np.float64)
+
+    xs, ys = np.array([0.5, 1.0, 2.0]), np.array([0.25, 3.0, 1.5])
+    try:
+        expected = [elevation(x, y) for x, y in zip(xs.tolist(), ys.tolist())]
+        with np.errstate(all="ignore"):
+            if np.allclose(elevation_of(xs, ys), expected, equal_nan=True):
+                return elevation_of
+    except Exception:
+        # whatever the function can't do with arrays (the truth value of an
+        # array in an `if`, `math` functions, ...) np.vectorize takes care of
+        pass
+    return np.vectorize(elevation, otypes=[np.float64])
+
+
+class Impacts(NamedTuple):
+    """
+    Where and when a batch of cannonballs hit the ground. Every attribute is an
+    array with the broadcast shape of the launch parameters, which is NaN for
+    the cannonballs that didn't land within the simulated time.
+
+    Attributes:
+        ts (np.ndarray): the time of the impact.
+        xs (np.ndarray): the x coordinate of the impact.
+        ys (np.ndarray): the y coordinate of the impact.
+        zs (np.ndarray): the z coordinate (elevation) of the impact.
+    """
+
+    ts: np.ndarray
+    xs: np.ndarray
+    ys: np.ndarray
+    zs: np.ndarray
+
+
+def impacts3d(
+    thetas_deg,
+    phis_deg,
+    speed=20,
+    height=0,
+    dt=0.011,
+    g=-9.81,
+    elevation=None,
+    max_time=60,
+    tolerance=1e-9,
+):
+    """
+    Calculates the impact points of many cannonballs launched at once.
+
+    All the cannonballs still in flight are advanced together, and those that
+    go below the ground during a step are removed from the batch. Within that
+    last step the cannonball moves in a straight line, so the point where the
+    clearance z - elevation(x, y) crosses zero is found by bisection on that
+    segment.
+
+    Args:
+        thetas_deg (array-like): Elevation angles of the launches in degrees.
+        phis_deg (array-like): Azimuth angles of the launches in degrees.
+        speed (float | array-like): Launch speeds in m/s.
+        height (float | array-like): Launch heights in meters.
+        dt (float): Time step in seconds.
+        g (float): Acceleration due to gravity in m/s^2.
+        elevation (callable | GridElevation, Optional): the elevation of the
+            ground at (x, y), flat at 0 by default. It's called with arrays of
+            coordinates.
+        max_time (float): cannonballs that haven't landed after this time are
+            reported as NaN.
+        tolerance (float): the precision of the impact time, as a fraction of
+            the time step.
+
+    Returns:
+        Impacts: the time and position of each impact, with the broadcast
+            shape of thetas_deg, phis_deg, speed and height. A full landing map
+            is obtained with `impacts3d(thetas[:, None], phis[None, :])`.
+    """
+    thetas, phis, speeds, heights = np.broadcast_arrays(
+        *(
+            np.asarray(a, dtype=np.float64)
+            for a in (thetas_deg, phis_deg, speed, height)
+        )
+    )
+    shape = thetas.shape
+    thetas, phis, speeds, heights = (
+        a.ravel() for a in (thetas, phis, speeds, heights)
+    )
+    ground = vectorized(elevation) if elevation is not None else None
+
+    def clearance(x, y, z):
+        return z if ground is None else z - ground(x, y)
+
+    theta, phi = np.radians(thetas), np.radians(phis)
+    vx = speeds * np.cos(theta) * np.cos(phi)
+    vy = speeds * np.cos(theta) * np.sin(phi)
+    vz = speeds * np.sin(theta)
+    x, y, z = np.zeros_like(heights), np.zeros_like(heights), heights.copy()
+
+    # the step in which each cannonball lands and the segment it follows in
+    # that step, as (x, y, z) of its start and end
+    landing_steps = np.full(len(thetas), np.nan)
+    segments = np.zeros((6, len(thetas)))
+    segments[2], segments[5] = heights, heights
+
+    # as in trajectory3d, cannonballs that start below the ground land at t = 0
+    flying = clearance(x, y, z) >= 0
+    landing_steps[~flying] = 0
+    index = np.flatnonzero(flying)
+    vx, vy, vz, x, y, z = (a[flying] for a in (vx, vy, vz, x, y, z))
+
+    for n in range(int(np.ceil(max_time / dt))):
+        if not len(index):
+            break
+        vz = vz + g * dt
+        new_x, new_y, new_z = x + vx * dt, y + vy * dt, z + vz * dt
+        landed = clearance(new_x, new_y, new_z) < 0
+        if landed.any():
+            landing_steps[index[landed]] = n
+            segments[:, index[landed]] = [
+                a[landed] for a in (x, y, z, new_x, new_y, new_z)
+            ]
+            keep = ~landed
+            index = index[keep]
+            vx, vy, vz = vx[keep], vy[keep], vz[keep]
+            new_x, new_y, new_z = new_x[keep], new_y[keep], new_z[keep]
+        x, y, z = new_x, new_y, new_z
+
+    # the root-finding runs once, for all the cannonballs together
+    s = np.zeros(len(thetas))
+    landed = np.flatnonzero(flying & ~np.isnan(landing_steps))
+    s[landed] = _crossing(
+        clearance, segments[:3, landed], segments[3:, landed], tolerance
+    )
+    start, end = segments[:3], segments[3:]
+    impacts = np.vstack([(landing_steps + s) * dt, start + s * (end - start)])
+    impacts[:, np.isnan(landing_steps)] = np.nan
+    return Impacts(*(a.reshape(shape) for a in impacts))
+
+
+def _crossing(clearance, start, end, tolerance):
+    """
+    Bisection of the clearance along the segments from start (clearance >= 0)
+    to end (clearance < 0). Returns the fraction s of each segment where the
+    cannonball reaches the ground.
+    """
+    low = np.zeros(len(start[0]))
+    high = np.ones(len(start[0]))
+    for _ in range(int(np.ceil(np.log2(1 / tolerance)))):
+        mid = (low + high) / 2
+        above = (
+            clearance(*(a + mid * (b - a) for a, b in zip(start, end))) >= 0
+        )
+        low = np.where(above, mid, low)
+        high = np.where(above, high, mid)
+    return (low + high) / 2
+
+
+def landing_map(thetas_deg, phis_deg, **kwargs):
+    """
+    Calculates the impacts of the launches for every combination of the given
+    elevation and azimuth angles, e.g. over the whole hemisphere with
+    `landing_map(np.linspace(0, 90, 91), np.linspace(0, 360, 361))`.
+
+    Returns:
+        Impacts: (len(thetas_deg), len(phis_deg)) arrays with the impacts.
+    """
+    thetas = np.asarray(thetas_deg, dtype=np.float64)
+    phis = np.asarray(phis_deg, dtype=np.float64)
+    return impacts3d(thetas[:, np.newaxis], phis[np.newaxis, :], **kwargs)
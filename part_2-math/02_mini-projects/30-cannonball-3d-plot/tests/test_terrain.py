@@ -0,0 +1,142 @@
+"""Unit tests for the vectorized trajectories over terrain"""
+import unittest
+from math import sin
+
+import numpy as np
+
+from main import flat_ground, ridge, trajectory3d
+from terrain import GridElevation, impacts3d, landing_map, vectorized
+
+
+def plane(x, y):
+    return 2 * x - y + 1
+
+
+def hills(x, y):
+    return sin(x / 10) + sin(y / 10)
+
+
+def terrace(x, y):
+    return 1 if x > 10 else 0
+
+
+def highest(x, y):
+    # fine for a single point, but a reduction over arrays
+    return np.max([x, y]) / 100
+
+
+class VectorizedTest(unittest.TestCase):
+    """
+    vectorized test class
+    """
+
+    def test_matches_point_by_point(self):
+        """
+        Validates that the vectorized elevations match the elevation function
+        called for each point, whether or not it works on arrays
+        """
+        x, y = np.meshgrid(np.linspace(-20, 20, 9), np.linspace(-15, 15, 7))
+        for elevation in (flat_ground, ridge, plane, hills, terrace, highest):
+            got = vectorized(elevation)(x, y)
+            self.assertEqual(got.shape, x.shape, elevation.__name__)
+            self.assertEqual(got.dtype, np.float64, elevation.__name__)
+            expected = [
+                [elevation(*point) for point in zip(*row)]
+                for row in zip(x.tolist(), y.tolist())
+            ]
+            self.assertTrue(np.allclose(got, expected), elevation.__name__)
+
+    def test_array_functions_are_called_once(self):
+        """
+        Validates that functions working on arrays aren't called point by point
+        """
+        self.assertNotIsInstance(vectorized(ridge), np.vectorize)
+        self.assertNotIsInstance(vectorized(flat_ground), np.vectorize)
+        for elevation in (hills, terrace, highest):
+            self.assertIsInstance(vectorized(elevation), np.vectorize)
+
+    def test_broadcasts_coordinates(self):
+        """Validates that x and y are broadcast against each other"""
+        got = vectorized(flat_ground)(np.zeros(3), np.zeros((2, 1)))
+        self.assertEqual(got.shape, (2, 3))
+
+
+class GridElevationTest(unittest.TestCase):
+    """
+    GridElevation test class
+    """
+
+    def test_interpolates_planes_exactly(self):
+        """
+        Validates that a sampled plane is interpolated exactly, and clamped to
+        the border of the grid outside of it
+        """
+        grid = GridElevation.sample(plane, (-10, 10, -5, 5), resolution=11)
+        x = np.array([-10, -3.3, 0, 7.25, 10])
+        y = np.array([-5, 4.9, 0.1, -2, 5])
+        self.assertTrue(np.allclose(grid(x, y), plane(x, y)))
+        self.assertTrue(
+            np.allclose(
+                grid([-50, 50], [0, 60]), [plane(-10, 0), plane(10, 5)]
+            )
+        )
+
+    def test_sample_point_by_point_functions(self):
+        """Validates the grid of a function that doesn't work on arrays"""
+        grid = GridElevation.sample(hills, (0, 30, 0, 30), resolution=31)
+        self.assertAlmostEqual(float(grid(12, 7)), hills(12, 7))
+
+    def test_invalid_grids(self):
+        """Validates that mismatched and too small grids are rejected"""
+        with self.assertRaises(ValueError):
+            GridElevation([0, 1, 2], [0, 1], np.zeros((3, 2)))
+        with self.assertRaises(ValueError):
+            GridElevation([0], [0, 1], np.zeros((2, 1)))
+
+
+class Impacts3dTest(unittest.TestCase):
+    """
+    impacts3d and landing_map test class
+    """
+
+    def assertLandsWithin(self, impacts, k, theta, phi, elevation):
+        """
+        Checks that the impact is within the last step of trajectory3d, on the
+        ground
+        """
+        ts, xs, ys, zs = trajectory3d(theta, phi, elevation=elevation)
+        t, x, y, z = (float(a.flat[k]) for a in impacts)
+        self.assertTrue(ts[-2] <= t <= ts[-1] + 1e-9)
+        for got, values in ((x, xs), (y, ys), (z, zs)):
+            low, high = sorted(values[-2:])
+            self.assertTrue(low - 1e-9 <= got <= high + 1e-9)
+        self.assertAlmostEqual(z, float(vectorized(elevation)(x, y)), 6)
+
+    def test_matches_trajectory3d(self):
+        """
+        Validates the impacts of a landing map against the last steps of the
+        trajectories of trajectory3d, on flat and uneven terrain
+        """
+        thetas, phis = [10, 45, 80], [0, 60, 135, 270]
+        for elevation in (flat_ground, ridge, hills):
+            impacts = landing_map(thetas, phis, elevation=elevation)
+            self.assertEqual(impacts.ts.shape, (3, 4))
+            for k, (theta, phi) in enumerate(np.ndindex(3, 4)):
+                self.assertLandsWithin(
+                    impacts, k, thetas[theta], phis[phi], elevation
+                )
+
+    def test_not_landed(self):
+        """
+        Validates that the cannonballs still in flight after max_time are NaN
+        and those starting below the ground land at t = 0
+        """
+        impacts = impacts3d([45, 90], 0, max_time=1)
+        self.assertTrue(np.isnan(impacts.ts).all())
+        impacts = impacts3d(45, 0, height=-1)
+        self.assertEqual(float(impacts.ts), 0)
+        self.assertEqual(float(impacts.zs), -1)
+
+
+if __name__ == "__main__":
+    unittest.main()